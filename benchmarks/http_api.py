@@ -0,0 +1,200 @@
+"""Latency of the HTTP API, driven in-process through the real FastAPI app.
+
+Requests go through httpx's ASGI transport into `create_app`. The broker is
+swapped for an in-memory queue and the Redis cache tier is off, so the only
+external dependency is the database: a temporary SQLite file by default, or a
+scratch Postgres passed with --database-url (its tables are recreated).
+"""
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from collections.abc import AsyncIterable, Awaitable, Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+import httpx
+from dishka import Provider, Scope, provide
+from reporting import latency_summary, write_report
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from task_service.adapters.config import CacheConfig, Settings
+from task_service.adapters.db import (
+    SqlAlchemyCoreTaskRepository,
+    create_engine_from_url,
+    create_session_factory,
+    mapping_registry,
+)
+from task_service.domain import Task, TaskPriority
+from task_service.main import create_app
+from task_service.ports import TaskQueue
+from task_service.setup import close_container, create_container
+
+PAGE_SIZE = 20
+
+
+class CollectingQueue(TaskQueue):
+    def __init__(self) -> None:
+        self.task_ids: list[int] = []
+
+    async def enqueue(
+        self, task_id: int, priority: TaskPriority = TaskPriority.NORMAL
+    ) -> None:
+        self.task_ids.append(task_id)
+
+    async def enqueue_many(
+        self, task_ids: Sequence[int], priority: TaskPriority = TaskPriority.NORMAL
+    ) -> None:
+        self.task_ids.extend(task_ids)
+
+
+class BenchmarkProvider(Provider):
+    def __init__(self, engine: AsyncEngine, queue: TaskQueue) -> None:
+        super().__init__()
+        self._engine = engine
+        self._queue = queue
+
+    @provide(scope=Scope.APP)
+    async def get_engine(self) -> AsyncIterable[AsyncEngine]:
+        yield self._engine
+
+    @provide(scope=Scope.REQUEST)
+    def get_queue(self) -> TaskQueue:
+        return self._queue
+
+
+async def seed(engine: AsyncEngine, rows: int) -> list[int]:
+    async with engine.begin() as connection:
+        await connection.run_sync(mapping_registry.metadata.drop_all)
+        await connection.run_sync(mapping_registry.metadata.create_all)
+
+    session_factory = create_session_factory(engine)
+    task_ids: list[int] = []
+    for offset in range(0, rows, 1000):
+        async with session_factory() as session:
+            repository = SqlAlchemyCoreTaskRepository(session)
+            created = await repository.add_many(
+                [
+                    Task.create(f"seeded {index}")
+                    for index in range(offset, min(rows, offset + 1000))
+                ]
+            )
+            await repository.flush_counts()
+            await session.commit()
+        task_ids.extend(task.id for task in created if task.id is not None)
+    return task_ids
+
+
+async def run_scenario(
+    name: str,
+    send: Callable[[], Awaitable[httpx.Response]],
+    requests: int,
+    concurrency: int,
+    **labels: Any,
+) -> dict[str, Any]:
+    samples: list[float] = []
+    remaining = requests
+
+    async def client_loop() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            response = await send()
+            samples.append(time.perf_counter() - started)
+            response.raise_for_status()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        "scenario": name,
+        **labels,
+        "requests_per_second": requests / elapsed,
+        **latency_summary(samples),
+    }
+
+
+async def measure(
+    database_url: str, rows: int, requests: int, concurrency: int
+) -> list[dict[str, Any]]:
+    engine = create_engine_from_url(database_url, pool_size=concurrency + 1)
+    task_ids = await seed(engine, rows)
+    settings = Settings(cache=CacheConfig(use_redis=False))
+    container = create_container(settings, BenchmarkProvider(engine, CollectingQueue()))
+    app = create_app(container)
+    randomizer = random.Random(0)
+
+    results: list[dict[str, Any]] = []
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://benchmark"
+        ) as client:
+            scenarios: list[
+                tuple[str, Callable[[], Awaitable[httpx.Response]], dict[str, Any]]
+            ] = [
+                (
+                    "create",
+                    lambda: client.post("/tasks/", json={"title": "benchmark"}),
+                    {},
+                ),
+                (
+                    "get",
+                    lambda: client.get(f"/tasks/{randomizer.choice(task_ids)}/"),
+                    {},
+                ),
+            ]
+            for page in sorted({1, 10, 100, max(rows // PAGE_SIZE, 1)}):
+                scenarios.append(
+                    (
+                        "list",
+                        lambda page=page: client.get(
+                            "/tasks/", params={"page": page, "size": PAGE_SIZE}
+                        ),
+                        {"page": page, "offset": (page - 1) * PAGE_SIZE},
+                    )
+                )
+
+            for name, send, labels in scenarios:
+                await run_scenario(name, send, min(requests, 20), 1)
+                results.append(
+                    await run_scenario(name, send, requests, concurrency, **labels)
+                )
+    finally:
+        await close_container(container)
+        await engine.dispose()
+    return results
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database-url")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        database_url = args.database_url or f"sqlite+aiosqlite:///{scratch}/bench.db"
+        results = await measure(
+            database_url, args.rows, args.requests, args.concurrency
+        )
+    write_report(
+        "http_api",
+        database_url,
+        {
+            "rows": args.rows,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+        },
+        results,
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
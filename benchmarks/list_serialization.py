@@ -0,0 +1,110 @@
+"""Cost of turning a page of tasks into the JSON body of GET /tasks/.
+
+Compares the response-model path the handler used to take (validate every
+task into TaskResponse, wrap the page in TaskListResponse, then let FastAPI
+validate and serialize the response model again) with the TypeAdapter path
+that dumps the mapped Task rows to JSON in one pass. No database is involved;
+the rows are instrumented Task instances like the ones the repository returns.
+"""
+
+import argparse
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from pydantic import TypeAdapter
+from reporting import write_report
+
+import task_service.adapters.db  # noqa: F401
+from task_service.domain import Task, TaskStatus
+from task_service.presentation.api.schemas import (
+    TASK_LIST_INCLUDE,
+    TaskCursorPageResponse,
+    TaskListResponse,
+    TaskResponse,
+    task_list_adapter,
+)
+
+response_adapter = TypeAdapter(TaskListResponse | TaskCursorPageResponse)
+
+
+def make_page(size: int) -> list[Task]:
+    started = datetime(2026, 1, 1, tzinfo=UTC)
+    return [
+        Task(
+            id=index,
+            title=f"task {index}",
+            status=TaskStatus.DONE,
+            result="success",
+            created_at=started + timedelta(seconds=index),
+            updated_at=started + timedelta(seconds=index + 1),
+        )
+        for index in range(1, size + 1)
+    ]
+
+
+def response_model_body(items: list[Task]) -> bytes:
+    page = TaskListResponse(
+        items=[TaskResponse.model_validate(item) for item in items],
+        page=1,
+        size=len(items),
+        total=len(items),
+    )
+    validated = response_adapter.validate_python(page, from_attributes=True)
+    return response_adapter.dump_json(validated)
+
+
+def type_adapter_body(items: list[Task]) -> bytes:
+    return task_list_adapter.dump_json(
+        {
+            "items": items,
+            "page": 1,
+            "size": len(items),
+            "total": len(items),
+            "next_cursor": None,
+        },
+        include=TASK_LIST_INCLUDE,
+    )
+
+
+def per_page_seconds(serialize: Any, items: list[Task], iterations: int) -> float:
+    for _ in range(min(iterations, 100)):
+        serialize(items)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        serialize(items)
+    return (time.perf_counter() - started) / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="10,50,100", help="comma-separated")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    results: list[dict[str, Any]] = []
+    for size in (int(value) for value in args.sizes.split(",")):
+        items = make_page(size)
+        baseline = per_page_seconds(response_model_body, items, args.iterations)
+        fast = per_page_seconds(type_adapter_body, items, args.iterations)
+        results.append(
+            {
+                "page_size": size,
+                "response_model_us": baseline * 1_000_000,
+                "type_adapter_us": fast * 1_000_000,
+                "speedup": baseline / fast,
+            }
+        )
+    write_report(
+        "list_serialization",
+        None,
+        {"sizes": args.sizes, "iterations": args.iterations},
+        results,
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""Task throughput through the Redis (Taskiq) and Postgres queue backends.
+
+Tasks are created up front and only their processing is timed. Needs a
+migrated scratch database and a Redis configured through the usual APP__*
+environment variables.
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+os.environ.setdefault("APP__TASKS__QUEUE_NAME", "tasks_benchmark")
+
+from reporting import write_report
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from task_service.adapters.config import Settings, TasksConfig, get_settings
+from task_service.adapters.db import tasks_table
+from task_service.app import TaskCommandUseCase, TaskProcessingUseCase
+from task_service.domain import TaskStatus
+from task_service.presentation.postgres_queue_worker import PostgresQueueWorker
+from task_service.setup import close_container, create_container
+
+
+async def wait_until_processed(engine: AsyncEngine, task_ids: list[int]) -> None:
+    pending = (
+        select(func.count())
+        .select_from(tasks_table)
+        .where(
+            tasks_table.c.id.in_(task_ids),
+            tasks_table.c.status.in_([TaskStatus.NEW, TaskStatus.PROCESSING]),
+        )
+    )
+    while True:
+        async with engine.connect() as connection:
+            if not await connection.scalar(pending):
+                return
+        await asyncio.sleep(0.05)
+
+
+async def create_tasks(settings: Settings, tasks: int) -> list[int]:
+    container = create_container(settings)
+    task_ids: list[int] = []
+    try:
+        for offset in range(0, tasks, 1000):
+            async with container() as request_container:
+                commands = await request_container.get(TaskCommandUseCase)
+                created = await commands.create_tasks(
+                    [
+                        f"task {index}"
+                        for index in range(offset, min(tasks, offset + 1000))
+                    ]
+                )
+            task_ids.extend(task.id for task in created)
+    finally:
+        await close_container(container)
+    return task_ids
+
+
+async def measure_postgres(settings: Settings, tasks: int) -> float:
+    task_ids = await create_tasks(settings, tasks)
+
+    container = create_container(settings)
+    stop = asyncio.Event()
+    try:
+        engine = await container.get(AsyncEngine)
+        started = time.perf_counter()
+        worker = asyncio.create_task(PostgresQueueWorker(container, settings).run(stop))
+        await wait_until_processed(engine, task_ids)
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await worker
+        return elapsed
+    finally:
+        await close_container(container)
+
+
+async def measure_redis(settings: Settings, tasks: int) -> float:
+    from task_service.presentation.taskiq.broker import broker
+
+    container = create_container(settings)
+    semaphore = asyncio.Semaphore(settings.tasks.postgres_consumers)
+    running: set[asyncio.Task[None]] = set()
+
+    async def process(task_id: int) -> None:
+        async with semaphore, container() as request_container:
+            processor = await request_container.get(TaskProcessingUseCase)
+            await processor.process_task(task_id)
+
+    async def consume() -> None:
+        async for raw in broker.listen():
+            message = broker.formatter.loads(raw)
+            await semaphore.acquire()
+            semaphore.release()
+            job = asyncio.create_task(process(int(message.args[0])))
+            running.add(job)
+            job.add_done_callback(running.discard)
+
+    task_ids = await create_tasks(settings, tasks)
+    engine = await container.get(AsyncEngine)
+    started = time.perf_counter()
+    consumer = asyncio.create_task(consume())
+    try:
+        await wait_until_processed(engine, task_ids)
+        return time.perf_counter() - started
+    finally:
+        consumer.cancel()
+        await asyncio.gather(consumer, *running, return_exceptions=True)
+        await close_container(container)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    base = get_settings()
+    results: list[dict[str, Any]] = []
+    for backend in ("redis", "postgres"):
+        tasks_config = TasksConfig.model_validate(
+            base.tasks.model_dump()
+            | {
+                "queue_backend": backend,
+                "processing_delay_seconds": 0,
+                "postgres_consumers": args.concurrency,
+                "claim_batch_size": args.batch_size if backend == "postgres" else 1,
+            }
+        )
+        settings = base.model_copy(update={"tasks": tasks_config})
+        measure = measure_postgres if backend == "postgres" else measure_redis
+        elapsed = await measure(settings, args.tasks)
+        results.append(
+            {
+                "backend": backend,
+                "tasks": args.tasks,
+                "concurrency": args.concurrency,
+                "seconds": elapsed,
+                "tasks_per_second": args.tasks / elapsed,
+            }
+        )
+
+    write_report(
+        "queue_throughput",
+        base.database.dsn.get_secret_value(),
+        {
+            "tasks": args.tasks,
+            "concurrency": args.concurrency,
+            "batch_size": args.batch_size,
+        },
+        results,
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
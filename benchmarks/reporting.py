@@ -0,0 +1,70 @@
+"""JSON reports shared by the benchmark scripts."""
+
+import json
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import make_url
+
+
+def latency_summary(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    # Inclusive quantiles stay within the observed samples for small runs.
+    cuts = (
+        statistics.quantiles(ordered, n=100, method="inclusive")
+        if len(ordered) > 1
+        else ordered * 99
+    )
+    return {
+        "count": len(ordered),
+        "mean_ms": statistics.fmean(ordered) * 1000,
+        "p50_ms": cuts[49] * 1000,
+        "p95_ms": cuts[94] * 1000,
+        "p99_ms": cuts[98] * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+def git_commit() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip()
+
+
+def write_report(
+    benchmark: str,
+    database_url: str | None,
+    parameters: dict[str, Any],
+    results: list[dict[str, Any]],
+    output: Path | None,
+) -> None:
+    report = {
+        "benchmark": benchmark,
+        "commit": git_commit(),
+        "recorded_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "database": (
+            make_url(database_url).render_as_string(hide_password=True)
+            if database_url
+            else None
+        ),
+        "parameters": parameters,
+        "results": results,
+    }
+    rendered = json.dumps(report, indent=2)
+    if output is None:
+        sys.stdout.write(rendered + "\n")
+        return
+    output.write_text(rendered + "\n")
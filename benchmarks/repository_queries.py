@@ -0,0 +1,109 @@
+"""Queries and commits per processed task for the ORM and Core repositories."""
+
+import argparse
+import asyncio
+import time
+from pathlib import Path
+from typing import Any
+
+from reporting import write_report
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from task_service.adapters.db import (
+    SqlAlchemyCoreTaskRepository,
+    SqlAlchemyTaskRepository,
+    create_session_factory,
+    mapping_registry,
+)
+from task_service.app import (
+    TaskHandlerRegistry,
+    TaskProcessingUseCase,
+    simulated_task_handler,
+)
+from task_service.domain import DEFAULT_TASK_TYPE, Task
+
+REPOSITORIES: dict[str, type[SqlAlchemyTaskRepository]] = {
+    "orm": SqlAlchemyTaskRepository,
+    "core": SqlAlchemyCoreTaskRepository,
+}
+
+
+class StatementCounter:
+    def __init__(self, engine: AsyncEngine) -> None:
+        self.queries = 0
+        self.commits = 0
+        event.listen(engine.sync_engine, "before_cursor_execute", self._on_execute)
+        event.listen(engine.sync_engine, "commit", self._on_commit)
+
+    def reset(self) -> None:
+        self.queries = 0
+        self.commits = 0
+
+    def _on_execute(self, *_: Any) -> None:
+        self.queries += 1
+
+    def _on_commit(self, *_: Any) -> None:
+        self.commits += 1
+
+
+async def measure(database_url: str, name: str, tasks: int) -> dict[str, Any]:
+    engine = create_async_engine(database_url)
+    session_factory = create_session_factory(engine)
+    async with engine.begin() as connection:
+        await connection.run_sync(mapping_registry.metadata.drop_all)
+        await connection.run_sync(mapping_registry.metadata.create_all)
+
+    repository_class = REPOSITORIES[name]
+    async with session_factory() as session:
+        repository = repository_class(session)
+        created = await repository.add_many(
+            [Task.create(f"task {index}") for index in range(tasks)]
+        )
+        await repository.flush_counts()
+        await session.commit()
+
+    handlers = TaskHandlerRegistry()
+    handlers.register(DEFAULT_TASK_TYPE, simulated_task_handler(0))
+
+    counter = StatementCounter(engine)
+    started = time.perf_counter()
+    for task in created:
+        async with session_factory() as session:
+            processor = TaskProcessingUseCase(
+                tasks=repository_class(session), tx=session, handlers=handlers
+            )
+            await processor.process_task(task.id)
+    elapsed = time.perf_counter() - started
+    await engine.dispose()
+
+    return {
+        "repository": name,
+        "tasks": tasks,
+        "queries_per_task": counter.queries / tasks,
+        "commits_per_task": counter.commits / tasks,
+        "tasks_per_second": tasks / elapsed,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database-url", default="sqlite+aiosqlite://")
+    parser.add_argument("--tasks", type=int, default=500)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    results = [
+        await measure(args.database_url, name, args.tasks) for name in REPOSITORIES
+    ]
+    write_report(
+        "repository_queries",
+        args.database_url,
+        {"tasks": args.tasks},
+        results,
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
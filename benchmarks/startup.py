@@ -0,0 +1,126 @@
+"""Cold start of the web and worker processes.
+
+Each sample is a fresh interpreter: the import time of the web app and of the
+worker entrypoints, and the wall time from spawning `uvicorn --factory
+task_service.main:create_app` until GET /health answers. Startup does not
+touch the database or Redis, so nothing has to be running.
+"""
+
+import argparse
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+from reporting import write_report
+
+MODULES = (
+    "task_service.main",
+    "task_service.presentation.taskiq.worker_broker",
+    "task_service.presentation.postgres_queue_worker",
+)
+IMPORT_PROBE = """
+import sys, time
+started = time.perf_counter()
+import {module}
+print(time.perf_counter() - started, "taskiq" in sys.modules)
+"""
+
+
+def import_sample(module: str) -> tuple[float, bool]:
+    completed = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE.format(module=module)],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    seconds, taskiq_loaded = completed.stdout.split()
+    return float(seconds), taskiq_loaded == "True"
+
+
+def free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def first_request_sample(timeout: float) -> float:
+    port = free_port()
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "--factory",
+            "task_service.main:create_app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ]
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                response = httpx.get(f"http://127.0.0.1:{port}/health", timeout=1)
+            except httpx.TransportError:
+                time.sleep(0.01)
+                continue
+            response.raise_for_status()
+            return time.perf_counter() - started
+        raise TimeoutError(f"web process did not answer within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def summary(samples: list[float]) -> dict[str, float]:
+    return {
+        "median_ms": statistics.median(samples) * 1000,
+        "min_ms": min(samples) * 1000,
+        "max_ms": max(samples) * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    results: list[dict[str, Any]] = []
+    for module in MODULES:
+        samples = [import_sample(module) for _ in range(args.repeats)]
+        results.append(
+            {
+                "scenario": "import",
+                "module": module,
+                "imports_taskiq": any(loaded for _, loaded in samples),
+                **summary([seconds for seconds, _ in samples]),
+            }
+        )
+    results.append(
+        {
+            "scenario": "first_request",
+            **summary(
+                [first_request_sample(args.timeout) for _ in range(args.repeats)]
+            ),
+        }
+    )
+    write_report(
+        "startup",
+        None,
+        {"repeats": args.repeats},
+        results,
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""Tasks per second through TaskProcessingUseCase with a zero-delay handler.
+
+Runs the processing use case the way the worker does, without a broker:
+one task per transaction, claimed batches, and concurrent single-task
+consumers with and without group commit. Uses a temporary SQLite file by
+default, or a scratch Postgres passed with --database-url (its tables are
+recreated for every mode).
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+
+from reporting import write_report
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from task_service.adapters.db import (
+    SqlAlchemyCoreTaskRepository,
+    create_engine_from_url,
+    create_session_factory,
+    mapping_registry,
+)
+from task_service.app import (
+    TaskCompletionAggregator,
+    TaskHandlerRegistry,
+    TaskProcessingUseCase,
+    simulated_task_handler,
+)
+from task_service.domain import DEFAULT_TASK_TYPE, Task
+from task_service.ports import TaskRepository, TransactionManager
+
+Mode = Callable[
+    [
+        async_sessionmaker[AsyncSession],
+        TaskHandlerRegistry,
+        list[int],
+        argparse.Namespace,
+    ],
+    Awaitable[None],
+]
+
+
+async def seed(
+    engine: AsyncEngine, session_factory: async_sessionmaker[AsyncSession], tasks: int
+) -> list[int]:
+    async with engine.begin() as connection:
+        await connection.run_sync(mapping_registry.metadata.drop_all)
+        await connection.run_sync(mapping_registry.metadata.create_all)
+
+    task_ids: list[int] = []
+    for offset in range(0, tasks, 1000):
+        async with session_factory() as session:
+            repository = SqlAlchemyCoreTaskRepository(session)
+            created = await repository.add_many(
+                [
+                    Task.create(f"task {index}")
+                    for index in range(offset, min(tasks, offset + 1000))
+                ]
+            )
+            await repository.flush_counts()
+            await session.commit()
+        task_ids.extend(task.id for task in created if task.id is not None)
+    return task_ids
+
+
+async def run_single(
+    session_factory: async_sessionmaker[AsyncSession],
+    handlers: TaskHandlerRegistry,
+    task_ids: list[int],
+    _: argparse.Namespace,
+) -> None:
+    for task_id in task_ids:
+        async with session_factory() as session:
+            processor = TaskProcessingUseCase(
+                tasks=SqlAlchemyCoreTaskRepository(session),
+                tx=session,
+                handlers=handlers,
+            )
+            await processor.process_task(task_id)
+
+
+async def run_batch(
+    session_factory: async_sessionmaker[AsyncSession],
+    handlers: TaskHandlerRegistry,
+    task_ids: list[int],
+    args: argparse.Namespace,
+) -> None:
+    processed = 0
+    while processed < len(task_ids):
+        async with session_factory() as session:
+            processor = TaskProcessingUseCase(
+                tasks=SqlAlchemyCoreTaskRepository(session),
+                tx=session,
+                handlers=handlers,
+            )
+            processed += len(await processor.process_batch(args.batch_size))
+
+
+async def consume_concurrently(
+    session_factory: async_sessionmaker[AsyncSession],
+    handlers: TaskHandlerRegistry,
+    task_ids: list[int],
+    concurrency: int,
+    completer: TaskCompletionAggregator | None = None,
+) -> None:
+    pending = iter(task_ids)
+
+    async def consumer() -> None:
+        for task_id in pending:
+            async with session_factory() as session:
+                processor = TaskProcessingUseCase(
+                    tasks=SqlAlchemyCoreTaskRepository(session),
+                    tx=session,
+                    handlers=handlers,
+                    completer=completer,
+                )
+                await processor.process_task(task_id)
+
+    await asyncio.gather(*(consumer() for _ in range(concurrency)))
+
+
+async def run_concurrent(
+    session_factory: async_sessionmaker[AsyncSession],
+    handlers: TaskHandlerRegistry,
+    task_ids: list[int],
+    args: argparse.Namespace,
+) -> None:
+    await consume_concurrently(session_factory, handlers, task_ids, args.concurrency)
+
+
+async def run_group_commit(
+    session_factory: async_sessionmaker[AsyncSession],
+    handlers: TaskHandlerRegistry,
+    task_ids: list[int],
+    args: argparse.Namespace,
+) -> None:
+    @asynccontextmanager
+    async def unit_of_work() -> AsyncIterator[
+        tuple[TaskRepository, TransactionManager]
+    ]:
+        async with session_factory() as session:
+            yield SqlAlchemyCoreTaskRepository(session), session
+
+    aggregator = TaskCompletionAggregator(
+        unit_of_work, max_batch_size=args.batch_size, flush_window_seconds=0.005
+    )
+    try:
+        await consume_concurrently(
+            session_factory, handlers, task_ids, args.concurrency, aggregator
+        )
+    finally:
+        await aggregator.close()
+
+
+MODES: dict[str, Mode] = {
+    "single": run_single,
+    "batch": run_batch,
+    "concurrent": run_concurrent,
+    "group_commit": run_group_commit,
+}
+
+
+async def measure(
+    database_url: str, mode: str, args: argparse.Namespace
+) -> dict[str, Any]:
+    engine = create_engine_from_url(database_url, pool_size=args.concurrency + 2)
+    session_factory = create_session_factory(engine)
+    handlers = TaskHandlerRegistry()
+    handlers.register(DEFAULT_TASK_TYPE, simulated_task_handler(0))
+    try:
+        task_ids = await seed(engine, session_factory, args.tasks)
+        started = time.perf_counter()
+        await MODES[mode](session_factory, handlers, task_ids, args)
+        elapsed = time.perf_counter() - started
+    finally:
+        await engine.dispose()
+
+    return {
+        "mode": mode,
+        "tasks": args.tasks,
+        "elapsed_seconds": elapsed,
+        "tasks_per_second": args.tasks / elapsed,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database-url")
+    parser.add_argument("--tasks", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument(
+        "--modes", default=",".join(MODES), help="comma-separated subset of modes"
+    )
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        database_url = args.database_url or f"sqlite+aiosqlite:///{scratch}/bench.db"
+        results = [
+            await measure(database_url, mode, args) for mode in args.modes.split(",")
+        ]
+    write_report(
+        "worker_throughput",
+        database_url,
+        {
+            "tasks": args.tasks,
+            "batch_size": args.batch_size,
+            "concurrency": args.concurrency,
+        },
+        results,
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,4 @@
+#!/bin/sh
+set -eu
+
+python -m task_service.presentation.archiver
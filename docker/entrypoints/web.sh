@@ -1,4 +1,4 @@
 #!/bin/sh
 set -eu
 
-uvicorn task_service.main:app --host 0.0.0.0 --port 8000
+uvicorn --factory task_service.main:create_app --host 0.0.0.0 --port 8000
@@ -1,4 +1,8 @@
 #!/bin/sh
 set -eu
 
-taskiq worker task_service.presentation.taskiq.worker_broker:broker
+if [ "${APP__TASKS__QUEUE_BACKEND:-redis}" = "postgres" ]; then
+    exec python -m task_service.presentation.postgres_worker
+fi
+
+exec python -m task_service.presentation.taskiq.worker
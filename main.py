@@ -1,3 +1,3 @@
-from task_service.main import app
+from task_service.main import create_app
 
-__all__ = ["app"]
+__all__ = ["create_app"]
@@ -0,0 +1,42 @@
+"""tasks keyset index
+
+Revision ID: 3f7b1c2d9e41
+Revises: 9cd2a0b989b6
+Create Date: 2026-10-18 09:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f7b1c2d9e41'
+down_revision: Union[str, Sequence[str], None] = '9cd2a0b989b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_created_at_id',
+            'tasks',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_tasks_created_at_id',
+            table_name='tasks',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,52 @@
+"""task status counts
+
+Revision ID: a4c8e27f5b13
+Revises: 3f7b1c2d9e41
+Create Date: 2026-10-18 10:03:17.502611
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c8e27f5b13'
+down_revision: Union[str, Sequence[str], None] = '3f7b1c2d9e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STATUS_COUNT_SHARDS = 16
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('task_status_counts',
+    sa.Column('status', sa.Enum('new', 'processing', 'done', 'failed', name='task_status', native_enum=False), nullable=False),
+    sa.Column('shard', sa.SmallInteger(), autoincrement=False, nullable=False),
+    sa.Column('count', sa.BigInteger(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('status', 'shard')
+    )
+    # Block writers while the counters are backfilled so they start in sync.
+    op.execute('LOCK TABLE tasks IN SHARE MODE')
+    op.execute(
+        sa.text(
+            """
+            INSERT INTO task_status_counts (status, shard, count)
+            SELECT statuses.status,
+                   shards.shard,
+                   CASE WHEN shards.shard = 0 THEN (
+                       SELECT count(*) FROM tasks WHERE tasks.status = statuses.status
+                   ) ELSE 0 END
+            FROM (VALUES ('new'), ('processing'), ('done'), ('failed'))
+                AS statuses(status)
+            CROSS JOIN generate_series(0, :last_shard) AS shards(shard)
+            """
+        ).bindparams(last_shard=STATUS_COUNT_SHARDS - 1)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('task_status_counts')
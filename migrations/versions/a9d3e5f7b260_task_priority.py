@@ -0,0 +1,49 @@
+"""task priority
+
+Revision ID: a9d3e5f7b260
+Revises: f2c6d8e0a914
+Create Date: 2026-10-18 17:40:03.918274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d3e5f7b260'
+down_revision: Union[str, Sequence[str], None] = 'f2c6d8e0a914'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PRIORITY = sa.Enum('high', 'normal', 'low', name='task_priority', native_enum=False)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tasks', sa.Column('priority', PRIORITY, server_default='normal', nullable=False))
+    op.add_column('task_outbox', sa.Column('priority', PRIORITY, server_default='normal', nullable=False))
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_new_priority_id',
+            'tasks',
+            ['priority', 'id'],
+            unique=False,
+            postgresql_where=sa.text("status = 'new'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_tasks_new_priority_id',
+            table_name='tasks',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column('task_outbox', 'priority')
+    op.drop_column('tasks', 'priority')
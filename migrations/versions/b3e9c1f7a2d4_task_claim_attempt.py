@@ -0,0 +1,31 @@
+"""task claim attempt
+
+Revision ID: b3e9c1f7a2d4
+Revises: d7b1f3a5c842
+Create Date: 2026-10-19 10:24:31.512208
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e9c1f7a2d4'
+down_revision: Union[str, Sequence[str], None] = 'd7b1f3a5c842'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'tasks',
+        sa.Column('attempt', sa.Integer(), server_default='0', nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('tasks', 'attempt')
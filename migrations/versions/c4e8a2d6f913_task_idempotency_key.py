@@ -0,0 +1,45 @@
+"""task idempotency key
+
+Revision ID: c4e8a2d6f913
+Revises: a9d3e5f7b260
+Create Date: 2026-10-18 19:05:27.504113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8a2d6f913'
+down_revision: Union[str, Sequence[str], None] = 'a9d3e5f7b260'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tasks', sa.Column('idempotency_key', sa.String(length=255), nullable=True))
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ux_tasks_idempotency_key',
+            'tasks',
+            ['idempotency_key'],
+            unique=True,
+            postgresql_where=sa.text('idempotency_key IS NOT NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ux_tasks_idempotency_key',
+            table_name='tasks',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column('tasks', 'idempotency_key')
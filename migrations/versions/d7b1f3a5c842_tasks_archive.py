@@ -0,0 +1,62 @@
+"""tasks archive
+
+Revision ID: d7b1f3a5c842
+Revises: c4e8a2d6f913
+Create Date: 2026-10-18 20:12:46.380517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7b1f3a5c842'
+down_revision: Union[str, Sequence[str], None] = 'c4e8a2d6f913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'tasks_archive',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('title', sa.String(length=255), nullable=False),
+        sa.Column('status', sa.Enum('new', 'processing', 'done', 'failed', name='task_status', native_enum=False), nullable=False),
+        sa.Column('result', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('task_type', sa.String(length=64), nullable=False),
+        sa.Column('priority', sa.Enum('high', 'normal', 'low', name='task_priority', native_enum=False), nullable=False),
+        sa.Column('idempotency_key', sa.String(length=255), nullable=True),
+        sa.Column('archived_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_tasks_archive_created_at_id', 'tasks_archive', [sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+    op.create_index('ix_tasks_archive_status_created_at_id', 'tasks_archive', ['status', sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_finished_updated_at',
+            'tasks',
+            ['updated_at'],
+            unique=False,
+            postgresql_where=sa.text("status IN ('done', 'failed')"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_tasks_finished_updated_at',
+            table_name='tasks',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_index('ix_tasks_archive_status_created_at_id', table_name='tasks_archive')
+    op.drop_index('ix_tasks_archive_created_at_id', table_name='tasks_archive')
+    op.drop_table('tasks_archive')
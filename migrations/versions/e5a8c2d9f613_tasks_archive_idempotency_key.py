@@ -0,0 +1,43 @@
+"""tasks archive idempotency key
+
+Revision ID: e5a8c2d9f613
+Revises: b3e9c1f7a2d4
+Create Date: 2026-10-19 14:02:17.338410
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a8c2d9f613'
+down_revision: Union[str, Sequence[str], None] = 'b3e9c1f7a2d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_archive_idempotency_key',
+            'tasks_archive',
+            ['idempotency_key'],
+            unique=False,
+            postgresql_where=sa.text('idempotency_key IS NOT NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_tasks_archive_idempotency_key',
+            table_name='tasks_archive',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,75 @@
+"""tasks status created_at indexes
+
+Revision ID: e7f3b5a1c208
+Revises: d5e2a9c4b731
+Create Date: 2026-10-18 14:20:37.518062
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7f3b5a1c208'
+down_revision: Union[str, Sequence[str], None] = 'd5e2a9c4b731'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE_STATUSES = ('new', 'processing')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_status_created_at_id',
+            'tasks',
+            ['status', sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for status in ACTIVE_STATUSES:
+            op.create_index(
+                f'ix_tasks_{status}_created_at_id',
+                'tasks',
+                [sa.text('created_at DESC'), sa.text('id DESC')],
+                unique=False,
+                postgresql_where=sa.text(f"status = '{status}'"),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        op.drop_index(
+            'ix_tasks_status',
+            table_name='tasks',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_status',
+            'tasks',
+            ['status'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for status in ACTIVE_STATUSES:
+            op.drop_index(
+                f'ix_tasks_{status}_created_at_id',
+                table_name='tasks',
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+        op.drop_index(
+            'ix_tasks_status_created_at_id',
+            table_name='tasks',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
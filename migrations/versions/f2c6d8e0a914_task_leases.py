@@ -0,0 +1,48 @@
+"""task leases
+
+Revision ID: f2c6d8e0a914
+Revises: e7f3b5a1c208
+Create Date: 2026-10-18 16:05:12.204517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c6d8e0a914'
+down_revision: Union[str, Sequence[str], None] = 'e7f3b5a1c208'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'tasks',
+        sa.Column('lease_expires_at', sa.DateTime(timezone=True), nullable=True),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_processing_lease_expires_at',
+            'tasks',
+            ['lease_expires_at'],
+            unique=False,
+            postgresql_where=sa.text("status = 'processing'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_tasks_processing_lease_expires_at',
+            table_name='tasks',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column('tasks', 'lease_expires_at')
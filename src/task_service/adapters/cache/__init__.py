@@ -0,0 +1,13 @@
+from task_service.adapters.cache.local_cache import (
+    LruIdempotencyKeyCache,
+    LruTaskCache,
+)
+from task_service.adapters.cache.redis_cache import RedisTaskCache
+from task_service.adapters.cache.tiered_cache import TieredTaskCache
+
+__all__ = [
+    "LruIdempotencyKeyCache",
+    "LruTaskCache",
+    "RedisTaskCache",
+    "TieredTaskCache",
+]
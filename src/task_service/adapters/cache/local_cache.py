@@ -0,0 +1,62 @@
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+
+from task_service.domain import Task
+from task_service.ports import IdempotencyKeyCache, TaskCache
+
+
+class LruTaskCache(TaskCache):
+    def __init__(self, *, max_size: int, active_ttl_seconds: float) -> None:
+        self._max_size = max_size
+        self._active_ttl_seconds = active_ttl_seconds
+        self._entries: OrderedDict[int, tuple[Task, float | None]] = OrderedDict()
+
+    async def get(self, task_id: int) -> Task | None:
+        entry = self._entries.get(task_id)
+        if entry is None:
+            return None
+
+        task, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[task_id]
+            return None
+
+        self._entries.move_to_end(task_id)
+        return task
+
+    async def put_many(self, tasks: Sequence[Task]) -> None:
+        expires_at = time.monotonic() + self._active_ttl_seconds
+        for task in tasks:
+            if task.id is None:
+                continue
+            if task.status.is_terminal:
+                self._entries[task.id] = (task, None)
+            else:
+                cached = self._entries.get(task.id)
+                # A terminal entry is final; never replace it with an older read.
+                if cached is not None and cached[0].status.is_terminal:
+                    continue
+                self._entries[task.id] = (task, expires_at)
+            self._entries.move_to_end(task.id)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+
+class LruIdempotencyKeyCache(IdempotencyKeyCache):
+    def __init__(self, *, max_size: int) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[str, Task] = OrderedDict()
+
+    async def get(self, key: str) -> Task | None:
+        task = self._entries.get(key)
+        if task is not None:
+            self._entries.move_to_end(key)
+        return task
+
+    async def put(self, key: str, task: Task) -> None:
+        self._entries[key] = task
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
@@ -0,0 +1,51 @@
+import logging
+from collections.abc import Sequence
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from task_service.adapters.serialization import dump_task, load_task
+from task_service.domain import Task
+from task_service.ports import TaskCache
+
+logger = logging.getLogger(__name__)
+
+
+class RedisTaskCache(TaskCache):
+    def __init__(
+        self, redis: Redis, *, key_prefix: str, active_ttl_seconds: float
+    ) -> None:
+        self._redis = redis
+        self._key_prefix = key_prefix
+        self._active_ttl_ms = max(1, int(active_ttl_seconds * 1000))
+
+    async def get(self, task_id: int) -> Task | None:
+        try:
+            payload = await self._redis.get(self._key(task_id))
+        except RedisError:
+            logger.warning("task cache read failed", exc_info=True)
+            return None
+        return load_task(payload) if payload is not None else None
+
+    async def put_many(self, tasks: Sequence[Task]) -> None:
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for task in tasks:
+                    if task.id is None:
+                        continue
+                    if task.status.is_terminal:
+                        pipe.set(self._key(task.id), dump_task(task))
+                    else:
+                        # NX keeps a concurrent terminal write from being undone.
+                        pipe.set(
+                            self._key(task.id),
+                            dump_task(task),
+                            px=self._active_ttl_ms,
+                            nx=True,
+                        )
+                await pipe.execute()
+        except RedisError:
+            logger.warning("task cache write failed", exc_info=True)
+
+    def _key(self, task_id: int) -> str:
+        return f"{self._key_prefix}:{task_id}"
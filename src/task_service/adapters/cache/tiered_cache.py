@@ -0,0 +1,32 @@
+from collections.abc import Sequence
+
+from task_service.adapters.metrics import TASK_CACHE_HITS, TASK_CACHE_MISSES
+from task_service.domain import Task
+from task_service.ports import TaskCache
+
+
+class TieredTaskCache(TaskCache):
+    def __init__(self, local: TaskCache, remote: TaskCache | None = None) -> None:
+        self._local = local
+        self._remote = remote
+
+    async def get(self, task_id: int) -> Task | None:
+        task = await self._local.get(task_id)
+        if task is not None:
+            TASK_CACHE_HITS.labels(tier="local").inc()
+            return task
+
+        if self._remote is not None:
+            task = await self._remote.get(task_id)
+            if task is not None:
+                TASK_CACHE_HITS.labels(tier="remote").inc()
+                await self._local.put_many([task])
+                return task
+
+        TASK_CACHE_MISSES.inc()
+        return None
+
+    async def put_many(self, tasks: Sequence[Task]) -> None:
+        await self._local.put_many(tasks)
+        if self._remote is not None:
+            await self._remote.put_many(tasks)
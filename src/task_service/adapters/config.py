@@ -2,15 +2,79 @@ import logging
 from functools import lru_cache
 from typing import Literal
 
-from pydantic import BaseModel, SecretStr
+from pydantic import BaseModel, Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from task_service.domain import TaskPriority
+
 LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+DispatchMode = Literal["direct", "outbox"]
+QueueBackend = Literal["redis", "postgres"]
+RepositoryImpl = Literal["orm", "core"]
+EventsBackend = Literal["redis", "postgres"]
+
+
+class PriorityWeights(BaseModel):
+    high: int = Field(default=6, ge=1)
+    normal: int = Field(default=3, ge=1)
+    low: int = Field(default=1, ge=1)
+
+    def as_dict(self) -> dict[TaskPriority, int]:
+        return {priority: getattr(self, priority.value) for priority in TaskPriority}
 
 
 class TasksConfig(BaseModel):
     queue_name: str = "tasks_queue"
     processing_delay_seconds: int = 3
+    claim_batch_size: int = Field(default=1, ge=1)
+    group_commit: bool = False
+    completion_batch_size: int = Field(default=100, ge=1)
+    completion_flush_window_seconds: float = Field(default=0.005, gt=0)
+    dispatch_mode: DispatchMode = "direct"
+    enqueue_coalescing: bool = False
+    enqueue_batch_size: int = Field(default=100, ge=1)
+    enqueue_flush_window_seconds: float = Field(default=0.002, gt=0)
+    outbox_batch_size: int = 500
+    outbox_poll_interval_seconds: float = 0.5
+    queue_backend: QueueBackend = "redis"
+    notify_channel: str = "tasks_new"
+    postgres_consumers: int = Field(default=1, ge=1)
+    postgres_poll_interval_seconds: float = Field(default=5.0, gt=0)
+    max_concurrent_tasks: int = Field(default=10, ge=1)
+    prefetch_count: int = Field(default=0, ge=0)
+    worker_metrics_port: int | None = None
+    handler_thread_pool_size: int = Field(default=4, ge=1)
+    handler_process_pool_size: int = Field(default=2, ge=1)
+    lease_seconds: float = Field(default=60.0, gt=0)
+    heartbeat_interval_seconds: float = Field(default=20.0, gt=0)
+    reaper_enabled: bool = True
+    reaper_interval_seconds: float = Field(default=15.0, gt=0)
+    reaper_batch_size: int = Field(default=500, ge=1)
+    priority_weights: PriorityWeights = PriorityWeights()
+    archive_retention_hours: float = Field(default=168.0, gt=0)
+    archive_batch_size: int = Field(default=1000, ge=1)
+    archive_interval_seconds: float = Field(default=60.0, gt=0)
+
+    def queue_name_for(self, priority: TaskPriority) -> str:
+        # Normal keeps the original list so messages already queued still drain.
+        if priority == TaskPriority.NORMAL:
+            return self.queue_name
+        return f"{self.queue_name}.{priority.value}"
+
+
+class CacheConfig(BaseModel):
+    enabled: bool = True
+    local_max_size: int = Field(default=10_000, ge=1)
+    idempotency_keys_max_size: int = Field(default=10_000, ge=1)
+    active_ttl_seconds: float = Field(default=1.0, gt=0)
+    use_redis: bool = True
+    key_prefix: str = "task_cache"
+
+
+class EventsConfig(BaseModel):
+    backend: EventsBackend = "redis"
+    channel: str = "task_events"
+    heartbeat_seconds: float = Field(default=15.0, gt=0)
 
 
 class DatabaseConfig(BaseModel):
@@ -20,6 +84,15 @@ class DatabaseConfig(BaseModel):
     password: SecretStr = SecretStr("task_password")
     database: str = "tasks_db"
     driver: str = "postgresql+asyncpg"
+    repository: RepositoryImpl = "core"
+    pool_size: int = Field(default=5, ge=1)
+    max_overflow: int = Field(default=10, ge=0)
+    pool_timeout_seconds: float = Field(default=30.0, gt=0)
+    pool_recycle_seconds: int | None = Field(default=None, gt=0)
+    pool_pre_ping: bool = False
+    statement_cache_size: int = Field(default=100, ge=0)
+    replica_host: str | None = None
+    replica_port: int | None = None
 
     @property
     def dsn(self) -> SecretStr:
@@ -28,6 +101,15 @@ class DatabaseConfig(BaseModel):
             f"@{self.host}:{self.port}/{self.database}"
         )
 
+    @property
+    def replica_dsn(self) -> SecretStr | None:
+        if self.replica_host is None:
+            return None
+        return SecretStr(
+            f"{self.driver}://{self.user}:{self.password.get_secret_value()}"
+            f"@{self.replica_host}:{self.replica_port or self.port}/{self.database}"
+        )
+
     @property
     def pure_dsn(self) -> SecretStr:
         return SecretStr(
@@ -54,6 +136,8 @@ class Settings(BaseSettings):
     database: DatabaseConfig = DatabaseConfig()
     redis: RedisConfig = RedisConfig()
     tasks: TasksConfig = TasksConfig()
+    cache: CacheConfig = CacheConfig()
+    events: EventsConfig = EventsConfig()
 
     log_level: LogLevel = "INFO"
     dev: bool = False
@@ -1,5 +1,9 @@
-from task_service.adapters.db.repositories import SqlAlchemyTaskRepository
+from task_service.adapters.db.outbox import SqlAlchemyTaskOutbox
 from task_service.adapters.db.registry import mapping_registry
+from task_service.adapters.db.repositories import (
+    SqlAlchemyCoreTaskRepository,
+    SqlAlchemyTaskRepository,
+)
 from task_service.adapters.db.session import (
     create_engine_from_url,
     create_session_factory,
@@ -7,6 +11,8 @@ from task_service.adapters.db.session import (
 from task_service.adapters.db.tables import tasks_table
 
 __all__ = [
+    "SqlAlchemyCoreTaskRepository",
+    "SqlAlchemyTaskOutbox",
     "SqlAlchemyTaskRepository",
     "create_engine_from_url",
     "create_session_factory",
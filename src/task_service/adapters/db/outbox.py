@@ -0,0 +1,50 @@
+from collections.abc import Sequence
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from task_service.adapters.db.tables import task_outbox_table
+from task_service.domain import TaskPriority
+from task_service.ports import TaskOutbox, TaskQueue
+
+
+class SqlAlchemyTaskOutbox(TaskQueue, TaskOutbox):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def enqueue(
+        self, task_id: int, priority: TaskPriority = TaskPriority.NORMAL
+    ) -> None:
+        await self.enqueue_many([task_id], priority)
+
+    async def enqueue_many(
+        self, task_ids: Sequence[int], priority: TaskPriority = TaskPriority.NORMAL
+    ) -> None:
+        if not task_ids:
+            return
+        await self._session.execute(
+            insert(task_outbox_table),
+            [{"task_id": task_id, "priority": priority} for task_id in task_ids],
+        )
+
+    async def take(self, limit: int) -> dict[TaskPriority, list[int]]:
+        batch = (
+            select(task_outbox_table.c.id)
+            .order_by(task_outbox_table.c.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        statement = (
+            delete(task_outbox_table)
+            .where(task_outbox_table.c.id.in_(batch))
+            .returning(
+                task_outbox_table.c.id,
+                task_outbox_table.c.task_id,
+                task_outbox_table.c.priority,
+            )
+        )
+        taken: dict[TaskPriority, list[int]] = {}
+        for row in sorted(await self._session.execute(statement)):
+            taken.setdefault(row.priority, []).append(row.task_id)
+        return taken
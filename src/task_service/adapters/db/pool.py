@@ -0,0 +1,78 @@
+from time import perf_counter
+from typing import Any
+
+from prometheus_client import Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import ExecutionContext
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from task_service.adapters.metrics import (
+    DB_POOL_CAPACITY,
+    DB_POOL_CHECKOUT_SECONDS,
+    DB_POOL_CHECKOUT_TIMEOUTS,
+    DB_POOL_IN_USE,
+    DB_QUERY_SECONDS,
+)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    def connect(self) -> PoolProxiedConnection:
+        name = self.logging_name or "primary"
+        started = perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            DB_POOL_CHECKOUT_TIMEOUTS.labels(name).inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.labels(name).observe(perf_counter() - started)
+
+
+def track_pool_usage(engine: AsyncEngine, name: str, capacity: int) -> None:
+    DB_POOL_CAPACITY.labels(name).set(capacity)
+    in_use = DB_POOL_IN_USE.labels(name)
+
+    @event.listens_for(engine.sync_engine, "checkout")
+    def _on_checkout(*_: Any) -> None:
+        in_use.inc()
+
+    @event.listens_for(engine.sync_engine, "checkin")
+    def _on_checkin(*_: Any) -> None:
+        in_use.dec()
+
+
+def track_query_timing(engine: AsyncEngine, name: str) -> None:
+    histograms: dict[str, Histogram] = {}
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _on_before_execute(
+        _conn: Any,
+        _cursor: Any,
+        _statement: str,
+        _parameters: Any,
+        context: ExecutionContext | None,
+        _executemany: bool,
+    ) -> None:
+        if context is not None:
+            context._query_started = perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _on_after_execute(
+        _conn: Any,
+        _cursor: Any,
+        statement: str,
+        _parameters: Any,
+        context: ExecutionContext | None,
+        _executemany: bool,
+    ) -> None:
+        started = getattr(context, "_query_started", None)
+        if started is None:
+            return
+        elapsed = perf_counter() - started
+        operation = statement.lstrip().split(None, 1)[0].upper()
+        histogram = histograms.get(operation)
+        if histogram is None:
+            histogram = histograms[operation] = DB_QUERY_SECONDS.labels(name, operation)
+        histogram.observe(elapsed)
@@ -1,52 +1,523 @@
-from datetime import UTC, datetime
+import random
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any
 
-from sqlalchemy import Select, func, select, update
+from sqlalchemy import (
+    ColumnElement,
+    FromClause,
+    Insert,
+    Integer,
+    Row,
+    Select,
+    Text,
+    Update,
+    any_,
+    bindparam,
+    case,
+    column,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+    text,
+    tuple_,
+    union_all,
+    update,
+    values,
+)
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from task_service.adapters.db.tables import tasks_table
-from task_service.domain import Task, TaskStatus
-from task_service.ports import TaskRepository
+from task_service.adapters.db.tables import (
+    ARCHIVED_COLUMNS,
+    STATUS_COUNT_SHARDS,
+    task_status_counts_table,
+    tasks_archive_table,
+    tasks_table,
+)
+from task_service.adapters.db.tables.tasks import task_status_enum
+from task_service.domain import Task, TaskPriority, TaskStatus
+from task_service.ports import (
+    TaskClaim,
+    TaskCompletion,
+    TaskCursor,
+    TaskRepository,
+    TaskTimeFilter,
+)
+
+
+def _task_filters(
+    status: TaskStatus | None,
+    period: TaskTimeFilter | None = None,
+    source: FromClause = tasks_table,
+) -> list[ColumnElement[bool]]:
+    filters: list[ColumnElement[bool]] = []
+    if status is not None:
+        filters.append(source.c.status == status)
+    if period is not None:
+        if period.created_after is not None:
+            filters.append(source.c.created_at > period.created_after)
+        if period.created_before is not None:
+            filters.append(source.c.created_at < period.created_before)
+        if period.updated_after is not None:
+            filters.append(source.c.updated_at > period.updated_after)
+    return filters
+
+
+def _task_source(include_archive: bool) -> FromClause:
+    if not include_archive:
+        return tasks_table
+    # Filters and ORDER BY ... LIMIT are pushed into both branches, so
+    # Postgres merges two index scans instead of reading the archive whole.
+    return union_all(
+        select(*(tasks_table.c[name] for name in ARCHIVED_COLUMNS)),
+        select(*(tasks_archive_table.c[name] for name in ARCHIVED_COLUMNS)),
+    ).subquery("all_tasks")
+
+
+def _task_from_row(row: Row[Any]) -> Task:
+    return Task(**row._mapping)
+
+
+def _claim_values(lease: timedelta | None) -> dict[str, Any]:
+    now = datetime.now(UTC)
+    return {
+        "status": TaskStatus.PROCESSING,
+        "updated_at": now,
+        "lease_expires_at": now + lease if lease is not None else None,
+        "attempt": tasks_table.c.attempt + 1,
+    }
 
 
 class SqlAlchemyTaskRepository(TaskRepository):
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
+        self._pending_counts: dict[TaskStatus, int] = {}
 
     async def add(self, task: Task) -> Task:
         self._session.add(task)
+        self._stage_counts([task])
         return task
 
+    async def add_many(self, tasks: Sequence[Task]) -> list[Task]:
+        if not tasks:
+            return []
+
+        statement = insert(Task).returning(Task, sort_by_parameter_order=True)
+        rows = [
+            {
+                "title": task.title,
+                "status": task.status,
+                "result": task.result,
+                "created_at": task.created_at,
+                "updated_at": task.updated_at,
+                "task_type": task.task_type,
+                "priority": task.priority,
+            }
+            for task in tasks
+        ]
+        created = list((await self._session.scalars(statement, rows)).all())
+        self._stage_counts(created)
+        return created
+
+    async def add_idempotent(self, task: Task) -> Task | None:
+        dialect = postgresql if self._is_postgresql() else sqlite
+        fields = {
+            "title": task.title,
+            "status": task.status,
+            "result": task.result,
+            "created_at": task.created_at,
+            "updated_at": task.updated_at,
+            "task_type": task.task_type,
+            "priority": task.priority,
+            "idempotency_key": task.idempotency_key,
+        }
+        # Keys of archived tasks stay taken: the archive probe rides along in
+        # the insert, so a first attempt is still a single statement.
+        fresh = select(
+            *(
+                literal(value, tasks_table.c[name].type)
+                for name, value in fields.items()
+            )
+        ).where(
+            ~exists().where(
+                tasks_archive_table.c.idempotency_key == task.idempotency_key
+            )
+        )
+        statement = (
+            dialect.insert(tasks_table)
+            .from_select(list(fields), fresh)
+            # A concurrent request with the same key waits for that insert to
+            # commit and then gets no row back instead of a unique violation.
+            .on_conflict_do_nothing(
+                index_elements=[tasks_table.c.idempotency_key],
+                index_where=tasks_table.c.idempotency_key.is_not(None),
+            )
+            .returning(*tasks_table.c)
+        )
+        created = [
+            _task_from_row(row) for row in await self._session.execute(statement)
+        ]
+        self._stage_counts(created)
+        return created[0] if created else None
+
+    async def get_by_idempotency_key(self, key: str) -> Task | None:
+        statement: Select[tuple[Task]] = select(Task).where(
+            tasks_table.c.idempotency_key == key
+        )
+        task = await self._session.scalar(statement)
+        return task if task is not None else await self._get_archived_by_key(key)
+
+    async def claim_batch(
+        self,
+        limit: int,
+        *,
+        lease: timedelta | None = None,
+        priority: TaskPriority | None = None,
+    ) -> list[Task]:
+        filters = [tasks_table.c.status == TaskStatus.NEW]
+        if priority is not None:
+            # Served by ix_tasks_new_priority_id.
+            filters.append(tasks_table.c.priority == priority)
+        ready = (
+            select(tasks_table.c.id)
+            .where(*filters)
+            .order_by(tasks_table.c.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        statement = (
+            update(tasks_table)
+            .where(tasks_table.c.id.in_(ready))
+            .values(**_claim_values(lease))
+            .returning(*tasks_table.c)
+        )
+        claimed = await self._write(
+            statement, {TaskStatus.NEW: -1, TaskStatus.PROCESSING: 1}
+        )
+        return sorted(claimed, key=lambda task: task.id or 0)
+
+    async def extend_leases(
+        self, claims: Sequence[TaskClaim], lease: timedelta
+    ) -> list[int]:
+        if not claims:
+            return []
+
+        statement = (
+            update(tasks_table)
+            .where(
+                tuple_(tasks_table.c.id, tasks_table.c.attempt).in_(
+                    [(claim.task_id, claim.attempt) for claim in claims]
+                ),
+                tasks_table.c.status == TaskStatus.PROCESSING,
+            )
+            .values(lease_expires_at=datetime.now(UTC) + lease)
+            .returning(tasks_table.c.id)
+        )
+        return sorted((await self._session.scalars(statement)).all())
+
+    async def reclaim_expired(self, limit: int) -> list[Task]:
+        now = datetime.now(UTC)
+        # Walks ix_tasks_processing_lease_expires_at from the oldest expiry.
+        expired = (
+            select(tasks_table.c.id)
+            .where(
+                tasks_table.c.status == TaskStatus.PROCESSING,
+                tasks_table.c.lease_expires_at < now,
+            )
+            .order_by(tasks_table.c.lease_expires_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        statement = (
+            update(tasks_table)
+            .where(
+                tasks_table.c.id.in_(expired),
+                tasks_table.c.status == TaskStatus.PROCESSING,
+            )
+            .values(status=TaskStatus.NEW, updated_at=now, lease_expires_at=None)
+            .returning(*tasks_table.c)
+        )
+        reclaimed = await self._write(
+            statement, {TaskStatus.PROCESSING: -1, TaskStatus.NEW: 1}
+        )
+        return sorted(reclaimed, key=lambda task: task.id or 0)
+
+    async def complete_many(self, completions: Sequence[TaskCompletion]) -> list[Task]:
+        if not completions:
+            return []
+
+        if not self._is_postgresql():
+            completed = [
+                await self.complete(
+                    item.task_id,
+                    attempt=item.attempt,
+                    status=item.status,
+                    result=item.result,
+                )
+                for item in completions
+            ]
+            return [task for task in completed if task is not None]
+
+        rows = values(
+            column("id", Integer),
+            column("attempt", Integer),
+            column("status", task_status_enum),
+            column("result", Text),
+            name="completed",
+        ).data(
+            [
+                (item.task_id, item.attempt, item.status, item.result)
+                for item in completions
+            ]
+        )
+        statement = (
+            update(tasks_table)
+            .where(
+                tasks_table.c.id == rows.c.id,
+                tasks_table.c.attempt == rows.c.attempt,
+                tasks_table.c.status == TaskStatus.PROCESSING,
+            )
+            .values(
+                status=rows.c.status,
+                result=rows.c.result,
+                updated_at=datetime.now(UTC),
+                lease_expires_at=None,
+            )
+            .returning(*tasks_table.c)
+        )
+        completed = [
+            _task_from_row(row) for row in await self._session.execute(statement)
+        ]
+
+        deltas: dict[TaskStatus, int] = {TaskStatus.PROCESSING: -len(completed)}
+        for task in completed:
+            deltas[task.status] = deltas.get(task.status, 0) + 1
+        await self._shift_counts(deltas)
+        return completed
+
     async def get(self, task_id: int) -> Task | None:
         return await self._session.get(Task, task_id)
 
-    async def list(
-        self, *, status: TaskStatus | None, page: int, size: int
-    ) -> tuple[list[Task], int]:
-        filters = []
-        if status is not None:
-            filters.append(tasks_table.c.status == status)
+    async def get_many(
+        self, task_ids: Sequence[int], *, include_archive: bool = False
+    ) -> list[Task]:
+        if not task_ids:
+            return []
+
+        source = _task_source(include_archive)
+        if self._is_postgresql():
+            # One array parameter keeps the statement text the same for any
+            # number of ids, so asyncpg reuses one prepared statement.
+            matches = source.c.id == any_(
+                bindparam("task_ids", list(task_ids), type_=postgresql.ARRAY(Integer))
+            )
+        else:
+            matches = source.c.id.in_(task_ids)
+        statement = select(source).where(matches)
+        return [_task_from_row(row) for row in await self._session.execute(statement)]
+
+    async def get_archived(self, task_id: int) -> Task | None:
+        statement = select(
+            *(tasks_archive_table.c[name] for name in ARCHIVED_COLUMNS)
+        ).where(tasks_archive_table.c.id == task_id)
+        row = (await self._session.execute(statement)).one_or_none()
+        return _task_from_row(row) if row is not None else None
+
+    async def _get_archived_by_key(self, key: str) -> Task | None:
+        statement = (
+            select(*(tasks_archive_table.c[name] for name in ARCHIVED_COLUMNS))
+            .where(tasks_archive_table.c.idempotency_key == key)
+            .order_by(tasks_archive_table.c.id)
+            .limit(1)
+        )
+        row = (await self._session.execute(statement)).one_or_none()
+        return _task_from_row(row) if row is not None else None
+
+    async def archive_finished(self, before: datetime, limit: int) -> int:
+        # Status counters count archived tasks too, so they are left alone.
+        picked = (
+            select(tasks_table.c.id)
+            .where(
+                tasks_table.c.status.in_([TaskStatus.DONE, TaskStatus.FAILED]),
+                tasks_table.c.updated_at < before,
+            )
+            .order_by(tasks_table.c.updated_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        columns = [tasks_table.c[name] for name in ARCHIVED_COLUMNS]
+
+        if not self._is_postgresql():
+            task_ids = list((await self._session.scalars(picked)).all())
+            if task_ids:
+                await self._session.execute(
+                    insert(tasks_archive_table).from_select(
+                        ARCHIVED_COLUMNS,
+                        select(*columns).where(tasks_table.c.id.in_(task_ids)),
+                    )
+                )
+                await self._session.execute(
+                    delete(tasks_table).where(tasks_table.c.id.in_(task_ids))
+                )
+            return len(task_ids)
+
+        # One statement, so a row is never in both tables or in neither.
+        moved = (
+            delete(tasks_table)
+            .where(tasks_table.c.id.in_(picked.scalar_subquery()))
+            .returning(*columns)
+            .cte("moved")
+        )
+        statement = (
+            insert(tasks_archive_table)
+            .from_select(
+                ARCHIVED_COLUMNS, select(*(moved.c[name] for name in ARCHIVED_COLUMNS))
+            )
+            .add_cte(moved)
+            .returning(tasks_archive_table.c.id)
+        )
+        return len((await self._session.execute(statement)).all())
+
+    async def _select_page(
+        self,
+        source: FromClause,
+        *,
+        status: TaskStatus | None,
+        period: TaskTimeFilter | None,
+        cursor: TaskCursor | None,
+        offset: int,
+        size: int,
+    ) -> list[Task]:
+        filters = _task_filters(status, period, source)
+        if cursor is not None:
+            filters.append(
+                tuple_(source.c.created_at, source.c.id)
+                < tuple_(cursor.created_at, cursor.id)
+            )
+
+        statement = (
+            select(source)
+            .where(*filters)
+            .order_by(source.c.created_at.desc(), source.c.id.desc())
+            .offset(offset)
+            .limit(size)
+        )
+        return [_task_from_row(row) for row in await self._session.execute(statement)]
+
+    async def list_after(
+        self,
+        *,
+        status: TaskStatus | None,
+        cursor: TaskCursor | None,
+        size: int,
+        period: TaskTimeFilter | None = None,
+        include_archive: bool = False,
+    ) -> list[Task]:
+        if include_archive:
+            return await self._select_page(
+                _task_source(include_archive),
+                status=status,
+                period=period,
+                cursor=cursor,
+                offset=0,
+                size=size,
+            )
+
+        filters = _task_filters(status, period)
+        if cursor is not None:
+            filters.append(
+                tuple_(tasks_table.c.created_at, tasks_table.c.id)
+                < tuple_(cursor.created_at, cursor.id)
+            )
 
         tasks_query: Select[tuple[Task]] = (
             select(Task)
             .where(*filters)
-            .order_by(tasks_table.c.created_at.desc())
-            .offset((page - 1) * size)
+            .order_by(tasks_table.c.created_at.desc(), tasks_table.c.id.desc())
             .limit(size)
         )
+        return list((await self._session.scalars(tasks_query)).all())
 
-        total_query = select(func.count()).select_from(tasks_table).where(*filters)
+    async def list(
+        self,
+        *,
+        status: TaskStatus | None,
+        page: int,
+        size: int,
+        estimate_total: bool = False,
+        period: TaskTimeFilter | None = None,
+        include_archive: bool = False,
+    ) -> tuple[list[Task], int]:
+        if include_archive:
+            items = await self._select_page(
+                _task_source(include_archive),
+                status=status,
+                period=period,
+                cursor=None,
+                offset=(page - 1) * size,
+                size=size,
+            )
+        else:
+            tasks_query: Select[tuple[Task]] = (
+                select(Task)
+                .where(*_task_filters(status, period))
+                .order_by(tasks_table.c.created_at.desc(), tasks_table.c.id.desc())
+                .offset((page - 1) * size)
+                .limit(size)
+            )
+            items = list((await self._session.scalars(tasks_query)).all())
 
-        items = list((await self._session.scalars(tasks_query)).all())
-        total = (await self._session.execute(total_query)).scalar_one()
-        return items, int(total)
+        total = await self.count(
+            status=status,
+            estimated=estimate_total,
+            period=period,
+            include_archive=include_archive,
+        )
+        return items, total
 
-    async def claim_for_processing(self, task_id: int) -> Task | None:
-        now = datetime.now(UTC)
+    async def count(
+        self,
+        *,
+        status: TaskStatus | None,
+        estimated: bool = False,
+        period: TaskTimeFilter | None = None,
+        include_archive: bool = False,
+    ) -> int:
+        if period is not None and not period.is_empty:
+            # The status counters cannot answer time ranges; count the rows.
+            source = _task_source(include_archive)
+            range_query = (
+                select(func.count())
+                .select_from(source)
+                .where(*_task_filters(status, period, source))
+            )
+            return int((await self._session.execute(range_query)).scalar_one())
 
+        if estimated and status is None:
+            estimate = await self._planner_estimate(include_archive)
+            if estimate is not None:
+                return estimate
+
+        total_query = select(
+            func.coalesce(func.sum(task_status_counts_table.c.count), 0)
+        )
+        if status is not None:
+            total_query = total_query.where(task_status_counts_table.c.status == status)
+        return int((await self._session.execute(total_query)).scalar_one())
+
+    async def claim_for_processing(
+        self, task_id: int, *, lease: timedelta | None = None
+    ) -> Task | None:
         statement = (
             update(tasks_table)
             .where(tasks_table.c.id == task_id, tasks_table.c.status == TaskStatus.NEW)
-            .values(status=TaskStatus.PROCESSING, updated_at=now)
+            .values(**_claim_values(lease))
             .returning(tasks_table.c.id)
         )
 
@@ -54,11 +525,12 @@ class SqlAlchemyTaskRepository(TaskRepository):
         if updated_id is None:
             return None
 
-        await self._session.flush()
-        return await self.get(int(updated_id))
+        await self._shift_counts({TaskStatus.NEW: -1, TaskStatus.PROCESSING: 1})
+
+        return await self._session.get(Task, int(updated_id), populate_existing=True)
 
     async def complete(
-        self, task_id: int, *, status: TaskStatus, result: str
+        self, task_id: int, *, attempt: int, status: TaskStatus, result: str
     ) -> Task | None:
         now = datetime.now(UTC)
 
@@ -66,9 +538,10 @@ class SqlAlchemyTaskRepository(TaskRepository):
             update(tasks_table)
             .where(
                 tasks_table.c.id == task_id,
+                tasks_table.c.attempt == attempt,
                 tasks_table.c.status == TaskStatus.PROCESSING,
             )
-            .values(status=status, result=result, updated_at=now)
+            .values(status=status, result=result, updated_at=now, lease_expires_at=None)
             .returning(tasks_table.c.id)
         )
 
@@ -76,5 +549,227 @@ class SqlAlchemyTaskRepository(TaskRepository):
         if updated_id is None:
             return None
 
-        await self._session.flush()
-        return await self.get(int(updated_id))
+        await self._shift_counts({TaskStatus.PROCESSING: -1, status: 1})
+
+        return await self._session.get(Task, int(updated_id), populate_existing=True)
+
+    async def flush_counts(self) -> None:
+        deltas, self._pending_counts = self._pending_counts, {}
+        await self._shift_counts(deltas)
+
+    def _stage_counts(self, created: Sequence[Task]) -> None:
+        # Inserts only stage their counter bump. Writing it locks a shard row
+        # until commit, so callers flush it after any network round trip.
+        for task in created:
+            self._pending_counts[task.status] = (
+                self._pending_counts.get(task.status, 0) + 1
+            )
+
+    async def _shift_counts(self, deltas: dict[TaskStatus, int]) -> None:
+        deltas = {status: delta for status, delta in deltas.items() if delta}
+        if not deltas:
+            return
+
+        counts = task_status_counts_table.c
+        statement = (
+            update(task_status_counts_table)
+            .where(
+                counts.shard == random.randrange(STATUS_COUNT_SHARDS),
+                counts.status.in_(list(deltas)),
+            )
+            .values(count=counts.count + case(deltas, value=counts.status, else_=0))
+        )
+        await self._session.execute(statement)
+
+    async def _write(
+        self, statement: Insert | Update, deltas: dict[TaskStatus, int]
+    ) -> Sequence[Task]:
+        if not self._is_postgresql():
+            tasks = [
+                _task_from_row(row) for row in await self._session.execute(statement)
+            ]
+            await self._shift_counts(
+                {status: delta * len(tasks) for status, delta in deltas.items()}
+            )
+            return tasks
+
+        # Postgres runs data-modifying CTEs to completion even when the outer
+        # query does not read them, so the counter bump rides along with the
+        # row change in the same statement.
+        written = statement.cte("written")
+        counts = task_status_counts_table.c
+        written_count = select(func.count()).select_from(written).scalar_subquery()
+        bump = (
+            update(task_status_counts_table)
+            .where(
+                counts.shard == random.randrange(STATUS_COUNT_SHARDS),
+                counts.status.in_(list(deltas)),
+                exists(select(1).select_from(written)),
+            )
+            .values(
+                count=counts.count
+                + case(deltas, value=counts.status, else_=0) * written_count
+            )
+            .cte("bump")
+        )
+        query = select(written).add_cte(bump)
+        return [_task_from_row(row) for row in await self._session.execute(query)]
+
+    def _is_postgresql(self) -> bool:
+        return self._session.get_bind().dialect.name == "postgresql"
+
+    async def _planner_estimate(self, include_archive: bool = False) -> int | None:
+        if not self._is_postgresql():
+            return None
+
+        tables = (
+            [tasks_table, tasks_archive_table] if include_archive else [tasks_table]
+        )
+        total = 0
+        for table in tables:
+            statement = text(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"
+            ).bindparams(name=table.name)
+            estimate = (await self._session.execute(statement)).scalar_one_or_none()
+            if estimate is None or estimate < 0:
+                return None
+            total += int(estimate)
+        return total
+
+
+class SqlAlchemyCoreTaskRepository(SqlAlchemyTaskRepository):
+    async def add(self, task: Task) -> Task:
+        statement = (
+            insert(tasks_table)
+            .values(
+                title=task.title,
+                status=task.status,
+                result=task.result,
+                created_at=task.created_at,
+                updated_at=task.updated_at,
+                task_type=task.task_type,
+                priority=task.priority,
+            )
+            .returning(*tasks_table.c)
+        )
+        row = (await self._session.execute(statement)).one()
+        created = _task_from_row(row)
+        self._stage_counts([created])
+        return created
+
+    async def add_many(self, tasks: Sequence[Task]) -> list[Task]:
+        if not tasks:
+            return []
+
+        statement = insert(tasks_table).returning(
+            *tasks_table.c, sort_by_parameter_order=True
+        )
+        rows = [
+            {
+                "title": task.title,
+                "status": task.status,
+                "result": task.result,
+                "created_at": task.created_at,
+                "updated_at": task.updated_at,
+                "task_type": task.task_type,
+                "priority": task.priority,
+            }
+            for task in tasks
+        ]
+        created = [
+            _task_from_row(row)
+            for row in (await self._session.execute(statement, rows)).all()
+        ]
+        self._stage_counts(created)
+        return created
+
+    async def get(self, task_id: int) -> Task | None:
+        statement = select(tasks_table).where(tasks_table.c.id == task_id)
+        row = (await self._session.execute(statement)).one_or_none()
+        return _task_from_row(row) if row is not None else None
+
+    async def get_by_idempotency_key(self, key: str) -> Task | None:
+        statement = select(tasks_table).where(tasks_table.c.idempotency_key == key)
+        row = (await self._session.execute(statement)).one_or_none()
+        if row is None:
+            return await self._get_archived_by_key(key)
+        return _task_from_row(row)
+
+    async def list_after(
+        self,
+        *,
+        status: TaskStatus | None,
+        cursor: TaskCursor | None,
+        size: int,
+        period: TaskTimeFilter | None = None,
+        include_archive: bool = False,
+    ) -> list[Task]:
+        return await self._select_page(
+            _task_source(include_archive),
+            status=status,
+            period=period,
+            cursor=cursor,
+            offset=0,
+            size=size,
+        )
+
+    async def claim_for_processing(
+        self, task_id: int, *, lease: timedelta | None = None
+    ) -> Task | None:
+        statement = (
+            update(tasks_table)
+            .where(tasks_table.c.id == task_id, tasks_table.c.status == TaskStatus.NEW)
+            .values(**_claim_values(lease))
+            .returning(*tasks_table.c)
+        )
+        claimed = await self._write(
+            statement, {TaskStatus.NEW: -1, TaskStatus.PROCESSING: 1}
+        )
+        return claimed[0] if claimed else None
+
+    async def complete(
+        self, task_id: int, *, attempt: int, status: TaskStatus, result: str
+    ) -> Task | None:
+        statement = (
+            update(tasks_table)
+            .where(
+                tasks_table.c.id == task_id,
+                tasks_table.c.attempt == attempt,
+                tasks_table.c.status == TaskStatus.PROCESSING,
+            )
+            .values(
+                status=status,
+                result=result,
+                updated_at=datetime.now(UTC),
+                lease_expires_at=None,
+            )
+            .returning(*tasks_table.c)
+        )
+        completed = await self._write(statement, {TaskStatus.PROCESSING: -1, status: 1})
+        return completed[0] if completed else None
+
+    async def list(
+        self,
+        *,
+        status: TaskStatus | None,
+        page: int,
+        size: int,
+        estimate_total: bool = False,
+        period: TaskTimeFilter | None = None,
+        include_archive: bool = False,
+    ) -> tuple[list[Task], int]:
+        items = await self._select_page(
+            _task_source(include_archive),
+            status=status,
+            period=period,
+            cursor=None,
+            offset=(page - 1) * size,
+            size=size,
+        )
+        total = await self.count(
+            status=status,
+            estimated=estimate_total,
+            period=period,
+            include_archive=include_archive,
+        )
+        return items, total
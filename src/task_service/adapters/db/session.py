@@ -1,3 +1,6 @@
+from typing import Any
+
+from sqlalchemy import make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -6,10 +9,50 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from task_service.adapters.db.mappers import map_all_tables
+from task_service.adapters.db.pool import (
+    InstrumentedAsyncQueuePool,
+    track_pool_usage,
+    track_query_timing,
+)
+
+
+def create_engine_from_url(
+    database_url: str,
+    *,
+    name: str = "primary",
+    pool_size: int = 5,
+    max_overflow: int = 10,
+    pool_timeout: float = 30.0,
+    pool_recycle: int = -1,
+    pool_pre_ping: bool = False,
+    statement_cache_size: int | None = None,
+) -> AsyncEngine:
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite":
+        engine = create_async_engine(url)
+        track_query_timing(engine, name)
+        return engine
 
+    connect_args: dict[str, Any] = {}
+    if url.get_driver_name() == "asyncpg" and statement_cache_size is not None:
+        # asyncpg keeps its own statement cache next to SQLAlchemy's; size both.
+        connect_args["statement_cache_size"] = statement_cache_size
+        connect_args["prepared_statement_cache_size"] = statement_cache_size
 
-def create_engine_from_url(database_url: str) -> AsyncEngine:
-    return create_async_engine(database_url, future=True)
+    engine = create_async_engine(
+        url,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_logging_name=name,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=pool_pre_ping,
+        connect_args=connect_args,
+    )
+    track_pool_usage(engine, name, capacity=pool_size + max_overflow)
+    track_query_timing(engine, name)
+    return engine
 
 
 def create_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
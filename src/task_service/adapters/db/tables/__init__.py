@@ -1,3 +1,20 @@
+from task_service.adapters.db.tables.archive import (
+    ARCHIVED_COLUMNS,
+    tasks_archive_table,
+)
+from task_service.adapters.db.tables.outbox import task_outbox_table
+from task_service.adapters.db.tables.status_counts import (
+    STATUS_COUNT_SHARDS,
+    task_status_counts_table,
+)
 from task_service.adapters.db.tables.tasks import map_tasks_table, tasks_table
 
-__all__ = ["tasks_table", "map_tasks_table"]
+__all__ = [
+    "ARCHIVED_COLUMNS",
+    "STATUS_COUNT_SHARDS",
+    "map_tasks_table",
+    "task_outbox_table",
+    "task_status_counts_table",
+    "tasks_archive_table",
+    "tasks_table",
+]
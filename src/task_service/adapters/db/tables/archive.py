@@ -0,0 +1,51 @@
+from sqlalchemy import Column, DateTime, Index, Integer, String, Table, Text, func
+
+from task_service.adapters.db.registry import mapping_registry
+from task_service.adapters.db.tables.tasks import (
+    task_priority_enum,
+    task_status_enum,
+    tasks_table,
+)
+
+# Finished tasks moved out of `tasks`; same columns minus the worker lease.
+tasks_archive_table = Table(
+    "tasks_archive",
+    mapping_registry.metadata,
+    Column("id", Integer, primary_key=True, autoincrement=False),
+    Column("title", String(255), nullable=False),
+    Column("status", task_status_enum, nullable=False),
+    Column("result", Text, nullable=True),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Column("updated_at", DateTime(timezone=True), nullable=False),
+    Column("task_type", String(64), nullable=False),
+    Column("priority", task_priority_enum, nullable=False),
+    Column("idempotency_key", String(255), nullable=True),
+    Column(
+        "archived_at",
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    ),
+)
+
+ARCHIVED_COLUMNS = [
+    column.name for column in tasks_archive_table.c if column.name in tasks_table.c
+]
+
+Index(
+    "ix_tasks_archive_created_at_id",
+    tasks_archive_table.c.created_at.desc(),
+    tasks_archive_table.c.id.desc(),
+)
+Index(
+    "ix_tasks_archive_status_created_at_id",
+    tasks_archive_table.c.status,
+    tasks_archive_table.c.created_at.desc(),
+    tasks_archive_table.c.id.desc(),
+)
+Index(
+    "ix_tasks_archive_idempotency_key",
+    tasks_archive_table.c.idempotency_key,
+    postgresql_where=tasks_archive_table.c.idempotency_key.is_not(None),
+    sqlite_where=tasks_archive_table.c.idempotency_key.is_not(None),
+)
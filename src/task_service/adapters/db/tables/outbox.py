@@ -0,0 +1,21 @@
+from sqlalchemy import BigInteger, Column, DateTime, Integer, Table, func
+
+from task_service.adapters.db.registry import mapping_registry
+from task_service.adapters.db.tables.tasks import task_priority_enum
+from task_service.domain import TaskPriority
+
+task_outbox_table = Table(
+    "task_outbox",
+    mapping_registry.metadata,
+    Column("id", BigInteger().with_variant(Integer, "sqlite"), primary_key=True),
+    Column("task_id", Integer, nullable=False),
+    Column(
+        "priority",
+        task_priority_enum,
+        nullable=False,
+        server_default=TaskPriority.NORMAL.value,
+    ),
+    Column(
+        "created_at", DateTime(timezone=True), nullable=False, server_default=func.now()
+    ),
+)
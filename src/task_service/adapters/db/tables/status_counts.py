@@ -0,0 +1,29 @@
+from typing import Any
+
+from sqlalchemy import BigInteger, Column, Connection, SmallInteger, Table, event
+
+from task_service.adapters.db.registry import mapping_registry
+from task_service.adapters.db.tables.tasks import task_status_enum
+from task_service.domain import TaskStatus
+
+STATUS_COUNT_SHARDS = 16
+
+task_status_counts_table = Table(
+    "task_status_counts",
+    mapping_registry.metadata,
+    Column("status", task_status_enum, primary_key=True),
+    Column("shard", SmallInteger, primary_key=True, autoincrement=False),
+    Column("count", BigInteger, nullable=False, server_default="0"),
+)
+
+
+@event.listens_for(task_status_counts_table, "after_create")
+def _seed_status_counts(target: Table, connection: Connection, **_: Any) -> None:
+    connection.execute(
+        target.insert(),
+        [
+            {"status": status, "shard": shard, "count": 0}
+            for status in TaskStatus
+            for shard in range(STATUS_COUNT_SHARDS)
+        ],
+    )
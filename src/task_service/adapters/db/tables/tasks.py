@@ -1,7 +1,7 @@
 from sqlalchemy import Column, DateTime, Enum, Index, Integer, String, Table, Text, func
 
 from task_service.adapters.db.registry import mapping_registry
-from task_service.domain import Task, TaskStatus
+from task_service.domain import DEFAULT_TASK_TYPE, Task, TaskPriority, TaskStatus
 
 task_status_enum = Enum(
     TaskStatus,
@@ -9,6 +9,12 @@ task_status_enum = Enum(
     native_enum=False,
     values_callable=lambda statuses: [status.value for status in statuses],
 )
+task_priority_enum = Enum(
+    TaskPriority,
+    name="task_priority",
+    native_enum=False,
+    values_callable=lambda priorities: [priority.value for priority in priorities],
+)
 
 tasks_table = Table(
     "tasks",
@@ -25,9 +31,64 @@ tasks_table = Table(
     Column(
         "updated_at", DateTime(timezone=True), nullable=False, server_default=func.now()
     ),
+    Column("task_type", String(64), nullable=False, server_default=DEFAULT_TASK_TYPE),
+    Column(
+        "priority",
+        task_priority_enum,
+        nullable=False,
+        server_default=TaskPriority.NORMAL.value,
+    ),
+    Column("lease_expires_at", DateTime(timezone=True), nullable=True),
+    Column("idempotency_key", String(255), nullable=True),
+    Column("attempt", Integer, nullable=False, server_default="0"),
 )
 
-Index("ix_tasks_status", tasks_table.c.status)
+Index(
+    "ix_tasks_created_at_id",
+    tasks_table.c.created_at.desc(),
+    tasks_table.c.id.desc(),
+)
+Index(
+    "ix_tasks_status_created_at_id",
+    tasks_table.c.status,
+    tasks_table.c.created_at.desc(),
+    tasks_table.c.id.desc(),
+)
+Index(
+    "ix_tasks_new_created_at_id",
+    tasks_table.c.created_at.desc(),
+    tasks_table.c.id.desc(),
+    postgresql_where=tasks_table.c.status == TaskStatus.NEW,
+)
+Index(
+    "ix_tasks_processing_created_at_id",
+    tasks_table.c.created_at.desc(),
+    tasks_table.c.id.desc(),
+    postgresql_where=tasks_table.c.status == TaskStatus.PROCESSING,
+)
+Index(
+    "ix_tasks_new_priority_id",
+    tasks_table.c.priority,
+    tasks_table.c.id,
+    postgresql_where=tasks_table.c.status == TaskStatus.NEW,
+)
+Index(
+    "ix_tasks_finished_updated_at",
+    tasks_table.c.updated_at,
+    postgresql_where=tasks_table.c.status.in_([TaskStatus.DONE, TaskStatus.FAILED]),
+)
+Index(
+    "ix_tasks_processing_lease_expires_at",
+    tasks_table.c.lease_expires_at,
+    postgresql_where=tasks_table.c.status == TaskStatus.PROCESSING,
+)
+Index(
+    "ux_tasks_idempotency_key",
+    tasks_table.c.idempotency_key,
+    unique=True,
+    postgresql_where=tasks_table.c.idempotency_key.is_not(None),
+    sqlite_where=tasks_table.c.idempotency_key.is_not(None),
+)
 
 _task_is_mapped = False
 
@@ -0,0 +1,18 @@
+from task_service.adapters.events.hub import TaskEventHub, TaskEventSource
+from task_service.adapters.events.postgres_events import (
+    PostgresTaskEventPublisher,
+    PostgresTaskEventSource,
+)
+from task_service.adapters.events.redis_events import (
+    RedisTaskEventPublisher,
+    RedisTaskEventSource,
+)
+
+__all__ = [
+    "PostgresTaskEventPublisher",
+    "PostgresTaskEventSource",
+    "RedisTaskEventPublisher",
+    "RedisTaskEventSource",
+    "TaskEventHub",
+    "TaskEventSource",
+]
@@ -0,0 +1,62 @@
+import asyncio
+import logging
+from collections import defaultdict
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager, suppress
+from typing import Protocol
+
+from task_service.domain import Task
+from task_service.ports import TaskEventStream
+
+logger = logging.getLogger(__name__)
+
+
+class TaskEventSource(Protocol):
+    async def listen(self, deliver: Callable[[Task], None]) -> None: ...
+
+
+class TaskEventHub(TaskEventStream):
+    def __init__(
+        self, source: TaskEventSource, *, reconnect_delay_seconds: float = 1.0
+    ) -> None:
+        self._source = source
+        self._reconnect_delay_seconds = reconnect_delay_seconds
+        self._subscribers: defaultdict[int, set[asyncio.Queue[Task]]] = defaultdict(set)
+        self._listener: asyncio.Task[None] | None = None
+
+    @asynccontextmanager
+    async def subscribe(self, task_id: int) -> AsyncIterator[asyncio.Queue[Task]]:
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+        updates: asyncio.Queue[Task] = asyncio.Queue()
+        self._subscribers[task_id].add(updates)
+        try:
+            yield updates
+        finally:
+            waiting = self._subscribers[task_id]
+            waiting.discard(updates)
+            if not waiting:
+                del self._subscribers[task_id]
+
+    async def close(self) -> None:
+        if self._listener is None:
+            return
+        self._listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._listener
+        self._listener = None
+
+    def _deliver(self, task: Task) -> None:
+        if task.id is None:
+            return
+        for updates in self._subscribers.get(task.id, ()):
+            updates.put_nowait(task)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                await self._source.listen(self._deliver)
+            except Exception:
+                logger.exception("task event listener failed, reconnecting")
+            await asyncio.sleep(self._reconnect_delay_seconds)
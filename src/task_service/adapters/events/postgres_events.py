@@ -0,0 +1,62 @@
+import asyncio
+import logging
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import asyncpg
+from sqlalchemy import bindparam, column, func, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.types import Text
+
+from task_service.adapters.serialization import dump_task, load_task
+from task_service.domain import Task
+from task_service.ports import TaskEventPublisher
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresTaskEventPublisher(TaskEventPublisher):
+    def __init__(self, engine: AsyncEngine, channel: str) -> None:
+        self._engine = engine
+        self._channel = channel
+
+    async def publish_many(self, tasks: Sequence[Task]) -> None:
+        if not tasks:
+            return
+
+        payloads = func.unnest(bindparam("payloads", type_=ARRAY(Text))).table_valued(
+            column("payload", Text)
+        )
+        statement = select(func.pg_notify(self._channel, payloads.c.payload))
+        try:
+            async with self._engine.connect() as connection:
+                await connection.execute(
+                    statement, {"payloads": [dump_task(task) for task in tasks]}
+                )
+                await connection.commit()
+        except DBAPIError:
+            logger.warning("task event publish failed", exc_info=True)
+
+
+class PostgresTaskEventSource:
+    def __init__(
+        self, dsn: str, channel: str, *, health_check_interval_seconds: float = 5.0
+    ) -> None:
+        self._dsn = dsn
+        self._channel = channel
+        self._health_check_interval_seconds = health_check_interval_seconds
+
+    async def listen(self, deliver: Callable[[Task], None]) -> None:
+        def on_notify(*args: Any) -> None:
+            deliver(load_task(args[3]))
+
+        connection = await asyncpg.connect(self._dsn)
+        try:
+            await connection.add_listener(self._channel, on_notify)
+            while not connection.is_closed():
+                await asyncio.sleep(self._health_check_interval_seconds)
+                await connection.execute("SELECT 1")
+        finally:
+            await connection.close()
@@ -0,0 +1,38 @@
+import logging
+from collections.abc import Callable, Sequence
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from task_service.adapters.serialization import dump_task, load_task
+from task_service.domain import Task
+from task_service.ports import TaskEventPublisher
+
+logger = logging.getLogger(__name__)
+
+
+class RedisTaskEventPublisher(TaskEventPublisher):
+    def __init__(self, redis: Redis, channel: str) -> None:
+        self._redis = redis
+        self._channel = channel
+
+    async def publish_many(self, tasks: Sequence[Task]) -> None:
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for task in tasks:
+                    pipe.publish(self._channel, dump_task(task))
+                await pipe.execute()
+        except RedisError:
+            logger.warning("task event publish failed", exc_info=True)
+
+
+class RedisTaskEventSource:
+    def __init__(self, redis: Redis, channel: str) -> None:
+        self._redis = redis
+        self._channel = channel
+
+    async def listen(self, deliver: Callable[[Task], None]) -> None:
+        async with self._redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+            await pubsub.subscribe(self._channel)
+            async for message in pubsub.listen():
+                deliver(load_task(message["data"]))
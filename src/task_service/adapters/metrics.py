@@ -0,0 +1,147 @@
+import os
+
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    start_http_server,
+)
+from prometheus_client.multiprocess import MultiProcessCollector
+
+from task_service.domain import TaskPriority, TaskStatus
+from task_service.ports import TaskMetrics
+
+FAST_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    5,
+    30,
+)
+SLOW_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 300, 900, 3600)
+
+WORKER_SLOTS = Gauge(
+    "task_worker_slots",
+    "Concurrent task slots available to the worker",
+    multiprocess_mode="livesum",
+)
+WORKER_SLOTS_BUSY = Gauge(
+    "task_worker_slots_busy",
+    "Task slots currently executing a job",
+    multiprocess_mode="livesum",
+)
+WORKER_SLOT_BUSY_SECONDS = Counter(
+    "task_worker_slot_busy_seconds",
+    "Time task slots spent executing jobs",
+)
+
+TASK_CACHE_HITS = Counter(
+    "task_cache_hits",
+    "Task reads served from cache",
+    ["tier"],
+)
+TASK_CACHE_MISSES = Counter(
+    "task_cache_misses",
+    "Task reads that fell through the cache to the database",
+)
+
+
+DB_POOL_CAPACITY = Gauge(
+    "task_db_pool_capacity",
+    "Connections a pool may hand out, pool_size plus max_overflow",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_IN_USE = Gauge(
+    "task_db_pool_connections_in_use",
+    "Connections currently checked out of the pool",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "task_db_pool_checkout_seconds",
+    "Time spent waiting for a pooled connection, including connecting",
+    ["pool"],
+    buckets=FAST_BUCKETS,
+)
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "task_db_pool_checkout_timeouts",
+    "Checkouts that gave up after pool_timeout",
+    ["pool"],
+)
+
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "task_http_request_duration_seconds",
+    "Time until the response headers are sent, per route template",
+    ["method", "route", "status"],
+    buckets=FAST_BUCKETS,
+)
+DB_QUERY_SECONDS = Histogram(
+    "task_db_query_duration_seconds",
+    "Statement execution time as seen by the driver",
+    ["pool", "operation"],
+    buckets=FAST_BUCKETS,
+)
+TASK_ENQUEUE_SECONDS = Histogram(
+    "task_enqueue_duration_seconds",
+    "Time spent handing task ids to the broker",
+    ["operation"],
+    buckets=FAST_BUCKETS,
+)
+TASK_QUEUE_WAIT_SECONDS = Histogram(
+    "task_queue_wait_seconds",
+    "Time from task creation to claim",
+    ["task_type", "priority"],
+    buckets=SLOW_BUCKETS,
+)
+TASK_PROCESSING_SECONDS = Histogram(
+    "task_processing_seconds",
+    "Time from claim to completion",
+    ["task_type", "status"],
+    buckets=SLOW_BUCKETS,
+)
+TASK_LEASES_RECLAIMED = Counter(
+    "task_leases_reclaimed",
+    "Tasks returned to new after their processing lease expired",
+)
+TASKS_ARCHIVED = Counter(
+    "task_tasks_archived",
+    "Finished tasks moved from the hot table to the archive",
+)
+TASKS_BY_STATUS = Gauge(
+    "task_tasks",
+    "Tasks per status, refreshed from the status counters on scrape",
+    ["status"],
+    multiprocess_mode="livemax",
+)
+
+
+class PrometheusTaskMetrics(TaskMetrics):
+    def observe_queue_wait(
+        self, task_type: str, priority: TaskPriority, seconds: float
+    ) -> None:
+        TASK_QUEUE_WAIT_SECONDS.labels(task_type, priority.value).observe(seconds)
+
+    def observe_processing(
+        self, task_type: str, status: TaskStatus, seconds: float
+    ) -> None:
+        TASK_PROCESSING_SECONDS.labels(task_type, status.value).observe(seconds)
+
+
+def start_metrics_server(port: int) -> None:
+    registry = REGISTRY
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)
+    start_http_server(port, registry=registry)
@@ -1,3 +1,4 @@
+from task_service.adapters.queue.postgres_queue import PostgresTaskQueue
 from task_service.adapters.queue.taskiq_queue import TaskiqTaskQueue
 
-__all__ = ["TaskiqTaskQueue"]
+__all__ = ["PostgresTaskQueue", "TaskiqTaskQueue"]
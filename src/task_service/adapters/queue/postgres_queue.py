@@ -0,0 +1,27 @@
+from collections.abc import Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from task_service.domain import TaskPriority
+from task_service.ports import TaskQueue
+
+
+class PostgresTaskQueue(TaskQueue):
+    def __init__(self, session: AsyncSession, channel: str) -> None:
+        self._session = session
+        self._channel = channel
+
+    async def enqueue(
+        self, task_id: int, priority: TaskPriority = TaskPriority.NORMAL
+    ) -> None:
+        await self.enqueue_many([task_id], priority)
+
+    async def enqueue_many(
+        self, task_ids: Sequence[int], priority: TaskPriority = TaskPriority.NORMAL
+    ) -> None:
+        if not task_ids:
+            return
+        # New rows are the queue itself; the notification is delivered on
+        # commit and only wakes idle workers up.
+        await self._session.execute(select(func.pg_notify(self._channel, "")))
@@ -0,0 +1,46 @@
+import json
+from datetime import datetime
+
+from task_service.domain import Task, TaskPriority, TaskStatus
+
+
+def dump_task(task: Task) -> str:
+    return json.dumps(
+        {
+            "id": task.id,
+            "title": task.title,
+            "task_type": task.task_type,
+            "priority": task.priority.value,
+            "status": task.status.value,
+            "result": task.result,
+            "created_at": task.created_at.isoformat(),
+            "updated_at": task.updated_at.isoformat(),
+            "lease_expires_at": (
+                task.lease_expires_at.isoformat() if task.lease_expires_at else None
+            ),
+            "idempotency_key": task.idempotency_key,
+            "attempt": task.attempt,
+        }
+    )
+
+
+def load_task(payload: str | bytes) -> Task:
+    data = json.loads(payload)
+    return Task(
+        id=data["id"],
+        title=data["title"],
+        task_type=data["task_type"],
+        # Entries cached before priorities existed are all normal.
+        priority=TaskPriority(data.get("priority", TaskPriority.NORMAL)),
+        status=TaskStatus(data["status"]),
+        result=data["result"],
+        created_at=datetime.fromisoformat(data["created_at"]),
+        updated_at=datetime.fromisoformat(data["updated_at"]),
+        lease_expires_at=(
+            datetime.fromisoformat(data["lease_expires_at"])
+            if data.get("lease_expires_at")
+            else None
+        ),
+        idempotency_key=data.get("idempotency_key"),
+        attempt=data.get("attempt", 0),
+    )
@@ -1,19 +1,49 @@
+from task_service.app.completions import TaskCompletionAggregator
 from task_service.app.errors import (
+    IdempotencyKeyReusedError,
+    InvalidCursorError,
+    InvalidTaskBatchError,
     InvalidTaskTitleError,
     QueueUnavailableError,
     TaskNotFoundError,
+    UnknownTaskTypeError,
 )
+from task_service.app.handlers import (
+    ExecutionMode,
+    TaskHandlerRegistry,
+    simulated_task_handler,
+)
+from task_service.app.scheduling import weighted_rotation
 from task_service.app.use_cases import (
+    LeaseReaperUseCase,
+    OutboxRelayUseCase,
+    ReadConsistency,
+    TaskArchivalUseCase,
     TaskCommandUseCase,
     TaskProcessingUseCase,
     TaskQueryUseCase,
+    TaskWatchUseCase,
 )
 
 __all__ = [
+    "ExecutionMode",
+    "IdempotencyKeyReusedError",
+    "InvalidCursorError",
+    "InvalidTaskBatchError",
     "InvalidTaskTitleError",
+    "LeaseReaperUseCase",
+    "OutboxRelayUseCase",
     "QueueUnavailableError",
-    "TaskNotFoundError",
+    "ReadConsistency",
+    "TaskArchivalUseCase",
     "TaskCommandUseCase",
-    "TaskQueryUseCase",
+    "TaskCompletionAggregator",
+    "TaskHandlerRegistry",
+    "TaskNotFoundError",
     "TaskProcessingUseCase",
+    "TaskQueryUseCase",
+    "TaskWatchUseCase",
+    "UnknownTaskTypeError",
+    "simulated_task_handler",
+    "weighted_rotation",
 ]
@@ -0,0 +1,89 @@
+import asyncio
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+
+from task_service.domain import Task, TaskStatus
+from task_service.ports import (
+    TaskCompleter,
+    TaskCompletion,
+    TaskRepository,
+    TransactionManager,
+)
+
+CompletionUnitOfWork = Callable[
+    [], AbstractAsyncContextManager[tuple[TaskRepository, TransactionManager]]
+]
+
+_PendingCompletion = tuple[TaskCompletion, asyncio.Future[Task | None]]
+
+
+class TaskCompletionAggregator(TaskCompleter):
+    def __init__(
+        self,
+        unit_of_work: CompletionUnitOfWork,
+        *,
+        max_batch_size: int,
+        flush_window_seconds: float,
+    ) -> None:
+        self._unit_of_work = unit_of_work
+        self._max_batch_size = max_batch_size
+        self._flush_window_seconds = flush_window_seconds
+        self._pending: list[_PendingCompletion] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushes: set[asyncio.Task[None]] = set()
+
+    async def complete(
+        self, task_id: int, *, attempt: int, status: TaskStatus, result: str
+    ) -> Task | None:
+        future: asyncio.Future[Task | None] = asyncio.get_running_loop().create_future()
+        self._pending.append((TaskCompletion(task_id, attempt, status, result), future))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self._flush_window_seconds, self._start_flush
+            )
+
+        return await future
+
+    async def close(self) -> None:
+        self._start_flush()
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    def _start_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        flush = asyncio.create_task(self._flush(batch))
+        self._flushes.add(flush)
+        flush.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: list[_PendingCompletion]) -> None:
+        completions: list[TaskCompletion] = []
+        seen: set[int] = set()
+        for completion, _ in batch:
+            if completion.task_id not in seen:
+                seen.add(completion.task_id)
+                completions.append(completion)
+
+        try:
+            async with self._unit_of_work() as (tasks, tx):
+                updated = await tasks.complete_many(completions)
+                await tx.commit()
+        except Exception as exc:  # noqa: BLE001 - handed to every waiting caller
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        by_id = {task.id: task for task in updated}
+        for completion, future in batch:
+            if not future.done():
+                future.set_result(by_id.pop(completion.task_id, None))
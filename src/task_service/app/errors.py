@@ -6,5 +6,27 @@ class InvalidTaskTitleError(Exception):
     pass
 
 
+class UnknownTaskTypeError(Exception):
+    def __init__(self, task_type: str) -> None:
+        super().__init__(f"unknown task type: {task_type}")
+        self.task_type = task_type
+
+
+class InvalidTaskBatchError(Exception):
+    def __init__(self, errors: dict[int, str]) -> None:
+        super().__init__("task batch contains invalid items")
+        self.errors = errors
+
+
+class IdempotencyKeyReusedError(Exception):
+    def __init__(self, key: str) -> None:
+        super().__init__(f"idempotency key {key!r} was used for a different task")
+        self.key = key
+
+
+class InvalidCursorError(Exception):
+    pass
+
+
 class QueueUnavailableError(Exception):
     pass
@@ -0,0 +1,73 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from inspect import iscoroutinefunction
+from typing import Any, Literal
+
+from task_service.app.errors import UnknownTaskTypeError
+from task_service.domain import Task, TaskStatus, resolve_task_result
+
+ExecutionMode = Literal["inline", "thread", "process"]
+TaskOutcome = tuple[TaskStatus, str]
+
+
+@dataclass(frozen=True, slots=True)
+class TaskHandler:
+    func: Callable[[str], Any]
+    mode: ExecutionMode
+
+
+class TaskHandlerRegistry:
+    def __init__(
+        self,
+        *,
+        thread_pool: Executor | None = None,
+        process_pool: Executor | None = None,
+    ) -> None:
+        self._handlers: dict[str, TaskHandler] = {}
+        self._executors: dict[ExecutionMode, Executor | None] = {
+            "thread": thread_pool,
+            "process": process_pool,
+        }
+
+    def register(
+        self,
+        task_type: str,
+        func: Callable[[str], Any],
+        *,
+        mode: ExecutionMode = "inline",
+    ) -> None:
+        if task_type in self._handlers:
+            raise ValueError(f"handler for task type {task_type!r} already registered")
+        if (mode == "inline") != iscoroutinefunction(func):
+            raise ValueError("inline handlers must be async, pooled handlers sync")
+        if mode != "inline" and self._executors[mode] is None:
+            raise ValueError(f"no {mode} pool configured for {task_type!r}")
+        self._handlers[task_type] = TaskHandler(func=func, mode=mode)
+
+    def supports(self, task_type: str) -> bool:
+        return task_type in self._handlers
+
+    async def execute(self, task: Task) -> TaskOutcome:
+        handler = self._handlers.get(task.task_type)
+        if handler is None:
+            raise UnknownTaskTypeError(task.task_type)
+
+        if handler.mode == "inline":
+            return await handler.func(task.title)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executors[handler.mode], handler.func, task.title
+        )
+
+
+def simulated_task_handler(
+    processing_delay_seconds: float,
+) -> Callable[[str], Awaitable[TaskOutcome]]:
+    async def handle(title: str) -> TaskOutcome:
+        await asyncio.sleep(processing_delay_seconds)
+        return resolve_task_result(title)
+
+    return handle
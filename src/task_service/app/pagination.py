@@ -0,0 +1,25 @@
+import binascii
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+
+from task_service.app.errors import InvalidCursorError
+from task_service.domain import Task
+from task_service.ports import TaskCursor
+
+
+def encode_cursor(task: Task) -> str:
+    if task.id is None:
+        raise ValueError("cannot build cursor for unsaved task")
+    raw = f"{task.created_at.isoformat()}|{task.id}".encode()
+    return urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> TaskCursor:
+    try:
+        raw = urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        created_at, task_id = raw.rsplit("|", 1)
+        return TaskCursor(
+            created_at=datetime.fromisoformat(created_at), id=int(task_id)
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursorError("invalid cursor") from exc
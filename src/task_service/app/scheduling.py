@@ -0,0 +1,21 @@
+from collections.abc import Hashable, Mapping
+
+
+def weighted_rotation[QueueKey: Hashable](
+    weights: Mapping[QueueKey, int],
+) -> list[list[QueueKey]]:
+    # Smooth weighted round-robin: one full cycle holds each key as often as
+    # its weight, interleaved rather than in runs. Every step lists the other
+    # keys after the chosen one, so an empty queue hands its turn down.
+    total = sum(weights.values())
+    current = dict.fromkeys(weights, 0)
+    by_weight = sorted(weights, key=lambda key: weights[key], reverse=True)
+
+    rotation: list[list[QueueKey]] = []
+    for _ in range(total):
+        for key, weight in weights.items():
+            current[key] += weight
+        chosen = max(by_weight, key=lambda key: current[key])
+        current[chosen] -= total
+        rotation.append([chosen, *(key for key in by_weight if key != chosen)])
+    return rotation
@@ -1,58 +1,408 @@
 import asyncio
+import logging
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager, suppress
+from datetime import UTC, datetime, timedelta
+from typing import Literal
 
 from task_service.app.errors import (
+    IdempotencyKeyReusedError,
+    InvalidTaskBatchError,
     InvalidTaskTitleError,
     QueueUnavailableError,
     TaskNotFoundError,
+    UnknownTaskTypeError,
 )
-from task_service.domain import Task, TaskStatus, resolve_task_result
-from task_service.ports import TaskQueue, TaskRepository, TransactionManager
+from task_service.app.handlers import TaskHandlerRegistry
+from task_service.app.pagination import decode_cursor, encode_cursor
+from task_service.domain import DEFAULT_TASK_TYPE, Task, TaskPriority, TaskStatus
+from task_service.ports import (
+    IdempotencyKeyCache,
+    TaskCache,
+    TaskClaim,
+    TaskCompleter,
+    TaskCompletion,
+    TaskEventPublisher,
+    TaskEventStream,
+    TaskMetrics,
+    TaskOutbox,
+    TaskQueue,
+    TaskRepository,
+    TaskTimeFilter,
+    TransactionManager,
+)
+
+ReadConsistency = Literal["eventual", "strong"]
+
+logger = logging.getLogger(__name__)
 
 
 class TaskCommandUseCase:
     def __init__(
-        self, tasks: TaskRepository, tx: TransactionManager, queue: TaskQueue
+        self,
+        tasks: TaskRepository,
+        tx: TransactionManager,
+        queue: TaskQueue,
+        handlers: TaskHandlerRegistry | None = None,
+        recent_keys: IdempotencyKeyCache | None = None,
     ) -> None:
         self._tasks = tasks
         self._tx = tx
         self._queue = queue
+        self._handlers = handlers
+        self._recent_keys = recent_keys
 
-    async def create_task(self, title: str) -> Task:
+    async def create_task(
+        self,
+        title: str,
+        task_type: str = DEFAULT_TASK_TYPE,
+        priority: TaskPriority = TaskPriority.NORMAL,
+        idempotency_key: str | None = None,
+    ) -> Task:
         try:
-            task = Task.create(title)
+            task = Task.create(title, task_type, priority, idempotency_key)
         except ValueError as exc:
             raise InvalidTaskTitleError(str(exc)) from exc
+        self._check_task_type(task_type)
+
+        if idempotency_key is None:
+            created = await self._tasks.add(task)
+            await self._tx.flush()
+        else:
+            if self._recent_keys is not None:
+                original = await self._recent_keys.get(idempotency_key)
+                if original is not None:
+                    return self._check_original(idempotency_key, original, task)
 
-        created = await self._tasks.add(task)
-        await self._tx.flush()
+            # No lookup first: ON CONFLICT DO NOTHING already tells retries
+            # apart, so first attempts pay a single round trip.
+            inserted = await self._tasks.add_idempotent(task)
+            if inserted is None:
+                # An earlier attempt or a concurrent retry owns the key.
+                await self._tx.rollback()
+                return await self._find_original(idempotency_key, task)
+            created = inserted
 
         if created.id is None:
             raise RuntimeError("task id was not generated")
 
         try:
-            await self._queue.enqueue(created.id)
+            await self._queue.enqueue(created.id, created.priority)
         except Exception as exc:
             await self._tx.rollback()
             raise QueueUnavailableError("failed to enqueue task") from exc
 
+        # Last statement before commit: it holds a counter shard row lock.
+        await self._tasks.flush_counts()
         await self._tx.commit()
+        if idempotency_key is not None and self._recent_keys is not None:
+            await self._recent_keys.put(idempotency_key, created)
         return created
 
+    async def create_tasks(
+        self,
+        titles: Sequence[str],
+        task_types: Sequence[str] | None = None,
+        priorities: Sequence[TaskPriority] | None = None,
+    ) -> list[Task]:
+        if task_types is None:
+            task_types = [DEFAULT_TASK_TYPE] * len(titles)
+        if priorities is None:
+            priorities = [TaskPriority.NORMAL] * len(titles)
+
+        tasks: list[Task] = []
+        errors: dict[int, str] = {}
+        for index, (title, task_type, priority) in enumerate(
+            zip(titles, task_types, priorities, strict=True)
+        ):
+            try:
+                tasks.append(Task.create(title, task_type, priority))
+                self._check_task_type(task_type)
+            except (ValueError, UnknownTaskTypeError) as exc:
+                errors[index] = str(exc)
+
+        if errors:
+            raise InvalidTaskBatchError(errors)
+
+        created = await self._tasks.add_many(tasks)
+
+        if any(task.id is None for task in created):
+            raise RuntimeError("task id was not generated")
+
+        try:
+            for priority, task_ids in _ids_by_priority(created).items():
+                await self._queue.enqueue_many(task_ids, priority)
+        except Exception as exc:
+            await self._tx.rollback()
+            raise QueueUnavailableError("failed to enqueue tasks") from exc
+
+        await self._tasks.flush_counts()
+        await self._tx.commit()
+        return created
+
+    async def _find_original(self, key: str, task: Task) -> Task:
+        original = await self._tasks.get_by_idempotency_key(key)
+        if original is None:
+            raise RuntimeError("idempotent task was not found")
+        if self._recent_keys is not None:
+            await self._recent_keys.put(key, original)
+        return self._check_original(key, original, task)
+
+    def _check_original(self, key: str, original: Task, task: Task) -> Task:
+        if (original.title, original.task_type, original.priority) != (
+            task.title,
+            task.task_type,
+            task.priority,
+        ):
+            raise IdempotencyKeyReusedError(key)
+        return original
+
+    def _check_task_type(self, task_type: str) -> None:
+        if self._handlers is not None and not self._handlers.supports(task_type):
+            raise UnknownTaskTypeError(task_type)
+
+
+class OutboxRelayUseCase:
+    def __init__(
+        self, outbox: TaskOutbox, tx: TransactionManager, queue: TaskQueue
+    ) -> None:
+        self._outbox = outbox
+        self._tx = tx
+        self._queue = queue
+
+    async def relay_batch(self, limit: int) -> int:
+        taken = await self._outbox.take(limit)
+        if not taken:
+            await self._tx.commit()
+            return 0
+
+        try:
+            for priority, task_ids in taken.items():
+                await self._queue.enqueue_many(task_ids, priority)
+        except Exception as exc:
+            await self._tx.rollback()
+            raise QueueUnavailableError("failed to relay outbox batch") from exc
+
+        await self._tx.commit()
+        return sum(len(task_ids) for task_ids in taken.values())
+
+
+class LeaseReaperUseCase:
+    def __init__(
+        self, tasks: TaskRepository, tx: TransactionManager, queue: TaskQueue
+    ) -> None:
+        self._tasks = tasks
+        self._tx = tx
+        self._queue = queue
+
+    async def reclaim_batch(self, limit: int) -> int:
+        reclaimed = await self._tasks.reclaim_expired(limit)
+        if not reclaimed:
+            await self._tx.commit()
+            return 0
+
+        try:
+            for priority, task_ids in _ids_by_priority(reclaimed).items():
+                await self._queue.enqueue_many(task_ids, priority)
+        except Exception as exc:
+            await self._tx.rollback()
+            raise QueueUnavailableError("failed to re-enqueue expired tasks") from exc
+
+        await self._tx.commit()
+        return len(reclaimed)
+
+
+def _ids_by_priority(tasks: Sequence[Task]) -> dict[TaskPriority, list[int]]:
+    grouped: dict[TaskPriority, list[int]] = {}
+    for task in tasks:
+        if task.id is not None:
+            grouped.setdefault(task.priority, []).append(task.id)
+    return grouped
+
 
 class TaskQueryUseCase:
-    def __init__(self, tasks: TaskRepository) -> None:
+    def __init__(
+        self,
+        tasks: TaskRepository,
+        cache: TaskCache | None = None,
+        replica: TaskRepository | None = None,
+    ) -> None:
         self._tasks = tasks
+        self._cache = cache
+        self._replica = replica
 
-    async def get_task(self, task_id: int) -> Task:
-        task = await self._tasks.get(task_id)
+    async def get_task(
+        self, task_id: int, *, consistency: ReadConsistency = "eventual"
+    ) -> Task:
+        if self._cache is not None and consistency == "eventual":
+            cached = await self._cache.get(task_id)
+            if cached is not None:
+                return cached
+
+        task = (await self._fetch([task_id], consistency)).get(task_id)
         if task is None:
             raise TaskNotFoundError(f"task {task_id} not found")
+
+        if self._cache is not None:
+            await self._cache.put_many([task])
         return task
 
+    async def get_tasks(
+        self, task_ids: Sequence[int], *, consistency: ReadConsistency = "eventual"
+    ) -> tuple[list[Task], list[int]]:
+        wanted = list(dict.fromkeys(task_ids))
+        found = await self._fetch(wanted, consistency)
+        items = [found[task_id] for task_id in wanted if task_id in found]
+        missing = [task_id for task_id in wanted if task_id not in found]
+        return items, missing
+
     async def list_tasks(
-        self, *, status: TaskStatus | None, page: int, size: int
+        self,
+        *,
+        status: TaskStatus | None,
+        page: int,
+        size: int,
+        estimate_total: bool = False,
+        period: TaskTimeFilter | None = None,
+        consistency: ReadConsistency = "eventual",
     ) -> tuple[list[Task], int]:
-        return await self._tasks.list(status=status, page=page, size=size)
+        return await self._reader(consistency).list(
+            status=status,
+            page=page,
+            size=size,
+            estimate_total=estimate_total,
+            period=period,
+            include_archive=_may_be_archived(status),
+        )
+
+    async def list_tasks_after(
+        self,
+        *,
+        status: TaskStatus | None,
+        cursor: str | None,
+        size: int,
+        period: TaskTimeFilter | None = None,
+        consistency: ReadConsistency = "eventual",
+    ) -> tuple[list[Task], str | None]:
+        after = decode_cursor(cursor) if cursor else None
+        items = await self._reader(consistency).list_after(
+            status=status,
+            cursor=after,
+            size=size + 1,
+            period=period,
+            include_archive=_may_be_archived(status),
+        )
+        if len(items) <= size:
+            return items, None
+
+        items = items[:size]
+        return items, encode_cursor(items[-1])
+
+    async def count_by_status(self) -> dict[TaskStatus, int]:
+        reader = self._reader("eventual")
+        return {status: await reader.count(status=status) for status in TaskStatus}
+
+    async def _fetch(
+        self, task_ids: list[int], consistency: ReadConsistency
+    ) -> dict[int | None, Task]:
+        # Hot table and archive are read together on each side: archived
+        # tasks are the bulk of the data and must not fall through to the
+        # primary.
+        reader = self._reader(consistency)
+        found = {
+            task.id: task
+            for task in await reader.get_many(task_ids, include_archive=True)
+        }
+        lagging = [task_id for task_id in task_ids if task_id not in found]
+        if lagging and reader is not self._tasks:
+            # Not replicated yet, most likely created a moment ago.
+            found.update(
+                (task.id, task)
+                for task in await self._tasks.get_many(lagging, include_archive=True)
+            )
+        return found
+
+    def _reader(self, consistency: ReadConsistency) -> TaskRepository:
+        if self._replica is not None and consistency == "eventual":
+            return self._replica
+        return self._tasks
+
+
+def _may_be_archived(status: TaskStatus | None) -> bool:
+    # Only finished tasks are archived; active filters stay on the hot table.
+    return status is None or status.is_terminal
+
+
+class TaskArchivalUseCase:
+    def __init__(
+        self,
+        tasks: TaskRepository,
+        tx: TransactionManager,
+        retention: timedelta,
+    ) -> None:
+        self._tasks = tasks
+        self._tx = tx
+        self._retention = retention
+
+    async def archive_batch(self, limit: int) -> int:
+        before = datetime.now(UTC) - self._retention
+        moved = await self._tasks.archive_finished(before, limit)
+        await self._tx.commit()
+        return moved
+
+
+class TaskWatchUseCase:
+    def __init__(
+        self,
+        tasks: TaskRepository,
+        tx: TransactionManager,
+        events: TaskEventStream,
+    ) -> None:
+        self._tasks = tasks
+        self._tx = tx
+        self._events = events
+
+    async def wait_for_task(self, task_id: int, *, timeout: float) -> Task:
+        async with self._events.subscribe(task_id) as updates:
+            task = await self._load(task_id)
+            with suppress(TimeoutError):
+                async with asyncio.timeout(timeout):
+                    while not task.status.is_terminal:
+                        task = _newer(task, await updates.get())
+            return task
+
+    async def watch_task(
+        self, task_id: int, *, idle_seconds: float
+    ) -> AsyncIterator[Task | None]:
+        async with self._events.subscribe(task_id) as updates:
+            task = await self._load(task_id)
+            yield task
+            while not task.status.is_terminal:
+                try:
+                    async with asyncio.timeout(idle_seconds):
+                        update = await updates.get()
+                except TimeoutError:
+                    yield None
+                    continue
+                if _newer(task, update) is update:
+                    task = update
+                    yield task
+
+    async def _load(self, task_id: int) -> Task:
+        # Read past the cache: an update published before we subscribed would
+        # otherwise be lost behind a stale cached status.
+        task = await self._tasks.get(task_id)
+        if task is None:
+            task = await self._tasks.get_archived(task_id)
+        # Waiting can take a while; do not hold a pooled connection meanwhile.
+        await self._tx.commit()
+        if task is None:
+            raise TaskNotFoundError(f"task {task_id} not found")
+        return task
+
+
+def _newer(current: Task, update: Task) -> Task:
+    return update if update.updated_at > current.updated_at else current
 
 
 class TaskProcessingUseCase:
@@ -60,26 +410,189 @@ class TaskProcessingUseCase:
         self,
         tasks: TaskRepository,
         tx: TransactionManager,
-        processing_delay_seconds: int = 3,
+        handlers: TaskHandlerRegistry,
+        completer: TaskCompleter | None = None,
+        cache: TaskCache | None = None,
+        events: TaskEventPublisher | None = None,
+        metrics: TaskMetrics | None = None,
+        lease_seconds: float | None = None,
+        heartbeat_seconds: float | None = None,
     ) -> None:
         self._tasks = tasks
         self._tx = tx
-        self._processing_delay_seconds = processing_delay_seconds
+        self._handlers = handlers
+        self._completer = completer
+        self._cache = cache
+        self._events = events
+        self._metrics = metrics
+        self._lease = timedelta(seconds=lease_seconds) if lease_seconds else None
+        self._heartbeat_seconds = heartbeat_seconds
 
     async def process_task(self, task_id: int) -> Task | None:
-        task = await self._tasks.claim_for_processing(task_id)
+        task = await self._tasks.claim_for_processing(task_id, lease=self._lease)
         await self._tx.commit()
 
         if task is None:
             return None
+        claimed_at = self._observe_claimed([task])
+        await self._publish([task])
 
-        try:
-            await asyncio.sleep(self._processing_delay_seconds)
-            status, result = resolve_task_result(task.title)
-        except Exception:
-            status, result = TaskStatus.FAILED, "error"
+        async with self._heartbeat([task]):
+            status, result = await self._execute(task)
 
-        updated_task = await self._tasks.complete(task_id, status=status, result=result)
-        await self._tx.commit()
+        if self._completer is not None:
+            updated_task = await self._completer.complete(
+                task_id, attempt=task.attempt, status=status, result=result
+            )
+        else:
+            updated_task = await self._tasks.complete(
+                task_id, attempt=task.attempt, status=status, result=result
+            )
+            await self._tx.commit()
 
+        if updated_task is not None:
+            self._observe_completed(claimed_at, [updated_task])
+            await self._remember([updated_task])
+            await self._publish([updated_task])
         return updated_task
+
+    async def process_batch(
+        self, limit: int, priority: TaskPriority | None = None
+    ) -> list[Task]:
+        tasks = await self._tasks.claim_batch(
+            limit, lease=self._lease, priority=priority
+        )
+        await self._tx.commit()
+
+        if not tasks:
+            return []
+        claimed_at = self._observe_claimed(tasks)
+        await self._publish(tasks)
+
+        if self._completer is not None:
+            async with self._heartbeat(tasks):
+                completed = await asyncio.gather(
+                    *(
+                        self._execute_and_complete(self._completer, task)
+                        for task in tasks
+                    )
+                )
+            updated_tasks = [task for task in completed if task is not None]
+            self._observe_completed(claimed_at, updated_tasks)
+            await self._remember(updated_tasks)
+            await self._publish(updated_tasks)
+            return updated_tasks
+
+        async with self._heartbeat(tasks):
+            outcomes = await asyncio.gather(*(self._execute(task) for task in tasks))
+
+        updated_tasks = await self._tasks.complete_many(
+            [
+                TaskCompletion(
+                    task_id=task.id, attempt=task.attempt, status=status, result=result
+                )
+                for task, (status, result) in zip(tasks, outcomes, strict=True)
+                if task.id is not None
+            ]
+        )
+        await self._tx.commit()
+
+        self._observe_completed(claimed_at, updated_tasks)
+        await self._remember(updated_tasks)
+        await self._publish(updated_tasks)
+        return updated_tasks
+
+    @asynccontextmanager
+    async def _heartbeat(self, tasks: Sequence[Task]) -> AsyncIterator[None]:
+        if self._lease is None or self._heartbeat_seconds is None:
+            yield
+            return
+
+        stop = asyncio.Event()
+        beat = asyncio.create_task(
+            self._keep_leases(
+                [
+                    TaskClaim(task_id=task.id, attempt=task.attempt)
+                    for task in tasks
+                    if task.id is not None
+                ],
+                self._lease,
+                self._heartbeat_seconds,
+                stop,
+            )
+        )
+        try:
+            yield
+        finally:
+            # Let an in-flight extension finish; the session is reused next.
+            stop.set()
+            await beat
+
+    async def _keep_leases(
+        self,
+        claims: list[TaskClaim],
+        lease: timedelta,
+        interval: float,
+        stop: asyncio.Event,
+    ) -> None:
+        while claims:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(stop.wait(), interval)
+            if stop.is_set():
+                return
+            try:
+                held = set(await self._tasks.extend_leases(claims, lease))
+                await self._tx.commit()
+            except Exception:
+                await self._tx.rollback()
+                logger.warning("failed to extend task leases", exc_info=True)
+                continue
+            # Finished, reclaimed or re-claimed tasks are no longer ours.
+            claims = [claim for claim in claims if claim.task_id in held]
+
+    def _observe_claimed(self, claimed: Sequence[Task]) -> dict[int | None, datetime]:
+        # Completion may update the same instances, so keep the claim times.
+        claimed_at = {task.id: task.updated_at for task in claimed}
+        if self._metrics is not None:
+            for task in claimed:
+                waited = (task.updated_at - task.created_at).total_seconds()
+                self._metrics.observe_queue_wait(task.task_type, task.priority, waited)
+        return claimed_at
+
+    def _observe_completed(
+        self, claimed_at: dict[int | None, datetime], completed: Sequence[Task]
+    ) -> None:
+        if self._metrics is None:
+            return
+        for task in completed:
+            started = claimed_at.get(task.id)
+            if started is not None:
+                self._metrics.observe_processing(
+                    task.task_type,
+                    task.status,
+                    (task.updated_at - started).total_seconds(),
+                )
+
+    async def _remember(self, tasks: Sequence[Task]) -> None:
+        if self._cache is not None and tasks:
+            await self._cache.put_many(tasks)
+
+    async def _publish(self, tasks: Sequence[Task]) -> None:
+        if self._events is not None and tasks:
+            await self._events.publish_many(tasks)
+
+    async def _execute_and_complete(
+        self, completer: TaskCompleter, task: Task
+    ) -> Task | None:
+        if task.id is None:
+            return None
+        status, result = await self._execute(task)
+        return await completer.complete(
+            task.id, attempt=task.attempt, status=status, result=result
+        )
+
+    async def _execute(self, task: Task) -> tuple[TaskStatus, str]:
+        try:
+            return await self._handlers.execute(task)
+        except Exception:  # noqa: BLE001 - any handler failure fails the task
+            return TaskStatus.FAILED, "error"
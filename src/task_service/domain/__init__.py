@@ -1,4 +1,15 @@
-from task_service.domain.entities import Task, TaskStatus
+from task_service.domain.entities import (
+    DEFAULT_TASK_TYPE,
+    Task,
+    TaskPriority,
+    TaskStatus,
+)
 from task_service.domain.services import resolve_task_result
 
-__all__ = ["Task", "TaskStatus", "resolve_task_result"]
+__all__ = [
+    "DEFAULT_TASK_TYPE",
+    "Task",
+    "TaskPriority",
+    "TaskStatus",
+    "resolve_task_result",
+]
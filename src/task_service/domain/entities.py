@@ -2,6 +2,14 @@ from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import StrEnum
 
+DEFAULT_TASK_TYPE = "default"
+
+
+class TaskPriority(StrEnum):
+    HIGH = "high"
+    NORMAL = "normal"
+    LOW = "low"
+
 
 class TaskStatus(StrEnum):
     NEW = "new"
@@ -9,6 +17,10 @@ class TaskStatus(StrEnum):
     DONE = "done"
     FAILED = "failed"
 
+    @property
+    def is_terminal(self) -> bool:
+        return self in (TaskStatus.DONE, TaskStatus.FAILED)
+
 
 @dataclass
 class Task:
@@ -18,13 +30,31 @@ class Task:
     result: str | None = None
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    task_type: str = DEFAULT_TASK_TYPE
+    priority: TaskPriority = TaskPriority.NORMAL
+    lease_expires_at: datetime | None = None
+    idempotency_key: str | None = None
+    # Bumped by every claim, so a worker whose lease was reclaimed and handed
+    # to another worker can no longer extend or complete the task.
+    attempt: int = 0
 
     @classmethod
-    def create(cls, title: str) -> "Task":
+    def create(
+        cls,
+        title: str,
+        task_type: str = DEFAULT_TASK_TYPE,
+        priority: TaskPriority = TaskPriority.NORMAL,
+        idempotency_key: str | None = None,
+    ) -> "Task":
         cleaned_title = title.strip()
         if not cleaned_title:
             raise ValueError("title must not be empty")
-        return cls(title=cleaned_title)
+        return cls(
+            title=cleaned_title,
+            task_type=task_type,
+            priority=priority,
+            idempotency_key=idempotency_key,
+        )
 
     def mark_processing(self) -> None:
         self.status = TaskStatus.PROCESSING
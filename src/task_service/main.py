@@ -1,23 +1,33 @@
 from contextlib import asynccontextmanager
 
-from dishka.integrations.fastapi import setup_dishka
+from dishka import AsyncContainer
+from dishka.integrations.fastapi import (
+    ContainerMiddleware,
+    FastapiProvider,
+    setup_dishka,
+)
 from fastapi import FastAPI
 
 from task_service.adapters.config import get_settings
-from task_service.presentation import router as tasks_router
+from task_service.presentation.api import router as tasks_router
+from task_service.presentation.api.metrics import (
+    RequestMetricsMiddleware,
+    create_metrics_app,
+)
 from task_service.setup import close_container, create_container
 
 
-def create_app() -> FastAPI:
-    settings = get_settings()
-    container = create_container(settings)
-
+def create_app(container: AsyncContainer | None = None) -> FastAPI:
     @asynccontextmanager
-    async def lifespan(_: FastAPI):
+    async def lifespan(app: FastAPI):
+        if container is None:
+            app.state.dishka_container = create_container(
+                get_settings(), FastapiProvider()
+            )
         try:
             yield
         finally:
-            await close_container(container)
+            await close_container(app.state.dishka_container)
 
     app = FastAPI(title="Mini Task Service", lifespan=lifespan)
 
@@ -26,8 +36,11 @@ def create_app() -> FastAPI:
         return {"status": "ok"}
 
     app.include_router(tasks_router)
-    setup_dishka(container, app)
+    app.mount("/metrics", create_metrics_app())
+    app.add_middleware(RequestMetricsMiddleware)
+    if container is None:
+        # The container is built on startup, see lifespan.
+        app.add_middleware(ContainerMiddleware)
+    else:
+        setup_dishka(container, app)
     return app
-
-
-app = create_app()
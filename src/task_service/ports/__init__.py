@@ -1,5 +1,31 @@
+from task_service.ports.caches import IdempotencyKeyCache, TaskCache
+from task_service.ports.events import TaskEventPublisher, TaskEventStream
+from task_service.ports.metrics import TaskMetrics
+from task_service.ports.outbox import TaskOutbox
+from task_service.ports.pagination import TaskCursor
 from task_service.ports.queues import TaskQueue
-from task_service.ports.repositories import TaskRepository
+from task_service.ports.repositories import (
+    TaskClaim,
+    TaskCompleter,
+    TaskCompletion,
+    TaskRepository,
+    TaskTimeFilter,
+)
 from task_service.ports.transactions import TransactionManager
 
-__all__ = ["TaskQueue", "TaskRepository", "TransactionManager"]
+__all__ = [
+    "IdempotencyKeyCache",
+    "TaskCache",
+    "TaskClaim",
+    "TaskCompleter",
+    "TaskCompletion",
+    "TaskCursor",
+    "TaskEventPublisher",
+    "TaskEventStream",
+    "TaskMetrics",
+    "TaskOutbox",
+    "TaskQueue",
+    "TaskRepository",
+    "TaskTimeFilter",
+    "TransactionManager",
+]
@@ -0,0 +1,16 @@
+from collections.abc import Sequence
+from typing import Protocol
+
+from task_service.domain import Task
+
+
+class TaskCache(Protocol):
+    async def get(self, task_id: int) -> Task | None: ...
+
+    async def put_many(self, tasks: Sequence[Task]) -> None: ...
+
+
+class IdempotencyKeyCache(Protocol):
+    async def get(self, key: str) -> Task | None: ...
+
+    async def put(self, key: str, task: Task) -> None: ...
@@ -0,0 +1,16 @@
+import asyncio
+from collections.abc import Sequence
+from contextlib import AbstractAsyncContextManager
+from typing import Protocol
+
+from task_service.domain import Task
+
+
+class TaskEventPublisher(Protocol):
+    async def publish_many(self, tasks: Sequence[Task]) -> None: ...
+
+
+class TaskEventStream(Protocol):
+    def subscribe(
+        self, task_id: int
+    ) -> AbstractAsyncContextManager[asyncio.Queue[Task]]: ...
@@ -0,0 +1,13 @@
+from typing import Protocol
+
+from task_service.domain import TaskPriority, TaskStatus
+
+
+class TaskMetrics(Protocol):
+    def observe_queue_wait(
+        self, task_type: str, priority: TaskPriority, seconds: float
+    ) -> None: ...
+
+    def observe_processing(
+        self, task_type: str, status: TaskStatus, seconds: float
+    ) -> None: ...
@@ -0,0 +1,7 @@
+from typing import Protocol
+
+from task_service.domain import TaskPriority
+
+
+class TaskOutbox(Protocol):
+    async def take(self, limit: int) -> dict[TaskPriority, list[int]]: ...
@@ -1,5 +1,14 @@
+from collections.abc import Sequence
 from typing import Protocol
 
+from task_service.domain import TaskPriority
+
 
 class TaskQueue(Protocol):
-    async def enqueue(self, task_id: int) -> None: ...
+    async def enqueue(
+        self, task_id: int, priority: TaskPriority = TaskPriority.NORMAL
+    ) -> None: ...
+
+    async def enqueue_many(
+        self, task_ids: Sequence[int], priority: TaskPriority = TaskPriority.NORMAL
+    ) -> None: ...
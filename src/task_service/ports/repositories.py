@@ -1,19 +1,120 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from typing import Protocol
 
-from task_service.domain import Task, TaskStatus
+from task_service.domain import Task, TaskPriority, TaskStatus
+from task_service.ports.pagination import TaskCursor
+
+
+@dataclass(frozen=True, slots=True)
+class TaskClaim:
+    task_id: int
+    attempt: int
+
+
+@dataclass(frozen=True, slots=True)
+class TaskCompletion:
+    task_id: int
+    attempt: int
+    status: TaskStatus
+    result: str
+
+
+@dataclass(frozen=True, slots=True)
+class TaskTimeFilter:
+    created_after: datetime | None = None
+    created_before: datetime | None = None
+    updated_after: datetime | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        return (
+            self.created_after is None
+            and self.created_before is None
+            and self.updated_after is None
+        )
+
+
+class TaskCompleter(Protocol):
+    async def complete(
+        self, task_id: int, *, attempt: int, status: TaskStatus, result: str
+    ) -> Task | None: ...
 
 
 class TaskRepository(Protocol):
     async def add(self, task: Task) -> Task: ...
 
+    async def add_many(self, tasks: Sequence[Task]) -> list[Task]: ...
+
+    async def add_idempotent(self, task: Task) -> Task | None: ...
+
+    async def flush_counts(self) -> None: ...
+
+    async def get_by_idempotency_key(self, key: str) -> Task | None: ...
+
+    async def claim_batch(
+        self,
+        limit: int,
+        *,
+        lease: timedelta | None = None,
+        priority: TaskPriority | None = None,
+    ) -> list[Task]: ...
+
+    async def extend_leases(
+        self, claims: Sequence[TaskClaim], lease: timedelta
+    ) -> list[int]: ...
+
+    async def reclaim_expired(self, limit: int) -> list[Task]: ...
+
+    async def complete_many(
+        self, completions: Sequence[TaskCompletion]
+    ) -> list[Task]: ...
+
     async def get(self, task_id: int) -> Task | None: ...
 
+    async def get_many(
+        self, task_ids: Sequence[int], *, include_archive: bool = False
+    ) -> list[Task]: ...
+
+    async def get_archived(self, task_id: int) -> Task | None: ...
+
+    async def archive_finished(self, before: datetime, limit: int) -> int: ...
+
+    async def list_after(
+        self,
+        *,
+        status: TaskStatus | None,
+        cursor: TaskCursor | None,
+        size: int,
+        period: TaskTimeFilter | None = None,
+        include_archive: bool = False,
+    ) -> list[Task]: ...
+
     async def list(
-        self, *, status: TaskStatus | None, page: int, size: int
+        self,
+        *,
+        status: TaskStatus | None,
+        page: int,
+        size: int,
+        estimate_total: bool = False,
+        period: TaskTimeFilter | None = None,
+        include_archive: bool = False,
     ) -> tuple[list[Task], int]: ...
 
-    async def claim_for_processing(self, task_id: int) -> Task | None: ...
+    async def count(
+        self,
+        *,
+        status: TaskStatus | None,
+        estimated: bool = False,
+        period: TaskTimeFilter | None = None,
+        include_archive: bool = False,
+    ) -> int: ...
+
+    async def claim_for_processing(
+        self, task_id: int, *, lease: timedelta | None = None
+    ) -> Task | None: ...
 
     async def complete(
-        self, task_id: int, *, status: TaskStatus, result: str
+        self, task_id: int, *, attempt: int, status: TaskStatus, result: str
     ) -> Task | None: ...
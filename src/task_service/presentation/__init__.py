@@ -1,3 +0,0 @@
-from task_service.presentation.api.handlers import router
-
-__all__ = ["router"]
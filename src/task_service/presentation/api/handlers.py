@@ -1,20 +1,48 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+
 from dishka.integrations.fastapi import FromDishka, inject
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Header, HTTPException, Query, status
+from fastapi.responses import Response, StreamingResponse
 
+from task_service.adapters.config import EventsConfig
 from task_service.app import (
+    IdempotencyKeyReusedError,
+    InvalidCursorError,
+    InvalidTaskBatchError,
     InvalidTaskTitleError,
     QueueUnavailableError,
+    ReadConsistency,
     TaskCommandUseCase,
     TaskNotFoundError,
     TaskQueryUseCase,
+    TaskWatchUseCase,
+    UnknownTaskTypeError,
 )
-from task_service.domain import TaskStatus
+from task_service.app.pagination import encode_cursor
+from task_service.domain import Task, TaskStatus
+from task_service.ports import TaskTimeFilter
 from task_service.presentation.api.schemas import (
+    TASK_CURSOR_PAGE_INCLUDE,
+    TASK_LIST_INCLUDE,
+    TASK_LOOKUP_INCLUDE,
+    TaskBatchCreateRequest,
+    TaskBatchResponse,
     TaskCreateRequest,
+    TaskCursorPageResponse,
     TaskListResponse,
+    TaskLookupRequest,
+    TaskLookupResponse,
     TaskResponse,
+    task_cursor_page_adapter,
+    task_list_adapter,
+    task_lookup_adapter,
 )
 
+MAX_WAIT_SECONDS = 60
+CONSISTENCY_HEADER = "X-Read-Consistency"
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
 
@@ -23,10 +51,19 @@ router = APIRouter(prefix="/tasks", tags=["tasks"])
 async def create_task(
     payload: TaskCreateRequest,
     commands: FromDishka[TaskCommandUseCase],
+    idempotency_key: str | None = Header(
+        default=None, alias=IDEMPOTENCY_HEADER, min_length=1, max_length=255
+    ),
 ) -> TaskResponse:
     try:
-        task = await commands.create_task(payload.title)
-    except InvalidTaskTitleError as exc:
+        task = await commands.create_task(
+            payload.title, payload.task_type, payload.priority, idempotency_key
+        )
+    except (
+        InvalidTaskTitleError,
+        UnknownTaskTypeError,
+        IdempotencyKeyReusedError,
+    ) as exc:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
         ) from exc
@@ -39,20 +76,115 @@ async def create_task(
     return TaskResponse.model_validate(task)
 
 
-@router.get("/", response_model=TaskListResponse)
+@router.post(
+    "/batch", response_model=TaskBatchResponse, status_code=status.HTTP_201_CREATED
+)
+@inject
+async def create_tasks(
+    payload: TaskBatchCreateRequest,
+    commands: FromDishka[TaskCommandUseCase],
+) -> TaskBatchResponse:
+    try:
+        tasks = await commands.create_tasks(
+            [item.title for item in payload.tasks],
+            [item.task_type for item in payload.tasks],
+            [item.priority for item in payload.tasks],
+        )
+    except InvalidTaskBatchError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=[
+                {"index": index, "error": error}
+                for index, error in sorted(exc.errors.items())
+            ],
+        ) from exc
+    except QueueUnavailableError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(exc),
+        ) from exc
+
+    return TaskBatchResponse(
+        items=[TaskResponse.model_validate(task) for task in tasks]
+    )
+
+
+@router.post("/lookup", response_model=TaskLookupResponse)
+@inject
+async def lookup_tasks(
+    payload: TaskLookupRequest,
+    commands: FromDishka[TaskQueryUseCase],
+    consistency: ReadConsistency = Header(default="eventual", alias=CONSISTENCY_HEADER),
+) -> Response:
+    items, missing = await commands.get_tasks(payload.ids, consistency=consistency)
+    return _json_response(
+        task_lookup_adapter.dump_json(
+            {"items": items, "missing": missing}, include=TASK_LOOKUP_INCLUDE
+        )
+    )
+
+
+@router.get("/", response_model=TaskListResponse | TaskCursorPageResponse)
 @inject
 async def list_tasks(
     commands: FromDishka[TaskQueryUseCase],
     status_filter: TaskStatus | None = Query(default=None, alias="status"),
     page: int = Query(default=1, ge=1),
     size: int = Query(default=10, ge=1, le=100),
-) -> TaskListResponse:
-    items, total = await commands.list_tasks(status=status_filter, page=page, size=size)
-    return TaskListResponse(
-        items=[TaskResponse.model_validate(item) for item in items],
-        total=total,
+    cursor: str | None = Query(default=None),
+    estimate_total: bool = Query(default=False),
+    created_after: datetime | None = Query(default=None),
+    created_before: datetime | None = Query(default=None),
+    updated_after: datetime | None = Query(default=None),
+    consistency: ReadConsistency = Header(default="eventual", alias=CONSISTENCY_HEADER),
+) -> Response:
+    period = TaskTimeFilter(
+        created_after=created_after,
+        created_before=created_before,
+        updated_after=updated_after,
+    )
+    if cursor is not None:
+        try:
+            items, next_cursor = await commands.list_tasks_after(
+                status=status_filter,
+                cursor=cursor,
+                size=size,
+                period=period,
+                consistency=consistency,
+            )
+        except InvalidCursorError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
+            ) from exc
+
+        return _json_response(
+            task_cursor_page_adapter.dump_json(
+                {"items": items, "size": size, "next_cursor": next_cursor},
+                include=TASK_CURSOR_PAGE_INCLUDE,
+            )
+        )
+
+    items, total = await commands.list_tasks(
+        status=status_filter,
         page=page,
         size=size,
+        estimate_total=estimate_total,
+        period=period,
+        consistency=consistency,
+    )
+    return _json_response(
+        task_list_adapter.dump_json(
+            {
+                "items": items,
+                "page": page,
+                "size": size,
+                "total": total,
+                "next_cursor": (
+                    encode_cursor(items[-1]) if items and page * size < total else None
+                ),
+            },
+            include=TASK_LIST_INCLUDE,
+        )
     )
 
 
@@ -61,12 +193,59 @@ async def list_tasks(
 async def get_task(
     task_id: int,
     commands: FromDishka[TaskQueryUseCase],
+    watcher: FromDishka[TaskWatchUseCase],
+    wait: float | None = Query(default=None, gt=0, le=MAX_WAIT_SECONDS),
+    consistency: ReadConsistency = Header(default="eventual", alias=CONSISTENCY_HEADER),
 ) -> TaskResponse:
     try:
-        task = await commands.get_task(task_id)
+        if wait is None:
+            task = await commands.get_task(task_id, consistency=consistency)
+        else:
+            task = await watcher.wait_for_task(task_id, timeout=wait)
     except TaskNotFoundError as exc:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)
         ) from exc
 
     return TaskResponse.model_validate(task)
+
+
+@router.get("/{task_id}/events", response_class=StreamingResponse)
+@inject
+async def stream_task_events(
+    task_id: int,
+    watcher: FromDishka[TaskWatchUseCase],
+    events_settings: FromDishka[EventsConfig],
+) -> StreamingResponse:
+    updates = watcher.watch_task(
+        task_id, idle_seconds=events_settings.heartbeat_seconds
+    )
+    try:
+        first = await anext(updates)
+    except TaskNotFoundError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)
+        ) from exc
+
+    return StreamingResponse(
+        _server_sent_events(first, updates),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _server_sent_events(
+    first: Task, updates: AsyncIterator[Task | None]
+) -> AsyncIterator[str]:
+    yield _task_event(first)
+    async for task in updates:
+        yield ": keep-alive\n\n" if task is None else _task_event(task)
+
+
+def _json_response(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
+
+def _task_event(task: Task) -> str:
+    payload = TaskResponse.model_validate(task).model_dump_json()
+    return f"event: task\ndata: {payload}\n\n"
@@ -0,0 +1,73 @@
+import logging
+from time import perf_counter
+
+from dishka import AsyncContainer
+from prometheus_client import Histogram, make_asgi_app
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from task_service.adapters.metrics import HTTP_REQUEST_SECONDS, TASKS_BY_STATUS
+from task_service.app import TaskQueryUseCase
+
+logger = logging.getLogger(__name__)
+
+
+class RequestMetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        # labels() takes a lock and builds a key; keep the children at hand.
+        self._histograms: dict[tuple[str, str, int], Histogram] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = perf_counter()
+        observed = False
+
+        def observe(status: int) -> None:
+            nonlocal observed
+            observed = True
+            route: BaseRoute | None = scope.get("route")
+            key = (scope["method"], getattr(route, "path", "unmatched"), status)
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = HTTP_REQUEST_SECONDS.labels(key[0], key[1], str(status))
+                self._histograms[key] = histogram
+            histogram.observe(perf_counter() - started)
+
+        async def send_with_metrics(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                observe(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            if not observed:
+                observe(500)
+
+
+def create_metrics_app() -> ASGIApp:
+    exporter = make_asgi_app()
+
+    async def metrics_app(scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            await _refresh_status_counts(scope["app"].state.dishka_container)
+        await exporter(scope, receive, send)
+
+    return metrics_app
+
+
+async def _refresh_status_counts(container: AsyncContainer) -> None:
+    try:
+        async with container() as request_container:
+            queries = await request_container.get(TaskQueryUseCase)
+            counts = await queries.count_by_status()
+    except Exception:
+        logger.warning("failed to refresh task status counts", exc_info=True)
+        return
+
+    for status, count in counts.items():
+        TASKS_BY_STATUS.labels(status.value).set(count)
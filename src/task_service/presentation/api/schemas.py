@@ -1,12 +1,23 @@
 from datetime import datetime
+from typing import Any, TypedDict
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
-from task_service.domain import TaskStatus
+from task_service.domain import DEFAULT_TASK_TYPE, Task, TaskPriority, TaskStatus
 
 
 class TaskCreateRequest(BaseModel):
     title: str = Field(min_length=1, max_length=255)
+    task_type: str = Field(default=DEFAULT_TASK_TYPE, min_length=1, max_length=64)
+    priority: TaskPriority = TaskPriority.NORMAL
+
+
+class TaskBatchCreateRequest(BaseModel):
+    tasks: list[TaskCreateRequest] = Field(min_length=1, max_length=1000)
+
+
+class TaskLookupRequest(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=1000)
 
 
 class TaskResponse(BaseModel):
@@ -14,6 +25,8 @@ class TaskResponse(BaseModel):
 
     id: int
     title: str
+    task_type: str
+    priority: TaskPriority
     status: TaskStatus
     result: str | None
     created_at: datetime
@@ -27,3 +40,55 @@ class TaskListResponse(BaseModel):
     page: int
     size: int
     total: int
+    next_cursor: str | None = None
+
+
+class TaskCursorPageResponse(BaseModel):
+    items: list[TaskResponse]
+    size: int
+    next_cursor: str | None
+
+
+class TaskBatchResponse(BaseModel):
+    items: list[TaskResponse]
+
+
+class TaskLookupResponse(BaseModel):
+    items: list[TaskResponse]
+    missing: list[int]
+
+
+class TaskListPayload(TypedDict):
+    items: list[Task]
+    page: int
+    size: int
+    total: int
+    next_cursor: str | None
+
+
+class TaskCursorPagePayload(TypedDict):
+    items: list[Task]
+    size: int
+    next_cursor: str | None
+
+
+class TaskLookupPayload(TypedDict):
+    items: list[Task]
+    missing: list[int]
+
+
+def _task_response_include(payload: type) -> dict[str, Any]:
+    # Items are Task dataclasses; only documented TaskResponse fields go out,
+    # so new domain fields never leak into the response body.
+    return {key: True for key in payload.__annotations__} | {
+        "items": {"__all__": set(TaskResponse.model_fields)}
+    }
+
+
+TASK_LIST_INCLUDE = _task_response_include(TaskListPayload)
+TASK_CURSOR_PAGE_INCLUDE = _task_response_include(TaskCursorPagePayload)
+TASK_LOOKUP_INCLUDE = _task_response_include(TaskLookupPayload)
+
+task_list_adapter = TypeAdapter(TaskListPayload)
+task_cursor_page_adapter = TypeAdapter(TaskCursorPagePayload)
+task_lookup_adapter = TypeAdapter(TaskLookupPayload)
@@ -0,0 +1,53 @@
+import asyncio
+import logging
+import signal
+from contextlib import suppress
+
+from task_service.adapters.config import Settings, get_settings
+from task_service.adapters.metrics import TASKS_ARCHIVED
+from task_service.app import TaskArchivalUseCase
+from task_service.setup import close_container, create_container
+
+logger = logging.getLogger(__name__)
+
+
+async def run_archiver(settings: Settings) -> None:
+    container = create_container(settings)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+
+    batch_size = settings.tasks.archive_batch_size
+    try:
+        while not stop.is_set():
+            try:
+                async with container() as request_container:
+                    archival = await request_container.get(TaskArchivalUseCase)
+                    moved = await archival.archive_batch(batch_size)
+            except Exception:
+                logger.exception("failed to archive finished tasks")
+                moved = 0
+
+            if moved:
+                TASKS_ARCHIVED.inc(moved)
+                logger.info("archived %s finished tasks", moved)
+            # Short transactions back to back drain a backlog without holding
+            # locks on the hot table for long.
+            if moved < batch_size:
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        stop.wait(), settings.tasks.archive_interval_seconds
+                    )
+    finally:
+        await close_container(container)
+
+
+def main() -> None:
+    settings = get_settings()
+    logging.basicConfig(level=settings.log_level_int)
+    asyncio.run(run_archiver(settings))
+
+
+if __name__ == "__main__":
+    main()
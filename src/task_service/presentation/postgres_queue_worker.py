@@ -0,0 +1,100 @@
+import asyncio
+import logging
+import signal
+from contextlib import suppress
+from itertools import cycle
+from typing import Any
+
+import asyncpg
+from dishka import AsyncContainer
+
+from task_service.adapters.config import Settings
+from task_service.adapters.metrics import start_metrics_server
+from task_service.app import TaskProcessingUseCase, weighted_rotation
+from task_service.presentation.reaper import reap_expired_leases
+from task_service.setup import close_container, create_container
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresQueueWorker:
+    def __init__(self, container: AsyncContainer, settings: Settings) -> None:
+        self._container = container
+        self._settings = settings
+        self._wakeup = asyncio.Event()
+        # Shared by all consumers so the weights hold across the whole worker.
+        self._rotation = cycle(
+            weighted_rotation(settings.tasks.priority_weights.as_dict())
+        )
+
+    async def run(self, stop: asyncio.Event) -> None:
+        tasks_config = self._settings.tasks
+        connection = await asyncpg.connect(
+            self._settings.database.pure_dsn.get_secret_value()
+        )
+        try:
+            await connection.add_listener(tasks_config.notify_channel, self._on_notify)
+            consumers = [
+                asyncio.create_task(self._consume(stop))
+                for _ in range(tasks_config.postgres_consumers)
+            ]
+            if tasks_config.reaper_enabled:
+                consumers.append(
+                    asyncio.create_task(
+                        reap_expired_leases(self._container, tasks_config, stop)
+                    )
+                )
+            await stop.wait()
+            self._wakeup.set()
+            await asyncio.gather(*consumers)
+        finally:
+            await connection.close()
+
+    def _on_notify(self, *_: Any) -> None:
+        self._wakeup.set()
+
+    async def _consume(self, stop: asyncio.Event) -> None:
+        poll_interval = self._settings.tasks.postgres_poll_interval_seconds
+        while not stop.is_set():
+            if await self._process_batch():
+                continue
+
+            self._wakeup.clear()
+            # A notification may have arrived between the empty claim and
+            # clear(), so look once more before going to sleep.
+            if await self._process_batch():
+                continue
+
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), poll_interval)
+
+    async def _process_batch(self) -> bool:
+        priorities = next(self._rotation)
+        try:
+            async with self._container() as request_container:
+                processor = await request_container.get(TaskProcessingUseCase)
+                # Fall through to the next priority when this turn's is empty.
+                for priority in priorities:
+                    if await processor.process_batch(
+                        self._settings.tasks.claim_batch_size, priority
+                    ):
+                        return True
+        except Exception:
+            logger.exception("failed to process task batch")
+        return False
+
+
+async def run_postgres_worker(settings: Settings) -> None:
+    container = create_container(settings)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+
+    if settings.tasks.worker_metrics_port is not None:
+        start_metrics_server(settings.tasks.worker_metrics_port)
+
+    try:
+        await PostgresQueueWorker(container, settings).run(stop)
+    finally:
+        await close_container(container)
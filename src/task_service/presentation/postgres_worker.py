@@ -0,0 +1,25 @@
+import asyncio
+import logging
+import os
+from tempfile import mkdtemp
+
+from task_service.adapters.config import get_settings
+
+
+def main() -> None:
+    settings = get_settings()
+    logging.basicConfig(level=settings.log_level_int)
+    if settings.tasks.worker_metrics_port is not None:
+        # Same file-backed registry as the taskiq worker. prometheus_client
+        # picks its backend on import, so the worker is imported after this.
+        os.environ.setdefault(
+            "PROMETHEUS_MULTIPROC_DIR", mkdtemp(prefix="task_worker_metrics_")
+        )
+
+    from task_service.presentation.postgres_queue_worker import run_postgres_worker
+
+    asyncio.run(run_postgres_worker(settings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+import asyncio
+import logging
+from contextlib import suppress
+
+from dishka import AsyncContainer
+
+from task_service.adapters.config import TasksConfig
+from task_service.adapters.metrics import TASK_LEASES_RECLAIMED
+from task_service.app import LeaseReaperUseCase
+
+logger = logging.getLogger(__name__)
+
+
+async def reap_expired_leases(
+    container: AsyncContainer, task_settings: TasksConfig, stop: asyncio.Event
+) -> None:
+    batch_size = task_settings.reaper_batch_size
+    while not stop.is_set():
+        try:
+            async with container() as request_container:
+                reaper = await request_container.get(LeaseReaperUseCase)
+                reclaimed = await reaper.reclaim_batch(batch_size)
+        except Exception:
+            logger.exception("failed to reclaim expired task leases")
+            reclaimed = 0
+
+        if reclaimed:
+            TASK_LEASES_RECLAIMED.inc(reclaimed)
+            logger.warning("re-queued %s tasks with expired leases", reclaimed)
+        if reclaimed < batch_size:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(
+                    stop.wait(), task_settings.reaper_interval_seconds
+                )
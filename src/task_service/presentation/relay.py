@@ -0,0 +1,55 @@
+import asyncio
+import logging
+import signal
+from contextlib import suppress
+
+from dishka import AsyncContainer
+
+from task_service.adapters.config import Settings, TasksConfig, get_settings
+from task_service.app import OutboxRelayUseCase
+from task_service.setup import close_container, create_container
+
+logger = logging.getLogger(__name__)
+
+
+async def relay_outbox(
+    container: AsyncContainer, task_settings: TasksConfig, stop: asyncio.Event
+) -> None:
+    batch_size = task_settings.outbox_batch_size
+    while not stop.is_set():
+        try:
+            async with container() as request_container:
+                relay = await request_container.get(OutboxRelayUseCase)
+                relayed = await relay.relay_batch(batch_size)
+        except Exception:
+            logger.exception("failed to relay outbox batch")
+            relayed = 0
+
+        if relayed < batch_size:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(
+                    stop.wait(), task_settings.outbox_poll_interval_seconds
+                )
+
+
+async def run_relay(settings: Settings) -> None:
+    container = create_container(settings)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+
+    try:
+        await relay_outbox(container, settings.tasks, stop)
+    finally:
+        await close_container(container)
+
+
+def main() -> None:
+    settings = get_settings()
+    logging.basicConfig(level=settings.log_level_int)
+    asyncio.run(run_relay(settings))
+
+
+if __name__ == "__main__":
+    main()
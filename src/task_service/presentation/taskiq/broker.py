@@ -1,20 +1,49 @@
-from importlib import import_module
-from inspect import signature
-from typing import Any
+import logging
+from collections.abc import AsyncGenerator
+from itertools import cycle
+
+from redis.asyncio import Redis
+from taskiq_redis import ListQueueBroker
 
 from task_service.adapters.config import get_settings
+from task_service.app import weighted_rotation
 
+logger = logging.getLogger(__name__)
 
-def _create_broker() -> Any:
-    ListQueueBroker = getattr(import_module("taskiq_redis"), "ListQueueBroker")
-    settings = get_settings()
-    redis_dsn = settings.redis.dsn.get_secret_value()
-    queue_name = settings.tasks.queue_name
 
-    params = signature(ListQueueBroker).parameters
-    if "queue_name" in params:
-        return ListQueueBroker(redis_dsn, queue_name=queue_name)
-    return ListQueueBroker(redis_dsn)
+class WeightedListQueueBroker(ListQueueBroker):
+    def __init__(
+        self, url: str, queue_name: str, queue_weights: dict[str, int]
+    ) -> None:
+        super().__init__(url, queue_name=queue_name)
+        self.queue_weights = queue_weights
+
+    async def listen(self) -> AsyncGenerator[bytes]:
+        # BRPOP pops from the first non-empty list it is given, so rotating
+        # the key order per message shares the worker by weight while an idle
+        # priority never holds up the others.
+        for queue_names in cycle(weighted_rotation(self.queue_weights)):
+            try:
+                async with Redis(connection_pool=self.connection_pool) as redis_conn:
+                    popped = await redis_conn.brpop(queue_names)
+            except ConnectionError as exc:
+                logger.warning("Redis connection error: %s", exc)
+                continue
+            if popped is not None:
+                yield popped[1]
+
+
+def _create_broker() -> WeightedListQueueBroker:
+    settings = get_settings()
+    tasks = settings.tasks
+    return WeightedListQueueBroker(
+        settings.redis.dsn.get_secret_value(),
+        queue_name=tasks.queue_name,
+        queue_weights={
+            tasks.queue_name_for(priority): weight
+            for priority, weight in tasks.priority_weights.as_dict().items()
+        },
+    )
 
 
 broker = _create_broker()
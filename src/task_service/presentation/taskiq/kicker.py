@@ -0,0 +1,66 @@
+from collections import defaultdict
+from collections.abc import Sequence
+from typing import Any
+
+from redis.asyncio import Redis
+from taskiq import (
+    AsyncBroker,
+    AsyncTaskiqDecoratedTask,
+    TaskiqMessage,
+    TaskiqMiddleware,
+)
+from taskiq.exceptions import SendTaskError
+from taskiq.utils import maybe_awaitable
+from taskiq_redis import ListQueueBroker
+
+
+async def kiq_many(
+    task: AsyncTaskiqDecoratedTask[Any, Any],
+    args: Sequence[tuple[Any, ...]],
+    labels: dict[str, Any] | None = None,
+) -> None:
+    kicker = task.kicker()
+    if labels:
+        kicker = kicker.with_labels(**labels)
+    broker = kicker.broker
+
+    messages = []
+    for call_args in args:
+        # Mirrors AsyncKicker.kiq, which has no public way to build a message
+        # without sending it; taskiq is pinned below the next minor release.
+        message = kicker._prepare_message(*call_args)
+        for middleware in broker.middlewares:
+            if middleware.__class__.pre_send != TaskiqMiddleware.pre_send:
+                message = await maybe_awaitable(middleware.pre_send(message))
+        messages.append(message)
+
+    try:
+        await _push(broker, messages)
+    except Exception as exc:
+        raise SendTaskError from exc
+
+    for message in messages:
+        for middleware in reversed(broker.middlewares):
+            if middleware.__class__.post_send != TaskiqMiddleware.post_send:
+                await maybe_awaitable(middleware.post_send(message))
+
+
+async def _push(broker: AsyncBroker, messages: Sequence[TaskiqMessage]) -> None:
+    if not isinstance(broker, ListQueueBroker):
+        for message in messages:
+            await broker.kick(broker.formatter.dumps(message))
+        return
+
+    by_queue: defaultdict[str, list[bytes]] = defaultdict(list)
+    for message in messages:
+        broker_message = broker.formatter.dumps(message)
+        queue_name = broker_message.labels.get("queue_name") or broker.queue_name
+        by_queue[queue_name].append(broker_message.message)
+
+    async with (
+        Redis(connection_pool=broker.connection_pool) as redis_conn,
+        redis_conn.pipeline(transaction=False) as pipe,
+    ):
+        for queue_name, payloads in by_queue.items():
+            pipe.lpush(queue_name, *payloads)
+        await pipe.execute()
@@ -0,0 +1,27 @@
+from typing import Any
+
+from taskiq import TaskiqMessage, TaskiqMiddleware, TaskiqResult
+
+from task_service.adapters.metrics import (
+    WORKER_SLOT_BUSY_SECONDS,
+    WORKER_SLOTS,
+    WORKER_SLOTS_BUSY,
+)
+
+
+class WorkerSlotsMiddleware(TaskiqMiddleware):
+    def __init__(self, capacity: int) -> None:
+        super().__init__()
+        self._capacity = capacity
+
+    def startup(self) -> None:
+        if self.broker.is_worker_process:
+            WORKER_SLOTS.set(self._capacity)
+
+    def pre_execute(self, message: TaskiqMessage) -> TaskiqMessage:
+        WORKER_SLOTS_BUSY.inc()
+        return message
+
+    def post_execute(self, message: TaskiqMessage, result: TaskiqResult[Any]) -> None:
+        WORKER_SLOTS_BUSY.dec()
+        WORKER_SLOT_BUSY_SECONDS.inc(result.execution_time)
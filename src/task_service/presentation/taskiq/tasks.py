@@ -1,6 +1,8 @@
 from dishka.integrations.taskiq import FromDishka, inject
 
+from task_service.adapters.config import TasksConfig
 from task_service.app import TaskProcessingUseCase
+from task_service.domain import TaskPriority
 from task_service.presentation.taskiq.broker import broker
 
 
@@ -9,5 +11,12 @@ from task_service.presentation.taskiq.broker import broker
 async def process_task_job(
     task_id: int,
     processor: FromDishka[TaskProcessingUseCase],
+    task_settings: FromDishka[TasksConfig],
+    priority: TaskPriority = TaskPriority.NORMAL,
 ) -> None:
+    if task_settings.claim_batch_size > 1:
+        # Claim from the queue this message came from so weights hold.
+        await processor.process_batch(task_settings.claim_batch_size, priority)
+        return
+
     await processor.process_task(task_id)
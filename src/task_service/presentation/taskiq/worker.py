@@ -0,0 +1,35 @@
+import os
+import sys
+from tempfile import mkdtemp
+
+from taskiq.cli.worker.args import WorkerArgs
+from taskiq.cli.worker.run import run_worker
+
+from task_service.adapters.config import get_settings
+
+WORKER_BROKER = "task_service.presentation.taskiq.worker_broker:broker"
+
+
+def main() -> None:
+    task_settings = get_settings().tasks
+    if task_settings.worker_metrics_port is not None:
+        # Worker processes share one metrics port, so they publish through files.
+        os.environ.setdefault(
+            "PROMETHEUS_MULTIPROC_DIR", mkdtemp(prefix="task_worker_metrics_")
+        )
+
+    args = WorkerArgs.from_cli(
+        [
+            WORKER_BROKER,
+            "--max-async-tasks",
+            str(task_settings.max_concurrent_tasks),
+            "--max-prefetch",
+            str(task_settings.prefetch_count),
+            *sys.argv[1:],
+        ]
+    )
+    sys.exit(run_worker(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,63 @@
-from dishka.integrations.taskiq import setup_dishka
+import asyncio
+import logging
+
+from dishka import AsyncContainer
+from dishka.integrations.taskiq import TaskiqProvider, setup_dishka
 from taskiq import TaskiqEvents, TaskiqState
 
-from task_service.adapters.config import get_settings
 import task_service.presentation.taskiq.tasks  # noqa: F401
+from task_service.adapters.config import get_settings
+from task_service.adapters.metrics import start_metrics_server
+from task_service.presentation.reaper import reap_expired_leases
 from task_service.presentation.taskiq.broker import broker
+from task_service.presentation.taskiq.middlewares import WorkerSlotsMiddleware
 from task_service.setup import close_container, create_container
 
-_container = create_container(get_settings())
-setup_dishka(container=_container, broker=broker)
+logger = logging.getLogger(__name__)
+
+_settings = get_settings()
+broker.add_middlewares(WorkerSlotsMiddleware(_settings.tasks.max_concurrent_tasks))
+
+
+@broker.on_event(TaskiqEvents.WORKER_STARTUP)
+async def create_dishka_container(state: TaskiqState) -> None:
+    # Built per worker process on startup rather than when the module is imported.
+    state.dishka_container = create_container(_settings, TaskiqProvider())
+    setup_dishka(container=state.dishka_container, broker=broker)
+
+
+@broker.on_event(TaskiqEvents.WORKER_STARTUP)
+async def start_worker_metrics(_: TaskiqState) -> None:
+    port = _settings.tasks.worker_metrics_port
+    if port is None:
+        return
+    try:
+        start_metrics_server(port)
+    except OSError:
+        # Another worker process of this node already serves the port.
+        logger.debug("metrics port %s is already bound", port)
+
+
+@broker.on_event(TaskiqEvents.WORKER_STARTUP)
+async def start_lease_reaper(state: TaskiqState) -> None:
+    state.reaper_stop = asyncio.Event()
+    state.reaper = None
+    if _settings.tasks.reaper_enabled:
+        state.reaper = asyncio.create_task(
+            reap_expired_leases(
+                state.dishka_container, _settings.tasks, state.reaper_stop
+            )
+        )
+
+
+@broker.on_event(TaskiqEvents.WORKER_SHUTDOWN)
+async def stop_lease_reaper(state: TaskiqState) -> None:
+    state.reaper_stop.set()
+    if state.reaper is not None:
+        await state.reaper
 
 
 @broker.on_event(TaskiqEvents.WORKER_SHUTDOWN)
-async def close_dishka_container(_: TaskiqState) -> None:
-    await close_container(_container)
+async def close_dishka_container(state: TaskiqState) -> None:
+    container: AsyncContainer = state.dishka_container
+    await close_container(container)
@@ -1,24 +1,27 @@
-from dishka import AsyncContainer, make_async_container
-from dishka.integrations.fastapi import FastapiProvider
-from dishka.integrations.taskiq import TaskiqProvider
+from dishka import AsyncContainer, Provider, make_async_container
 
 from task_service.adapters.config import Settings
 from task_service.setup.providers import (
     AppProvider,
+    CacheProvider,
     ConfigProvider,
     DatabaseProvider,
+    EventsProvider,
     QueueProvider,
 )
 
 
-def create_container(settings: Settings) -> AsyncContainer:
+def create_container(settings: Settings, *providers: Provider) -> AsyncContainer:
+    # Framework integrations (FastapiProvider, TaskiqProvider) are passed in by
+    # the process that needs them, so the web process never imports taskiq.
     return make_async_container(
         ConfigProvider(),
         DatabaseProvider(),
         QueueProvider(),
+        CacheProvider(),
+        EventsProvider(),
         AppProvider(),
-        FastapiProvider(),
-        TaskiqProvider(),
+        *providers,
         context={Settings: settings},
     )
 
@@ -0,0 +1,12 @@
+from task_service.adapters.config import TasksConfig
+from task_service.app import TaskHandlerRegistry, simulated_task_handler
+from task_service.domain import DEFAULT_TASK_TYPE
+
+
+def register_task_handlers(
+    handlers: TaskHandlerRegistry, task_settings: TasksConfig
+) -> None:
+    handlers.register(
+        DEFAULT_TASK_TYPE,
+        simulated_task_handler(task_settings.processing_delay_seconds),
+    )
@@ -1,14 +1,88 @@
-from collections.abc import AsyncIterable
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from multiprocessing import get_context
+from typing import NewType
 
-from dishka import AnyOf, Provider, Scope, from_context, provide, provide_all
+from dishka import (
+    AnyOf,
+    AsyncContainer,
+    Provider,
+    Scope,
+    from_context,
+    provide,
+)
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
-from task_service.adapters.config import DatabaseConfig, Settings, TasksConfig
-from task_service.adapters.db import SqlAlchemyTaskRepository, create_engine_from_url
+from task_service.adapters.cache import (
+    LruIdempotencyKeyCache,
+    LruTaskCache,
+    RedisTaskCache,
+    TieredTaskCache,
+)
+from task_service.adapters.config import (
+    CacheConfig,
+    DatabaseConfig,
+    EventsConfig,
+    RedisConfig,
+    Settings,
+    TasksConfig,
+)
+from task_service.adapters.db import (
+    SqlAlchemyCoreTaskRepository,
+    SqlAlchemyTaskOutbox,
+    SqlAlchemyTaskRepository,
+    create_engine_from_url,
+)
 from task_service.adapters.db.mappers import map_all_tables
-from task_service.adapters.queue import TaskiqTaskQueue
-from task_service.app import TaskCommandUseCase, TaskProcessingUseCase, TaskQueryUseCase
-from task_service.ports import TaskQueue, TaskRepository, TransactionManager
+from task_service.adapters.events import (
+    PostgresTaskEventPublisher,
+    PostgresTaskEventSource,
+    RedisTaskEventPublisher,
+    RedisTaskEventSource,
+    TaskEventHub,
+    TaskEventSource,
+)
+from task_service.adapters.metrics import PrometheusTaskMetrics
+from task_service.adapters.queue import PostgresTaskQueue, TaskiqTaskQueue
+from task_service.app import (
+    LeaseReaperUseCase,
+    OutboxRelayUseCase,
+    TaskArchivalUseCase,
+    TaskCommandUseCase,
+    TaskCompletionAggregator,
+    TaskHandlerRegistry,
+    TaskProcessingUseCase,
+    TaskQueryUseCase,
+    TaskWatchUseCase,
+)
+from task_service.domain import TaskPriority
+from task_service.ports import (
+    IdempotencyKeyCache,
+    TaskCache,
+    TaskEventPublisher,
+    TaskEventStream,
+    TaskMetrics,
+    TaskOutbox,
+    TaskQueue,
+    TaskRepository,
+    TransactionManager,
+)
+from task_service.setup.handlers import register_task_handlers
+
+ReplicaEngine = NewType("ReplicaEngine", AsyncEngine)
+ReplicaSession = NewType("ReplicaSession", AsyncSession)
+
+
+def create_task_repository(
+    session: AsyncSession, database: DatabaseConfig
+) -> TaskRepository:
+    if database.repository == "orm":
+        return SqlAlchemyTaskRepository(session)
+    return SqlAlchemyCoreTaskRepository(session)
 
 
 class ConfigProvider(Provider):
@@ -24,17 +98,63 @@ class ConfigProvider(Provider):
     def get_tasks_config(self, settings: Settings) -> TasksConfig:
         return settings.tasks
 
+    @provide(scope=Scope.APP)
+    def get_redis_config(self, settings: Settings) -> RedisConfig:
+        return settings.redis
+
+    @provide(scope=Scope.APP)
+    def get_cache_config(self, settings: Settings) -> CacheConfig:
+        return settings.cache
+
+    @provide(scope=Scope.APP)
+    def get_events_config(self, settings: Settings) -> EventsConfig:
+        return settings.events
+
+
+def create_database_engine(
+    database: DatabaseConfig, dsn: str, name: str
+) -> AsyncEngine:
+    return create_engine_from_url(
+        dsn,
+        name=name,
+        pool_size=database.pool_size,
+        max_overflow=database.max_overflow,
+        pool_timeout=database.pool_timeout_seconds,
+        pool_recycle=database.pool_recycle_seconds or -1,
+        pool_pre_ping=database.pool_pre_ping,
+        statement_cache_size=database.statement_cache_size,
+    )
+
 
 class DatabaseProvider(Provider):
     @provide(scope=Scope.APP)
     async def get_engine(self, database: DatabaseConfig) -> AsyncIterable[AsyncEngine]:
         map_all_tables()
-        engine = create_engine_from_url(database.dsn.get_secret_value())
+        engine = create_database_engine(
+            database, database.dsn.get_secret_value(), "primary"
+        )
         try:
             yield engine
         finally:
             await engine.dispose()
 
+    @provide(scope=Scope.APP)
+    async def get_replica_engine(
+        self, database: DatabaseConfig
+    ) -> AsyncIterable[ReplicaEngine]:
+        replica_dsn = database.replica_dsn
+        if replica_dsn is None:
+            raise RuntimeError("APP__DATABASE__REPLICA_HOST is not configured")
+
+        map_all_tables()
+        engine = create_database_engine(
+            database, replica_dsn.get_secret_value(), "replica"
+        )
+        try:
+            yield ReplicaEngine(engine)
+        finally:
+            await engine.dispose()
+
     @provide(scope=Scope.REQUEST)
     async def get_session(
         self, engine: AsyncEngine
@@ -48,31 +168,271 @@ class DatabaseProvider(Provider):
                 await session.rollback()
                 raise
 
+    @provide(scope=Scope.REQUEST)
+    async def get_replica_session(
+        self, engine: ReplicaEngine
+    ) -> AsyncIterable[ReplicaSession]:
+        async with AsyncSession(
+            bind=engine, expire_on_commit=False, autoflush=False
+        ) as session:
+            yield ReplicaSession(session)
+
 
 class QueueProvider(Provider):
     @provide(scope=Scope.APP)
-    async def get_queue(self) -> AsyncIterable[TaskQueue]:
+    async def get_broker_queue(
+        self, task_settings: TasksConfig
+    ) -> AsyncIterable[TaskiqTaskQueue]:
+        from task_service.presentation.taskiq.kicker import kiq_many
         from task_service.presentation.taskiq.tasks import process_task_job
 
-        async def enqueue_task(task_id: int) -> object:
-            return await process_task_job.kiq(task_id)
+        async def enqueue_task(task_id: int, priority: TaskPriority) -> object:
+            return (
+                await process_task_job.kicker()
+                .with_labels(queue_name=task_settings.queue_name_for(priority))
+                .kiq(task_id, priority)
+            )
+
+        async def enqueue_tasks(
+            task_ids: Sequence[int], priority: TaskPriority
+        ) -> None:
+            await kiq_many(
+                process_task_job,
+                [(task_id, priority) for task_id in task_ids],
+                labels={"queue_name": task_settings.queue_name_for(priority)},
+            )
+
+        queue = TaskiqTaskQueue(
+            enqueue_fn=enqueue_task,
+            enqueue_many_fn=enqueue_tasks,
+            max_batch_size=task_settings.enqueue_batch_size,
+            flush_window_seconds=(
+                task_settings.enqueue_flush_window_seconds
+                if task_settings.enqueue_coalescing
+                else None
+            ),
+        )
+        try:
+            yield queue
+        finally:
+            await queue.close()
+
+    @provide(scope=Scope.REQUEST)
+    def get_outbox(self, session: AsyncSession) -> SqlAlchemyTaskOutbox:
+        return SqlAlchemyTaskOutbox(session)
+
+    @provide(scope=Scope.REQUEST)
+    def get_task_outbox(self, outbox: SqlAlchemyTaskOutbox) -> TaskOutbox:
+        return outbox
+
+    @provide(scope=Scope.REQUEST)
+    async def get_queue(
+        self,
+        task_settings: TasksConfig,
+        session: AsyncSession,
+        request_container: AsyncContainer,
+    ) -> TaskQueue:
+        if task_settings.queue_backend == "postgres":
+            return PostgresTaskQueue(session, task_settings.notify_channel)
+        if task_settings.dispatch_mode == "outbox":
+            return await request_container.get(SqlAlchemyTaskOutbox)
+        return await request_container.get(TaskiqTaskQueue)
+
+
+class CacheProvider(Provider):
+    @provide(scope=Scope.APP)
+    async def get_redis(self, redis_settings: RedisConfig) -> AsyncIterable[Redis]:
+        redis = Redis.from_url(redis_settings.dsn.get_secret_value())
+        try:
+            yield redis
+        finally:
+            await redis.aclose()
+
+    @provide(scope=Scope.APP)
+    def get_task_cache(self, cache_settings: CacheConfig, redis: Redis) -> TaskCache:
+        remote: TaskCache | None = None
+        if cache_settings.use_redis:
+            remote = RedisTaskCache(
+                redis,
+                key_prefix=cache_settings.key_prefix,
+                active_ttl_seconds=cache_settings.active_ttl_seconds,
+            )
+        local = LruTaskCache(
+            max_size=cache_settings.local_max_size,
+            active_ttl_seconds=cache_settings.active_ttl_seconds,
+        )
+        return TieredTaskCache(local, remote)
+
+    @provide(scope=Scope.APP)
+    def get_idempotency_key_cache(
+        self, cache_settings: CacheConfig
+    ) -> IdempotencyKeyCache:
+        return LruIdempotencyKeyCache(max_size=cache_settings.idempotency_keys_max_size)
+
+
+class EventsProvider(Provider):
+    @provide(scope=Scope.APP)
+    def get_task_event_publisher(
+        self, events_settings: EventsConfig, redis: Redis, engine: AsyncEngine
+    ) -> TaskEventPublisher:
+        if events_settings.backend == "postgres":
+            return PostgresTaskEventPublisher(engine, events_settings.channel)
+        return RedisTaskEventPublisher(redis, events_settings.channel)
+
+    @provide(scope=Scope.APP)
+    async def get_task_event_stream(
+        self, events_settings: EventsConfig, redis: Redis, database: DatabaseConfig
+    ) -> AsyncIterable[TaskEventStream]:
+        source: TaskEventSource
+        if events_settings.backend == "postgres":
+            source = PostgresTaskEventSource(
+                database.pure_dsn.get_secret_value(), events_settings.channel
+            )
+        else:
+            source = RedisTaskEventSource(redis, events_settings.channel)
 
-        queue = TaskiqTaskQueue(enqueue_fn=enqueue_task)
-        yield queue
+        hub = TaskEventHub(source)
+        try:
+            yield hub
+        finally:
+            await hub.close()
 
 
 class AppProvider(Provider):
     scope = Scope.REQUEST
 
-    use_cases = provide_all(
-        TaskCommandUseCase,
-        TaskQueryUseCase,
-        scope=Scope.REQUEST,
-    )
+    @provide(scope=Scope.REQUEST)
+    async def get_task_query_use_case(
+        self,
+        tasks: TaskRepository,
+        cache: TaskCache,
+        cache_settings: CacheConfig,
+        database: DatabaseConfig,
+        request_container: AsyncContainer,
+    ) -> TaskQueryUseCase:
+        replica: TaskRepository | None = None
+        if database.replica_dsn is not None:
+            session = await request_container.get(ReplicaSession)
+            replica = create_task_repository(session, database)
+        return TaskQueryUseCase(
+            tasks=tasks,
+            cache=cache if cache_settings.enabled else None,
+            replica=replica,
+        )
 
     @provide(scope=Scope.REQUEST)
-    def get_task_repository(self, session: AsyncSession) -> TaskRepository:
-        return SqlAlchemyTaskRepository(session)
+    def get_task_watch_use_case(
+        self,
+        tasks: TaskRepository,
+        tx: TransactionManager,
+        events: TaskEventStream,
+    ) -> TaskWatchUseCase:
+        return TaskWatchUseCase(tasks=tasks, tx=tx, events=events)
+
+    @provide(scope=Scope.APP)
+    def get_task_metrics(self) -> TaskMetrics:
+        return PrometheusTaskMetrics()
+
+    @provide(scope=Scope.APP)
+    async def get_task_handlers(
+        self, task_settings: TasksConfig
+    ) -> AsyncIterable[TaskHandlerRegistry]:
+        thread_pool = ThreadPoolExecutor(
+            max_workers=task_settings.handler_thread_pool_size,
+            thread_name_prefix="task-handler",
+        )
+        process_pool = ProcessPoolExecutor(
+            max_workers=task_settings.handler_process_pool_size,
+            mp_context=get_context("spawn"),
+        )
+        try:
+            handlers = TaskHandlerRegistry(
+                thread_pool=thread_pool, process_pool=process_pool
+            )
+            register_task_handlers(handlers, task_settings)
+            yield handlers
+        finally:
+            # Draining running handlers must not stall the event loop.
+            await asyncio.to_thread(thread_pool.shutdown)
+            await asyncio.to_thread(process_pool.shutdown)
+
+    @provide(scope=Scope.REQUEST)
+    def get_task_command_use_case(
+        self,
+        tasks: TaskRepository,
+        tx: TransactionManager,
+        queue: TaskQueue,
+        handlers: TaskHandlerRegistry,
+        recent_keys: IdempotencyKeyCache,
+        cache_settings: CacheConfig,
+    ) -> TaskCommandUseCase:
+        return TaskCommandUseCase(
+            tasks=tasks,
+            tx=tx,
+            queue=queue,
+            handlers=handlers,
+            recent_keys=recent_keys if cache_settings.enabled else None,
+        )
+
+    @provide(scope=Scope.REQUEST)
+    def get_task_repository(
+        self, session: AsyncSession, database: DatabaseConfig
+    ) -> TaskRepository:
+        return create_task_repository(session, database)
+
+    @provide(scope=Scope.APP)
+    async def get_completion_aggregator(
+        self,
+        engine: AsyncEngine,
+        database: DatabaseConfig,
+        task_settings: TasksConfig,
+    ) -> AsyncIterable[TaskCompletionAggregator]:
+        @asynccontextmanager
+        async def unit_of_work() -> AsyncIterator[
+            tuple[TaskRepository, TransactionManager]
+        ]:
+            async with AsyncSession(
+                bind=engine, expire_on_commit=False, autoflush=False
+            ) as session:
+                yield create_task_repository(session, database), session
+
+        aggregator = TaskCompletionAggregator(
+            unit_of_work,
+            max_batch_size=task_settings.completion_batch_size,
+            flush_window_seconds=task_settings.completion_flush_window_seconds,
+        )
+        try:
+            yield aggregator
+        finally:
+            await aggregator.close()
+
+    @provide(scope=Scope.REQUEST)
+    def get_outbox_relay_use_case(
+        self,
+        outbox: TaskOutbox,
+        tx: TransactionManager,
+        broker_queue: TaskiqTaskQueue,
+    ) -> OutboxRelayUseCase:
+        return OutboxRelayUseCase(outbox=outbox, tx=tx, queue=broker_queue)
+
+    @provide(scope=Scope.REQUEST)
+    def get_lease_reaper_use_case(
+        self, tasks: TaskRepository, tx: TransactionManager, queue: TaskQueue
+    ) -> LeaseReaperUseCase:
+        return LeaseReaperUseCase(tasks=tasks, tx=tx, queue=queue)
+
+    @provide(scope=Scope.REQUEST)
+    def get_task_archival_use_case(
+        self,
+        tasks: TaskRepository,
+        tx: TransactionManager,
+        task_settings: TasksConfig,
+    ) -> TaskArchivalUseCase:
+        return TaskArchivalUseCase(
+            tasks=tasks,
+            tx=tx,
+            retention=timedelta(hours=task_settings.archive_retention_hours),
+        )
 
     @provide(scope=Scope.REQUEST)
     def get_task_processing_use_case(
@@ -80,9 +440,21 @@ class AppProvider(Provider):
         tasks: TaskRepository,
         tx: TransactionManager,
         task_settings: TasksConfig,
+        handlers: TaskHandlerRegistry,
+        aggregator: TaskCompletionAggregator,
+        cache: TaskCache,
+        cache_settings: CacheConfig,
+        events: TaskEventPublisher,
+        metrics: TaskMetrics,
     ) -> TaskProcessingUseCase:
         return TaskProcessingUseCase(
             tasks=tasks,
             tx=tx,
-            processing_delay_seconds=task_settings.processing_delay_seconds,
+            handlers=handlers,
+            completer=aggregator if task_settings.group_commit else None,
+            cache=cache if cache_settings.enabled else None,
+            events=events,
+            metrics=metrics,
+            lease_seconds=task_settings.lease_seconds,
+            heartbeat_seconds=task_settings.heartbeat_interval_seconds,
         )
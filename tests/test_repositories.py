@@ -0,0 +1,904 @@
+import asyncio
+import os
+import signal
+import socket
+import subprocess
+import sys
+import unittest
+from contextlib import suppress
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import httpx
+from prometheus_client import REGISTRY
+from redis.asyncio import Redis
+from sqlalchemy import event, func, make_url, select, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from taskiq import TaskiqMessage, TaskiqMiddleware
+from taskiq.exceptions import SendTaskError
+from taskiq_redis import ListQueueBroker
+
+from task_service.adapters.cache import RedisTaskCache
+from task_service.adapters.db import (
+    SqlAlchemyCoreTaskRepository,
+    SqlAlchemyTaskOutbox,
+    SqlAlchemyTaskRepository,
+    create_engine_from_url,
+    create_session_factory,
+    mapping_registry,
+    tasks_table,
+)
+from task_service.adapters.queue import PostgresTaskQueue
+from task_service.domain import Task, TaskPriority, TaskStatus
+from task_service.ports import TaskClaim, TaskCompletion, TaskCursor, TaskTimeFilter
+from task_service.presentation.taskiq.kicker import kiq_many
+
+DATABASE_URL = os.environ.get("TEST_DATABASE_URL", "sqlite+aiosqlite://")
+REDIS_URL = os.environ.get("TEST_REDIS_URL")
+
+
+class SqlAlchemyTaskRepositoryTests(unittest.IsolatedAsyncioTestCase):
+    repository_class: type[SqlAlchemyTaskRepository] = SqlAlchemyTaskRepository
+
+    async def asyncSetUp(self) -> None:
+        self.engine = create_async_engine(DATABASE_URL)
+        self.session_factory = create_session_factory(self.engine)
+        async with self.engine.begin() as connection:
+            await connection.run_sync(mapping_registry.metadata.drop_all)
+            await connection.run_sync(mapping_registry.metadata.create_all)
+
+        self.session: AsyncSession = self.session_factory()
+        self.repository = self.repository_class(self.session)
+
+    async def asyncTearDown(self) -> None:
+        await self.session.close()
+        await self.engine.dispose()
+
+    async def test_add_many_returns_rows_in_input_order(self) -> None:
+        created = await self.repository.add_many(
+            [Task.create(title) for title in ("first", "second", "third")]
+        )
+        await self.session.commit()
+
+        self.assertEqual([task.title for task in created], ["first", "second", "third"])
+        self.assertEqual(len({task.id for task in created}), 3)
+        self.assertTrue(all(task.status == TaskStatus.NEW for task in created))
+        self.assertEqual(await self.repository.get(created[1].id), created[1])
+
+    async def test_list_after_breaks_created_at_ties_by_id(self) -> None:
+        created_at = datetime(2026, 1, 1, tzinfo=UTC)
+        tasks = [Task.create(f"task {index}") for index in range(5)]
+        for task in tasks:
+            task.created_at = created_at
+        created = await self.repository.add_many(tasks)
+        await self.session.commit()
+
+        first = await self.repository.list_after(status=None, cursor=None, size=2)
+        rest = await self.repository.list_after(
+            status=None,
+            cursor=TaskCursor(created_at=created_at, id=first[-1].id),
+            size=10,
+        )
+
+        self.assertEqual(
+            [task.id for task in first + rest],
+            sorted((task.id for task in created), reverse=True),
+        )
+
+    async def test_time_filters_bound_rows_and_total(self) -> None:
+        start = datetime(2026, 1, 1, tzinfo=UTC)
+        tasks = [Task.create(f"task {hour}") for hour in range(6)]
+        for hour, task in enumerate(tasks):
+            task.created_at = start + timedelta(hours=hour)
+            task.updated_at = start + timedelta(hours=hour * 2)
+        await self.repository.add_many(tasks)
+        await self.session.commit()
+
+        period = TaskTimeFilter(
+            created_after=start + timedelta(hours=1),
+            created_before=start + timedelta(hours=5),
+            updated_after=start + timedelta(hours=4),
+        )
+        items, total = await self.repository.list(
+            status=TaskStatus.NEW, page=1, size=1, period=period
+        )
+        rest = await self.repository.list_after(
+            status=None,
+            cursor=TaskCursor(created_at=items[0].created_at, id=items[0].id),
+            size=10,
+            period=period,
+        )
+
+        self.assertEqual(total, 2)
+        self.assertEqual([task.title for task in items + rest], ["task 4", "task 3"])
+
+    async def test_status_counters_follow_state_changes(self) -> None:
+        await self.repository.add(Task.create("single"))
+        await self.repository.flush_counts()
+        await self.session.flush()
+        created = await self.repository.add_many(
+            [Task.create(title) for title in ("aa", "bbb", "cccc")]
+        )
+        await self.repository.flush_counts()
+        await self.session.commit()
+
+        for task in created:
+            await self.repository.claim_for_processing(task.id)
+        await self.repository.complete(
+            created[0].id, attempt=1, status=TaskStatus.DONE, result="success"
+        )
+        await self.repository.complete(
+            created[1].id, attempt=1, status=TaskStatus.FAILED, result="error"
+        )
+        await self.repository.claim_for_processing(created[0].id)
+        await self.session.commit()
+
+        for status in TaskStatus:
+            exact = await self.session.scalar(
+                select(func.count())
+                .select_from(tasks_table)
+                .where(tasks_table.c.status == status)
+            )
+            self.assertEqual(await self.repository.count(status=status), exact)
+        self.assertEqual(await self.repository.count(status=None), 4)
+
+    async def test_status_counters_roll_back_with_transaction(self) -> None:
+        await self.repository.add_many([Task.create("kept")])
+        await self.repository.flush_counts()
+        await self.session.commit()
+
+        await self.repository.add_many([Task.create("dropped")])
+        await self.repository.flush_counts()
+        await self.session.rollback()
+
+        _, total = await self.repository.list(status=None, page=1, size=10)
+        self.assertEqual(total, 1)
+
+    async def test_outbox_take_drains_in_insertion_order(self) -> None:
+        outbox = SqlAlchemyTaskOutbox(self.session)
+        await outbox.enqueue_many([5, 3, 9])
+        await outbox.enqueue(1, TaskPriority.HIGH)
+        await self.session.commit()
+
+        self.assertEqual(await outbox.take(3), {TaskPriority.NORMAL: [5, 3, 9]})
+        await self.session.rollback()
+        self.assertEqual(
+            await outbox.take(10),
+            {TaskPriority.NORMAL: [5, 3, 9], TaskPriority.HIGH: [1]},
+        )
+        await self.session.commit()
+        self.assertEqual(await outbox.take(10), {})
+
+    async def test_claim_batch_skips_claimed_and_locked_rows(self) -> None:
+        created = await self.repository.add_many(
+            [Task.create(f"task {index}") for index in range(5)]
+        )
+        await self.repository.flush_counts()
+        await self.repository.claim_for_processing(created[0].id)
+        await self.session.commit()
+
+        claimed = await self.repository.claim_batch(3)
+        await self.session.commit()
+        rest = await self.repository.claim_batch(3)
+        await self.session.commit()
+
+        self.assertEqual(
+            [task.id for task in claimed], [task.id for task in created[1:4]]
+        )
+        self.assertEqual([task.id for task in rest], [created[4].id])
+        self.assertTrue(
+            all(task.status == TaskStatus.PROCESSING for task in claimed + rest)
+        )
+        self.assertEqual(await self.repository.count(status=TaskStatus.PROCESSING), 5)
+        self.assertEqual(await self.repository.count(status=TaskStatus.NEW), 0)
+
+    async def test_complete_many_applies_status_guard_per_row(self) -> None:
+        created = await self.repository.add_many(
+            [Task.create(f"task {index}") for index in range(3)]
+        )
+        await self.repository.flush_counts()
+        await self.repository.claim_for_processing(created[0].id)
+        await self.repository.claim_for_processing(created[1].id)
+        await self.session.commit()
+
+        completed = await self.repository.complete_many(
+            [
+                TaskCompletion(created[0].id, 1, TaskStatus.DONE, "success"),
+                TaskCompletion(created[1].id, 1, TaskStatus.FAILED, "error"),
+                TaskCompletion(created[2].id, 1, TaskStatus.DONE, "success"),
+            ]
+        )
+        await self.session.commit()
+
+        by_id = {task.id: task for task in completed}
+        self.assertEqual(set(by_id), {created[0].id, created[1].id})
+        self.assertEqual(by_id[created[0].id].status, TaskStatus.DONE)
+        self.assertEqual(by_id[created[1].id].result, "error")
+        self.assertEqual(await self.repository.count(status=TaskStatus.NEW), 1)
+        self.assertEqual(await self.repository.count(status=TaskStatus.PROCESSING), 0)
+        self.assertEqual(await self.repository.count(status=TaskStatus.DONE), 1)
+
+    async def test_expired_leases_are_reclaimed_and_live_ones_extended(self) -> None:
+        created = await self.repository.add_many(
+            [Task.create(f"task {index}") for index in range(4)]
+        )
+        await self.repository.flush_counts()
+        expired = await self.repository.claim_batch(2, lease=timedelta(seconds=-1))
+        await self.session.commit()
+        live = await self.repository.claim_for_processing(
+            created[2].id, lease=timedelta(seconds=60)
+        )
+        await self.session.commit()
+        self.assertIsNotNone(live.lease_expires_at)
+        await self.repository.complete(
+            expired[1].id, attempt=1, status=TaskStatus.DONE, result="success"
+        )
+        await self.session.commit()
+
+        held = await self.repository.extend_leases(
+            [TaskClaim(task.id, 1) for task in created], timedelta(seconds=120)
+        )
+        reclaimed = await self.repository.reclaim_expired(10)
+        await self.session.commit()
+
+        self.assertEqual(held, [created[0].id, created[2].id])
+        self.assertEqual([task.id for task in reclaimed], [])
+
+        await self.repository.extend_leases(
+            [TaskClaim(created[0].id, 1)], timedelta(seconds=-1)
+        )
+        reclaimed = await self.repository.reclaim_expired(10)
+        await self.session.commit()
+
+        self.assertEqual([task.id for task in reclaimed], [created[0].id])
+        self.assertEqual(reclaimed[0].status, TaskStatus.NEW)
+        self.assertIsNone(reclaimed[0].lease_expires_at)
+        self.assertIsNone((await self.repository.get(created[1].id)).lease_expires_at)
+        self.assertEqual(await self.repository.count(status=TaskStatus.NEW), 2)
+        self.assertEqual(await self.repository.count(status=TaskStatus.PROCESSING), 1)
+
+    async def test_stale_claim_cannot_extend_or_complete_a_reclaimed_task(
+        self,
+    ) -> None:
+        created = await self.repository.add(Task.create("report"))
+        await self.session.commit()
+        stale = await self.repository.claim_for_processing(
+            created.id, lease=timedelta(seconds=-1)
+        )
+        await self.session.commit()
+        stale_claim = TaskClaim(stale.id, stale.attempt)
+
+        reclaimed = await self.repository.reclaim_expired(10)
+        await self.session.commit()
+        current = await self.repository.claim_for_processing(
+            created.id, lease=timedelta(seconds=60)
+        )
+        await self.session.commit()
+        self.assertEqual([task.id for task in reclaimed], [created.id])
+        self.assertEqual((stale_claim.attempt, current.attempt), (1, 2))
+
+        held = await self.repository.extend_leases([stale_claim], timedelta(hours=1))
+        late = await self.repository.complete(
+            created.id,
+            attempt=stale_claim.attempt,
+            status=TaskStatus.FAILED,
+            result="x",
+        )
+        stale_batch = await self.repository.complete_many(
+            [TaskCompletion(created.id, stale_claim.attempt, TaskStatus.FAILED, "x")]
+        )
+        await self.session.commit()
+
+        self.assertEqual(held, [])
+        self.assertIsNone(late)
+        self.assertEqual(stale_batch, [])
+        finished = await self.repository.complete(
+            created.id, attempt=2, status=TaskStatus.DONE, result="success"
+        )
+        await self.session.commit()
+        self.assertEqual(
+            (finished.status, finished.result), (TaskStatus.DONE, "success")
+        )
+
+    @unittest.skipUnless(DATABASE_URL.startswith("postgresql"), "needs row locks")
+    async def test_add_idempotent_inserts_each_key_once(self) -> None:
+        first = await self.repository.add_idempotent(
+            Task.create("report", idempotency_key="k-1")
+        )
+        await self.repository.flush_counts()
+        await self.session.commit()
+        duplicate = await self.repository.add_idempotent(
+            Task.create("report", idempotency_key="k-1")
+        )
+        await self.repository.flush_counts()
+        await self.session.commit()
+
+        self.assertIsNotNone(first.id)
+        self.assertIsNone(duplicate)
+        found = await self.repository.get_by_idempotency_key("k-1")
+        self.assertEqual((found.id, found.idempotency_key), (first.id, "k-1"))
+        self.assertIsNone(await self.repository.get_by_idempotency_key("k-2"))
+        self.assertEqual(await self.repository.count(status=TaskStatus.NEW), 1)
+
+    async def test_archived_idempotency_keys_stay_taken(self) -> None:
+        first = await self.repository.add_idempotent(
+            Task.create("report", idempotency_key="k-1")
+        )
+        await self.repository.flush_counts()
+        await self.session.commit()
+        await self.repository.claim_for_processing(first.id)
+        await self.repository.complete(
+            first.id, attempt=1, status=TaskStatus.DONE, result="success"
+        )
+        await self.session.commit()
+        await self.repository.archive_finished(datetime.now(UTC) + timedelta(1), 10)
+        await self.session.commit()
+        self.session.expire_all()
+
+        duplicate = await self.repository.add_idempotent(
+            Task.create("report", idempotency_key="k-1")
+        )
+        await self.session.commit()
+
+        self.assertIsNone(duplicate)
+        found = await self.repository.get_by_idempotency_key("k-1")
+        self.assertEqual((found.id, found.status), (first.id, TaskStatus.DONE))
+        self.assertEqual(await self.repository.count(status=None), 1)
+
+    async def test_archive_moves_old_finished_tasks_in_batches(self) -> None:
+        created = await self.repository.add_many(
+            [Task.create(f"task {index}") for index in range(5)]
+        )
+        await self.repository.flush_counts()
+        await self.session.commit()
+        ids = [task.id for task in created]
+        cursor = TaskCursor(created[3].created_at, ids[3])
+        for task in created[:4]:
+            await self.repository.claim_for_processing(task.id)
+            await self.repository.complete(
+                task.id, attempt=1, status=TaskStatus.DONE, result="success"
+            )
+        await self.session.commit()
+        old = datetime.now(UTC) - timedelta(days=30)
+        await self.session.execute(
+            tasks_table.update()
+            .where(tasks_table.c.id.in_(ids[:3]))
+            .values(updated_at=old)
+        )
+        await self.session.commit()
+
+        cutoff = datetime.now(UTC) - timedelta(days=7)
+        moved = [await self.repository.archive_finished(cutoff, 2) for _ in range(3)]
+        await self.session.commit()
+        self.session.expire_all()
+
+        self.assertEqual(moved, [2, 1, 0])
+        self.assertIsNone(await self.repository.get(ids[0]))
+        archived = await self.repository.get_archived(ids[0])
+        self.assertEqual((archived.title, archived.status), ("task 0", TaskStatus.DONE))
+        self.assertIsNone(await self.repository.get_archived(ids[3]))
+
+        hot, hot_total = await self.repository.list(status=None, page=1, size=10)
+        both, total = await self.repository.list(
+            status=None, page=1, size=10, include_archive=True
+        )
+        self.assertEqual([task.id for task in hot], ids[3:][::-1])
+        self.assertEqual([task.id for task in both], ids[::-1])
+        # Status counters keep counting archived tasks.
+        self.assertEqual((hot_total, total), (5, 5))
+        since = TaskTimeFilter(created_after=datetime.now(UTC) - timedelta(hours=1))
+        self.assertEqual(await self.repository.count(status=None, period=since), 2)
+        self.assertEqual(
+            await self.repository.count(
+                status=TaskStatus.DONE, period=since, include_archive=True
+            ),
+            4,
+        )
+        page = await self.repository.list_after(
+            status=TaskStatus.DONE,
+            cursor=cursor,
+            size=2,
+            include_archive=True,
+        )
+        self.assertEqual([task.id for task in page], [ids[2], ids[1]])
+
+    async def test_get_many_reads_hot_and_archived_tasks(self) -> None:
+        created = await self.repository.add_many(
+            [Task.create(f"task {index}") for index in range(3)]
+        )
+        await self.session.commit()
+        ids = [task.id for task in created]
+        await self.repository.claim_for_processing(ids[0])
+        await self.repository.complete(
+            ids[0], attempt=1, status=TaskStatus.DONE, result="ok"
+        )
+        await self.session.commit()
+        await self.repository.archive_finished(datetime.now(UTC), 10)
+        await self.session.commit()
+
+        hot = await self.repository.get_many([ids[0], ids[1], 999_999])
+        both = await self.repository.get_many(
+            [ids[0], ids[1], ids[2], 999_999], include_archive=True
+        )
+
+        self.assertEqual([task.id for task in hot], [ids[1]])
+        self.assertEqual(
+            {task.id: task.status for task in both},
+            {
+                ids[0]: TaskStatus.DONE,
+                ids[1]: TaskStatus.NEW,
+                ids[2]: TaskStatus.NEW,
+            },
+        )
+        self.assertEqual(await self.repository.get_many([]), [])
+
+    async def test_claim_batch_filters_by_priority(self) -> None:
+        created = await self.repository.add_many(
+            [
+                Task.create("low", priority=TaskPriority.LOW),
+                Task.create("high", priority=TaskPriority.HIGH),
+                Task.create("normal"),
+                Task.create("high again", priority=TaskPriority.HIGH),
+            ]
+        )
+        await self.session.commit()
+
+        high = await self.repository.claim_batch(5, priority=TaskPriority.HIGH)
+        await self.session.commit()
+        rest = await self.repository.claim_batch(5)
+        await self.session.commit()
+
+        self.assertEqual([task.id for task in high], [created[1].id, created[3].id])
+        self.assertEqual([task.title for task in rest], ["low", "normal"])
+        self.assertEqual(
+            (await self.repository.get(created[0].id)).priority, TaskPriority.LOW
+        )
+
+    async def test_concurrent_claim_batches_do_not_overlap(self) -> None:
+        await self.repository.add_many(
+            [Task.create(f"task {index}") for index in range(4)]
+        )
+        await self.session.commit()
+
+        async with self.session_factory() as other_session:
+            first = await self.repository.claim_batch(3)
+            # The second claim may queue behind the first on a counter shard,
+            # so let the first transaction finish while it is in flight.
+            second_claim = asyncio.create_task(
+                self.repository_class(other_session).claim_batch(3)
+            )
+            await asyncio.sleep(0.1)
+            await self.session.commit()
+            second = await second_claim
+            await other_session.commit()
+
+        self.assertEqual(len(first), 3)
+        self.assertEqual(len(second), 1)
+        self.assertFalse({task.id for task in first} & {task.id for task in second})
+
+
+class SqlAlchemyCoreTaskRepositoryTests(SqlAlchemyTaskRepositoryTests):
+    repository_class = SqlAlchemyCoreTaskRepository
+
+    async def test_complete_returns_fresh_row(self) -> None:
+        created = await self.repository.add(Task.create("fresh"))
+        await self.session.commit()
+
+        claimed = await self.repository.claim_for_processing(created.id)
+        completed = await self.repository.complete(
+            created.id, attempt=1, status=TaskStatus.FAILED, result="error"
+        )
+        await self.session.commit()
+
+        self.assertEqual(claimed.status, TaskStatus.PROCESSING)
+        self.assertEqual(completed.status, TaskStatus.FAILED)
+        self.assertEqual(completed.result, "error")
+        self.assertIsNone(
+            await self.repository.complete(
+                created.id, attempt=1, status=TaskStatus.DONE, result="success"
+            )
+        )
+
+
+@unittest.skipUnless(DATABASE_URL.startswith("postgresql"), "needs LISTEN/NOTIFY")
+class PostgresTaskQueueTests(unittest.IsolatedAsyncioTestCase):
+    async def test_notification_is_delivered_on_commit(self) -> None:
+        engine = create_async_engine(DATABASE_URL)
+        received: asyncio.Queue[str] = asyncio.Queue()
+        async with engine.connect() as listener:
+            raw = await listener.get_raw_connection()
+            await raw.driver_connection.add_listener(
+                "tasks_test", lambda *args: received.put_nowait(args[2])
+            )
+
+            async with create_session_factory(engine)() as session:
+                await PostgresTaskQueue(session, "tasks_test").enqueue_many([1, 2])
+                await asyncio.sleep(0.1)
+                self.assertTrue(received.empty())
+                await session.commit()
+
+            await asyncio.wait_for(received.get(), timeout=1)
+        await engine.dispose()
+
+
+class QueryMetricsTests(unittest.IsolatedAsyncioTestCase):
+    async def test_statements_are_timed_per_operation(self) -> None:
+        engine = create_engine_from_url(DATABASE_URL, name="query_test")
+        labels = {"pool": "query_test", "operation": "SELECT"}
+        before = REGISTRY.get_sample_value(
+            "task_db_query_duration_seconds_count", labels
+        )
+
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+            await connection.execute(text("  select 2"))
+        await engine.dispose()
+
+        self.assertEqual(
+            REGISTRY.get_sample_value("task_db_query_duration_seconds_count", labels)
+            - (before or 0),
+            2,
+        )
+
+
+@unittest.skipUnless(DATABASE_URL.startswith("postgresql"), "needs a queue pool")
+class PoolMetricsTests(unittest.IsolatedAsyncioTestCase):
+    def _sample(self, name: str) -> float:
+        return REGISTRY.get_sample_value(name, {"pool": "pool_test"}) or 0.0
+
+    async def test_saturated_pool_reports_usage_and_timeouts(self) -> None:
+        engine = create_engine_from_url(
+            DATABASE_URL,
+            name="pool_test",
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.05,
+            statement_cache_size=0,
+        )
+        timeouts = self._sample("task_db_pool_checkout_timeouts_total")
+        checkouts = self._sample("task_db_pool_checkout_seconds_count")
+
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+            self.assertEqual(self._sample("task_db_pool_connections_in_use"), 1)
+            with self.assertRaises(PoolTimeoutError):
+                async with engine.connect():
+                    pass
+        await engine.dispose()
+
+        self.assertEqual(self._sample("task_db_pool_capacity"), 1)
+        self.assertEqual(self._sample("task_db_pool_connections_in_use"), 0)
+        self.assertEqual(
+            self._sample("task_db_pool_checkout_timeouts_total"), timeouts + 1
+        )
+        self.assertEqual(
+            self._sample("task_db_pool_checkout_seconds_count"), checkouts + 2
+        )
+
+
+def free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+@unittest.skipUnless(DATABASE_URL.startswith("postgresql"), "needs LISTEN/NOTIFY")
+class PostgresWorkerMetricsTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        engine = create_async_engine(DATABASE_URL)
+        async with engine.begin() as connection:
+            await connection.run_sync(mapping_registry.metadata.drop_all)
+            await connection.run_sync(mapping_registry.metadata.create_all)
+        await engine.dispose()
+
+    async def test_worker_serves_its_metrics_on_the_sidecar_port(self) -> None:
+        url = make_url(DATABASE_URL)
+        port = free_port()
+        env = {
+            key: value
+            for key, value in os.environ.items()
+            if key != "PROMETHEUS_MULTIPROC_DIR"
+        } | {
+            "PYTHONPATH": os.pathsep.join(sys.path),
+            "APP__DATABASE__HOST": url.host or "localhost",
+            "APP__DATABASE__PORT": str(url.port or 5432),
+            "APP__DATABASE__USER": url.username or "",
+            "APP__DATABASE__PASSWORD": url.password or "",
+            "APP__DATABASE__DATABASE": url.database or "",
+            "APP__TASKS__QUEUE_BACKEND": "postgres",
+            "APP__TASKS__WORKER_METRICS_PORT": str(port),
+        }
+        worker = subprocess.Popen(
+            [sys.executable, "-m", "task_service.presentation.postgres_worker"],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        body = ""
+        try:
+            async with httpx.AsyncClient() as client:
+                for _ in range(100):
+                    with suppress(httpx.TransportError):
+                        response = await client.get(f"http://127.0.0.1:{port}/")
+                        body = response.text
+                        # The first claim query is enough to prove the worker's
+                        # own observations reach the sidecar.
+                        if "task_db_query_duration_seconds_count{" in body:
+                            break
+                    await asyncio.sleep(0.1)
+        finally:
+            worker.send_signal(signal.SIGTERM)
+            _, stderr = worker.communicate(timeout=10)
+
+        self.assertIn("task_db_query_duration_seconds_count{", body, stderr.decode())
+        self.assertEqual(worker.returncode, 0, stderr.decode())
+
+
+@unittest.skipUnless(DATABASE_URL.startswith("postgresql"), "needs EXPLAIN")
+class TaskListPlanTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.engine = create_async_engine(DATABASE_URL)
+        async with self.engine.begin() as connection:
+            await connection.run_sync(mapping_registry.metadata.drop_all)
+            await connection.run_sync(mapping_registry.metadata.create_all)
+            await connection.execute(
+                text(
+                    "INSERT INTO tasks "
+                    "(title, status, created_at, updated_at, lease_expires_at) "
+                    "SELECT 'task ' || g, CASE WHEN g % 50 = 0 THEN 'new' "
+                    "WHEN g % 50 = 1 THEN 'processing' "
+                    "WHEN g % 5 = 0 THEN 'failed' ELSE 'done' END, "
+                    "now() - g * interval '1 second', "
+                    "now() - g * interval '1 second', "
+                    "CASE WHEN g % 50 = 1 THEN "
+                    "now() + (25000 - g) * interval '1 second' END "
+                    "FROM generate_series(1, 50000) AS g"
+                )
+            )
+        async with self.engine.connect() as connection:
+            await connection.execute(text("ANALYZE tasks"))
+
+        self.statements: list[tuple[str, Any]] = []
+        event.listen(self.engine.sync_engine, "before_cursor_execute", self._capture)
+
+    async def asyncTearDown(self) -> None:
+        await self.engine.dispose()
+
+    def _capture(self, *args: Any) -> None:
+        _, _, statement, parameters, _, _ = args
+        if statement.lstrip().startswith(("SELECT", "WITH")) and "tasks" in statement:
+            self.statements.append((statement, parameters))
+
+    async def _plan(self, statement: str, parameters: Any) -> list[dict[str, Any]]:
+        async with self.engine.connect() as connection:
+            result = await connection.exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {statement}", parameters
+            )
+            plan = result.scalar_one()[0]["Plan"]
+
+        nodes: list[dict[str, Any]] = []
+        pending = [plan]
+        while pending:
+            node = pending.pop()
+            nodes.append(node)
+            pending.extend(node.get("Plans", []))
+        return nodes
+
+    async def _plan_nodes(self, statement: str, parameters: Any) -> list[str]:
+        return [node["Node Type"] for node in await self._plan(statement, parameters)]
+
+    async def test_list_queries_walk_an_index_instead_of_sorting(self) -> None:
+        since = datetime.now(UTC) - timedelta(hours=2)
+        for repository_class in (
+            SqlAlchemyTaskRepository,
+            SqlAlchemyCoreTaskRepository,
+        ):
+            async with create_session_factory(self.engine)() as session:
+                repository = repository_class(session)
+                for status in (*TaskStatus, None):
+                    await repository.list(status=status, page=3, size=20)
+                    await repository.list_after(
+                        status=status,
+                        cursor=None,
+                        size=20,
+                        period=TaskTimeFilter(created_after=since),
+                    )
+
+        self.assertEqual(len(self.statements), 20)
+        for statement, parameters in self.statements:
+            with self.subTest(statement=statement, parameters=parameters):
+                nodes = await self._plan_nodes(statement, parameters)
+                self.assertNotIn("Sort", nodes)
+                self.assertNotIn("Seq Scan", nodes)
+
+    async def _seed_archive(self) -> None:
+        async with self.engine.begin() as connection:
+            await connection.execute(
+                text(
+                    "INSERT INTO tasks_archive (id, title, status, created_at, "
+                    "updated_at, task_type, priority) "
+                    "SELECT 100000 + g, 'archived ' || g, "
+                    "CASE WHEN g % 5 = 0 THEN 'failed' ELSE 'done' END, "
+                    "now() - interval '30 days' - g * interval '1 second', "
+                    "now() - interval '30 days' - g * interval '1 second', "
+                    "'default', 'normal' FROM generate_series(1, 50000) AS g"
+                )
+            )
+        async with self.engine.connect() as connection:
+            await connection.execute(text("ANALYZE tasks_archive"))
+
+    async def test_archive_reads_merge_two_index_scans(self) -> None:
+        await self._seed_archive()
+
+        since = datetime.now(UTC) - timedelta(days=60)
+        async with create_session_factory(self.engine)() as session:
+            repository = SqlAlchemyCoreTaskRepository(session)
+            for status in (TaskStatus.DONE, TaskStatus.FAILED, None):
+                await repository.list(
+                    status=status, page=3, size=20, include_archive=True
+                )
+                await repository.list_after(
+                    status=status,
+                    cursor=None,
+                    size=20,
+                    period=TaskTimeFilter(created_after=since),
+                    include_archive=True,
+                )
+
+        self.assertEqual(len(self.statements), 6)
+        for statement, parameters in self.statements:
+            with self.subTest(statement=statement, parameters=parameters):
+                nodes = await self._plan_nodes(statement, parameters)
+                self.assertIn("Merge Append", nodes)
+                self.assertNotIn("Sort", nodes)
+                self.assertNotIn("Seq Scan", nodes)
+
+    async def test_get_many_probes_both_primary_keys(self) -> None:
+        await self._seed_archive()
+
+        async with create_session_factory(self.engine)() as session:
+            await SqlAlchemyCoreTaskRepository(session).get_many(
+                list(range(1, 500, 7)), include_archive=True
+            )
+
+        self.assertEqual(len(self.statements), 1)
+        nodes = await self._plan(*self.statements[0])
+        self.assertLessEqual(
+            {"tasks_pkey", "tasks_archive_pkey"},
+            {node.get("Index Name") for node in nodes},
+        )
+        self.assertNotIn("Seq Scan", {node["Node Type"] for node in nodes})
+
+    async def test_lease_sweep_reads_the_partial_lease_index(self) -> None:
+        async with create_session_factory(self.engine)() as session:
+            repository = SqlAlchemyCoreTaskRepository(session)
+            await repository.reclaim_expired(500)
+            await repository.extend_leases(
+                [TaskClaim(task_id, 1) for task_id in (1, 2, 3)],
+                timedelta(seconds=60),
+            )
+            await session.rollback()
+
+        self.assertEqual(len(self.statements), 1)
+        nodes = await self._plan(*self.statements[0])
+        self.assertIn(
+            "ix_tasks_processing_lease_expires_at",
+            {node.get("Index Name") for node in nodes},
+        )
+        self.assertNotIn("Seq Scan", {node["Node Type"] for node in nodes})
+
+
+@unittest.skipUnless(REDIS_URL, "needs TEST_REDIS_URL")
+class RedisTaskCacheTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.redis = Redis.from_url(REDIS_URL)
+        self.cache = RedisTaskCache(
+            self.redis, key_prefix="task_cache_test", active_ttl_seconds=5
+        )
+        await self.redis.delete("task_cache_test:1")
+
+    async def asyncTearDown(self) -> None:
+        await self.redis.delete("task_cache_test:1")
+        await self.redis.aclose()
+
+    async def test_terminal_task_round_trips_without_expiry(self) -> None:
+        task = Task(
+            id=1,
+            title="report",
+            task_type="default",
+            status=TaskStatus.DONE,
+            result="success",
+        )
+
+        await self.cache.put_many([task])
+        cached = await self.cache.get(1)
+
+        self.assertEqual(
+            (cached.id, cached.title, cached.status, cached.result, cached.created_at),
+            (task.id, task.title, task.status, task.result, task.created_at),
+        )
+        self.assertEqual(await self.redis.pttl("task_cache_test:1"), -1)
+
+    async def test_active_task_expires_and_never_replaces_terminal(self) -> None:
+        await self.cache.put_many([Task(id=1, title="t", status=TaskStatus.NEW)])
+        self.assertGreater(await self.redis.pttl("task_cache_test:1"), 0)
+
+        await self.cache.put_many([Task(id=1, title="t", status=TaskStatus.FAILED)])
+        await self.cache.put_many([Task(id=1, title="t", status=TaskStatus.PROCESSING)])
+
+        self.assertEqual((await self.cache.get(1)).status, TaskStatus.FAILED)
+
+
+class RecordingMiddleware(TaskiqMiddleware):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[tuple[str, Any]] = []
+
+    def pre_send(self, message: TaskiqMessage) -> TaskiqMessage:
+        self.calls.append(("pre_send", message.args[0]))
+        return message
+
+    def post_send(self, message: TaskiqMessage) -> None:
+        self.calls.append(("post_send", message.args[0]))
+
+
+async def echo_job(value: int, label: str) -> str:
+    return f"{value} {label}"
+
+
+@unittest.skipUnless(REDIS_URL, "needs TEST_REDIS_URL")
+class KiqManyTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.middleware = RecordingMiddleware()
+        self.broker = ListQueueBroker(
+            REDIS_URL, queue_name="kiq_many_test"
+        ).with_middlewares(self.middleware)
+        self.task = self.broker.register_task(echo_job, task_name="kiq_many_test")
+        self.redis = Redis.from_url(REDIS_URL)
+        await self.redis.delete("kiq_many_test", "kiq_many_test.high")
+
+    async def asyncTearDown(self) -> None:
+        await self.redis.delete("kiq_many_test", "kiq_many_test.high")
+        await self.redis.aclose()
+        await self.broker.shutdown()
+
+    async def test_pipelined_messages_match_what_kiq_sends(self) -> None:
+        labels = {"queue_name": "kiq_many_test.high"}
+        await self.task.kicker().with_labels(**labels).kiq(1, "high")
+        await kiq_many(self.task, [(2, "high"), (3, "high")], labels=labels)
+
+        raw = await self.redis.lrange("kiq_many_test.high", 0, -1)
+        messages = [self.broker.formatter.loads(item) for item in reversed(raw)]
+
+        self.assertEqual(
+            [(message.task_name, message.labels, message.args) for message in messages],
+            [("kiq_many_test", labels, [value, "high"]) for value in (1, 2, 3)],
+        )
+        self.assertEqual(len({message.task_id for message in messages}), 3)
+        self.assertEqual(await self.redis.llen("kiq_many_test"), 0)
+        self.assertEqual(
+            self.middleware.calls,
+            [
+                ("pre_send", 1),
+                ("post_send", 1),
+                ("pre_send", 2),
+                ("pre_send", 3),
+                ("post_send", 2),
+                ("post_send", 3),
+            ],
+        )
+
+    async def test_failed_push_raises_send_task_error(self) -> None:
+        middleware = RecordingMiddleware()
+        broker = ListQueueBroker("redis://127.0.0.1:1").with_middlewares(middleware)
+        task = broker.register_task(echo_job, task_name="kiq_many_test")
+
+        with self.assertRaises(SendTaskError):
+            await kiq_many(task, [(1, "normal")])
+        self.assertEqual(middleware.calls, [("pre_send", 1)])
+        await broker.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
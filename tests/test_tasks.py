@@ -1,19 +1,95 @@
+import asyncio
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
 import unittest
 from collections import deque
-from dataclasses import dataclass
-from datetime import UTC, datetime
+from collections.abc import AsyncIterator, Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime, timedelta
+from multiprocessing import get_context
+from typing import Any
 
-from task_service.app import TaskCommandUseCase, TaskProcessingUseCase, TaskQueryUseCase
-from task_service.domain import Task, TaskStatus
-from task_service.ports import TaskQueue, TaskRepository, TransactionManager
+import httpx
+from dishka import Provider, Scope, make_async_container
+from fastapi import FastAPI
+from prometheus_client import REGISTRY
+from sqlalchemy.exc import OperationalError
+from taskiq import TaskiqMessage, TaskiqResult
+
+from task_service.adapters.cache import (
+    LruIdempotencyKeyCache,
+    LruTaskCache,
+    TieredTaskCache,
+)
+from task_service.adapters.config import Settings, TasksConfig
+from task_service.adapters.events import TaskEventHub
+from task_service.adapters.queue import TaskiqTaskQueue
+from task_service.app import (
+    IdempotencyKeyReusedError,
+    InvalidCursorError,
+    InvalidTaskBatchError,
+    LeaseReaperUseCase,
+    OutboxRelayUseCase,
+    QueueUnavailableError,
+    TaskArchivalUseCase,
+    TaskCommandUseCase,
+    TaskCompletionAggregator,
+    TaskHandlerRegistry,
+    TaskProcessingUseCase,
+    TaskQueryUseCase,
+    TaskWatchUseCase,
+    UnknownTaskTypeError,
+    simulated_task_handler,
+    weighted_rotation,
+)
+from task_service.domain import DEFAULT_TASK_TYPE, Task, TaskPriority, TaskStatus
+from task_service.ports import (
+    TaskClaim,
+    TaskCompletion,
+    TaskCursor,
+    TaskEventPublisher,
+    TaskMetrics,
+    TaskOutbox,
+    TaskQueue,
+    TaskRepository,
+    TaskTimeFilter,
+    TransactionManager,
+)
+from task_service.presentation.api.metrics import RequestMetricsMiddleware
+from task_service.presentation.api.schemas import (
+    TASK_LIST_INCLUDE,
+    TaskListResponse,
+    TaskResponse,
+    task_list_adapter,
+)
+from task_service.presentation.relay import relay_outbox
+from task_service.presentation.taskiq.middlewares import WorkerSlotsMiddleware
+from task_service.setup import close_container, create_container
 
 
 class InMemoryQueue(TaskQueue):
     def __init__(self) -> None:
         self._items: deque[int] = deque()
+        self.priorities: dict[int, TaskPriority] = {}
+
+    async def enqueue(
+        self, task_id: int, priority: TaskPriority = TaskPriority.NORMAL
+    ) -> None:
+        await self.enqueue_many([task_id], priority)
 
-    async def enqueue(self, task_id: int) -> None:
-        self._items.append(task_id)
+    async def enqueue_many(
+        self, task_ids: Sequence[int], priority: TaskPriority = TaskPriority.NORMAL
+    ) -> None:
+        self._items.extend(task_ids)
+        self.priorities.update(dict.fromkeys(task_ids, priority))
 
     async def pop(self) -> int | None:
         if not self._items:
@@ -21,7 +97,58 @@ class InMemoryQueue(TaskQueue):
         return self._items.popleft()
 
 
+class FailingQueue(TaskQueue):
+    async def enqueue(
+        self, task_id: int, priority: TaskPriority = TaskPriority.NORMAL
+    ) -> None:
+        raise ConnectionError("redis is down")
+
+    async def enqueue_many(
+        self, task_ids: Sequence[int], priority: TaskPriority = TaskPriority.NORMAL
+    ) -> None:
+        raise ConnectionError("redis is down")
+
+
+class InMemoryOutbox(TaskQueue, TaskOutbox):
+    def __init__(self) -> None:
+        self._items: deque[tuple[int, TaskPriority]] = deque()
+
+    async def enqueue(
+        self, task_id: int, priority: TaskPriority = TaskPriority.NORMAL
+    ) -> None:
+        self._items.append((task_id, priority))
+
+    async def enqueue_many(
+        self, task_ids: Sequence[int], priority: TaskPriority = TaskPriority.NORMAL
+    ) -> None:
+        self._items.extend((task_id, priority) for task_id in task_ids)
+
+    async def take(self, limit: int) -> dict[TaskPriority, list[int]]:
+        taken: dict[TaskPriority, list[int]] = {}
+        for _ in range(min(limit, len(self._items))):
+            task_id, priority = self._items.popleft()
+            taken.setdefault(priority, []).append(task_id)
+        return taken
+
+
+class FlakyOutbox(InMemoryOutbox):
+    def __init__(self) -> None:
+        super().__init__()
+        self.failures = 1
+
+    async def take(self, limit: int) -> dict[TaskPriority, list[int]]:
+        if self.failures:
+            self.failures -= 1
+            raise OperationalError(
+                "SELECT ... FOR UPDATE SKIP LOCKED", {}, ConnectionResetError()
+            )
+        return await super().take(limit)
+
+
 class InMemoryTransactionManager(TransactionManager):
+    def __init__(self) -> None:
+        self.rollbacks = 0
+
     async def commit(self) -> None:
         return None
 
@@ -29,13 +156,63 @@ class InMemoryTransactionManager(TransactionManager):
         return None
 
     async def rollback(self) -> None:
-        return None
+        self.rollbacks += 1
+
+
+def _matches(
+    task: Task, status: TaskStatus | None, period: TaskTimeFilter | None
+) -> bool:
+    if status is not None and task.status != status:
+        return False
+    if period is None:
+        return True
+    return (
+        (period.created_after is None or task.created_at > period.created_after)
+        and (period.created_before is None or task.created_at < period.created_before)
+        and (period.updated_after is None or task.updated_at > period.updated_after)
+    )
+
+
+class LoopbackTaskEvents(TaskEventPublisher):
+    def __init__(self) -> None:
+        self._deliver: Callable[[Task], None] | None = None
+
+    async def listen(self, deliver: Callable[[Task], None]) -> None:
+        self._deliver = deliver
+        await asyncio.Future()
+
+    async def publish_many(self, tasks: Sequence[Task]) -> None:
+        if self._deliver is not None:
+            for task in tasks:
+                self._deliver(replace(task))
+
+
+class RecordingTaskMetrics(TaskMetrics):
+    def __init__(self) -> None:
+        self.queue_waits: list[tuple[str, TaskPriority, float]] = []
+        self.processing: list[tuple[str, TaskStatus, float]] = []
+
+    def observe_queue_wait(
+        self, task_type: str, priority: TaskPriority, seconds: float
+    ) -> None:
+        self.queue_waits.append((task_type, priority, seconds))
+
+    def observe_processing(
+        self, task_type: str, status: TaskStatus, seconds: float
+    ) -> None:
+        self.processing.append((task_type, status, seconds))
 
 
 class InMemoryTaskRepository(TaskRepository):
     def __init__(self) -> None:
         self._seq = 0
         self._items: dict[int, Task] = {}
+        self._archive: dict[int, Task] = {}
+        self.complete_many_calls = 0
+        self.get_calls = 0
+        self.counts_flushed = 0
+        self.key_lookups = 0
+        self.extended_leases: list[list[int]] = []
 
     async def add(self, task: Task) -> Task:
         self._seq += 1
@@ -43,47 +220,234 @@ class InMemoryTaskRepository(TaskRepository):
         self._items[task.id] = task
         return task
 
+    async def add_many(self, tasks: Sequence[Task]) -> list[Task]:
+        return [await self.add(task) for task in tasks]
+
+    async def flush_counts(self) -> None:
+        self.counts_flushed += 1
+
+    async def add_idempotent(self, task: Task) -> Task | None:
+        if task.idempotency_key is not None and any(
+            item.idempotency_key == task.idempotency_key
+            for item in [*self._items.values(), *self._archive.values()]
+        ):
+            return None
+        return await self.add(task)
+
+    async def get_by_idempotency_key(self, key: str) -> Task | None:
+        self.key_lookups += 1
+        for task in [*self._items.values(), *self._archive.values()]:
+            if task.idempotency_key == key:
+                return replace(task)
+        return None
+
+    async def claim_batch(
+        self,
+        limit: int,
+        *,
+        lease: timedelta | None = None,
+        priority: TaskPriority | None = None,
+    ) -> list[Task]:
+        ready = [
+            task
+            for task in self._items.values()
+            if task.status == TaskStatus.NEW
+            and (priority is None or task.priority == priority)
+        ]
+        return [
+            claimed
+            for task in ready[:limit]
+            if task.id is not None
+            and (claimed := await self.claim_for_processing(task.id, lease=lease))
+            is not None
+        ]
+
+    async def extend_leases(
+        self, claims: Sequence[TaskClaim], lease: timedelta
+    ) -> list[int]:
+        self.extended_leases.append([claim.task_id for claim in claims])
+        held = [
+            task
+            for claim in claims
+            if (task := self._items.get(claim.task_id)) is not None
+            and task.status == TaskStatus.PROCESSING
+            and task.attempt == claim.attempt
+        ]
+        for task in held:
+            task.lease_expires_at = datetime.now(UTC) + lease
+        return [task.id for task in held if task.id is not None]
+
+    async def reclaim_expired(self, limit: int) -> list[Task]:
+        now = datetime.now(UTC)
+        expired = [
+            task
+            for task in self._items.values()
+            if task.status == TaskStatus.PROCESSING
+            and task.lease_expires_at is not None
+            and task.lease_expires_at < now
+        ][:limit]
+        for task in expired:
+            task.status = TaskStatus.NEW
+            task.updated_at = now
+            task.lease_expires_at = None
+        return expired
+
+    async def complete_many(self, completions: Sequence[TaskCompletion]) -> list[Task]:
+        self.complete_many_calls += 1
+        completed = [
+            await self.complete(
+                item.task_id,
+                attempt=item.attempt,
+                status=item.status,
+                result=item.result,
+            )
+            for item in completions
+        ]
+        return [task for task in completed if task is not None]
+
     async def get(self, task_id: int) -> Task | None:
-        return self._items.get(task_id)
+        self.get_calls += 1
+        task = self._items.get(task_id)
+        return replace(task) if task is not None else None
+
+    async def get_many(
+        self, task_ids: Sequence[int], *, include_archive: bool = False
+    ) -> list[Task]:
+        self.get_calls += 1
+        stores = [self._items, self._archive] if include_archive else [self._items]
+        return [
+            replace(store[task_id])
+            for task_id in task_ids
+            for store in stores
+            if task_id in store
+        ]
+
+    async def get_archived(self, task_id: int) -> Task | None:
+        self.get_calls += 1
+        task = self._archive.get(task_id)
+        return replace(task) if task is not None else None
+
+    async def archive_finished(self, before: datetime, limit: int) -> int:
+        finished = [
+            task
+            for task in self._items.values()
+            if task.status.is_terminal and task.updated_at < before
+        ]
+        for task in sorted(finished, key=lambda task: task.updated_at)[:limit]:
+            if task.id is not None:
+                self._archive[task.id] = self._items.pop(task.id)
+        return min(len(finished), limit)
+
+    async def list_after(
+        self,
+        *,
+        status: TaskStatus | None,
+        cursor: TaskCursor | None,
+        size: int,
+        period: TaskTimeFilter | None = None,
+        include_archive: bool = False,
+    ) -> list[Task]:
+        items, _ = await self.list(
+            status=status,
+            page=1,
+            size=len(self._items) + len(self._archive),
+            period=period,
+            include_archive=include_archive,
+        )
+        if cursor is not None:
+            items = [
+                item
+                for item in items
+                if (item.created_at, item.id) < (cursor.created_at, cursor.id)
+            ]
+        return items[:size]
 
     async def list(
-        self, *, status: TaskStatus | None, page: int, size: int
+        self,
+        *,
+        status: TaskStatus | None,
+        page: int,
+        size: int,
+        estimate_total: bool = False,
+        period: TaskTimeFilter | None = None,
+        include_archive: bool = False,
     ) -> tuple[list[Task], int]:
-        items = list(self._items.values())
-        if status is not None:
-            items = [item for item in items if item.status == status]
-
-        items = sorted(items, key=lambda task: task.created_at, reverse=True)
+        source = list(self._items.values())
+        if include_archive:
+            source.extend(self._archive.values())
+        items = [item for item in source if _matches(item, status, period)]
+        items = sorted(items, key=lambda task: (task.created_at, task.id), reverse=True)
         total = len(items)
         offset = (page - 1) * size
         return items[offset : offset + size], total
 
-    async def claim_for_processing(self, task_id: int) -> Task | None:
+    async def count(
+        self,
+        *,
+        status: TaskStatus | None,
+        estimated: bool = False,
+        period: TaskTimeFilter | None = None,
+        include_archive: bool = False,
+    ) -> int:
+        source = list(self._items.values())
+        if include_archive:
+            source.extend(self._archive.values())
+        return sum(1 for item in source if _matches(item, status, period))
+
+    async def claim_for_processing(
+        self, task_id: int, *, lease: timedelta | None = None
+    ) -> Task | None:
         task = self._items.get(task_id)
         if task is None or task.status != TaskStatus.NEW:
             return None
         task.status = TaskStatus.PROCESSING
         task.updated_at = datetime.now(UTC)
-        return task
+        task.lease_expires_at = task.updated_at + lease if lease is not None else None
+        task.attempt += 1
+        return replace(task)
 
     async def complete(
-        self, task_id: int, *, status: TaskStatus, result: str
+        self, task_id: int, *, attempt: int, status: TaskStatus, result: str
     ) -> Task | None:
         task = self._items.get(task_id)
-        if task is None or task.status != TaskStatus.PROCESSING:
+        if (
+            task is None
+            or task.status != TaskStatus.PROCESSING
+            or task.attempt != attempt
+        ):
             return None
         task.status = status
         task.result = result
         task.updated_at = datetime.now(UTC)
+        task.lease_expires_at = None
         return task
 
 
 @dataclass(slots=True)
 class ServicesBundle:
     queue: InMemoryQueue
+    tx: InMemoryTransactionManager
+    repository: InMemoryTaskRepository
     commands: TaskCommandUseCase
     queries: TaskQueryUseCase
     processing: TaskProcessingUseCase
+    handlers: TaskHandlerRegistry
+
+
+def checksum_title(title: str) -> tuple[TaskStatus, str]:
+    digest = title.encode()
+    for _ in range(200_000):
+        digest = hashlib.sha256(digest).digest()
+    return TaskStatus.DONE, digest.hex()
+
+
+def slow_title(title: str) -> tuple[TaskStatus, str]:
+    time.sleep(0.3)
+    return TaskStatus.DONE, title
+
+
+def current_thread_name(_: str) -> tuple[TaskStatus, str]:
+    return TaskStatus.DONE, threading.current_thread().name
 
 
 class TaskServiceTests(unittest.IsolatedAsyncioTestCase):
@@ -92,19 +456,27 @@ class TaskServiceTests(unittest.IsolatedAsyncioTestCase):
         tx = InMemoryTransactionManager()
         repository = InMemoryTaskRepository()
 
-        commands = TaskCommandUseCase(tasks=repository, tx=tx, queue=queue)
+        handlers = TaskHandlerRegistry()
+        handlers.register(DEFAULT_TASK_TYPE, simulated_task_handler(0))
+
+        commands = TaskCommandUseCase(
+            tasks=repository, tx=tx, queue=queue, handlers=handlers
+        )
         queries = TaskQueryUseCase(tasks=repository)
         processing = TaskProcessingUseCase(
             tasks=repository,
             tx=tx,
-            processing_delay_seconds=0,
+            handlers=handlers,
         )
 
         self.services = ServicesBundle(
             queue=queue,
+            tx=tx,
+            repository=repository,
             commands=commands,
             queries=queries,
             processing=processing,
+            handlers=handlers,
         )
 
     async def test_create_task(self) -> None:
@@ -114,6 +486,373 @@ class TaskServiceTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(task.status, TaskStatus.NEW)
         self.assertEqual(await self.services.queue.pop(), task.id)
 
+    async def test_create_tasks_batch(self) -> None:
+        tasks = await self.services.commands.create_tasks(["a", "bb", "ccc"])
+
+        self.assertEqual([task.title for task in tasks], ["a", "bb", "ccc"])
+        self.assertEqual(
+            [await self.services.queue.pop() for _ in tasks],
+            [task.id for task in tasks],
+        )
+
+    async def test_create_tasks_batch_reports_invalid_items(self) -> None:
+        with self.assertRaises(InvalidTaskBatchError) as ctx:
+            await self.services.commands.create_tasks(["ok", "  ", "fine", ""])
+
+        self.assertEqual(set(ctx.exception.errors), {1, 3})
+        self.assertIsNone(await self.services.queue.pop())
+
+    async def test_create_task_rejects_unknown_type(self) -> None:
+        with self.assertRaises(UnknownTaskTypeError):
+            await self.services.commands.create_task("report", "no-such-type")
+
+        with self.assertRaises(InvalidTaskBatchError) as ctx:
+            await self.services.commands.create_tasks(
+                ["a", "b"], [DEFAULT_TASK_TYPE, "no-such-type"]
+            )
+
+        self.assertEqual(set(ctx.exception.errors), {1})
+        self.assertIsNone(await self.services.queue.pop())
+
+    async def test_retried_create_returns_original_without_enqueueing(self) -> None:
+        commands = TaskCommandUseCase(
+            tasks=self.services.repository,
+            tx=self.services.tx,
+            queue=self.services.queue,
+            recent_keys=LruIdempotencyKeyCache(max_size=10),
+        )
+        created = await commands.create_task("report", idempotency_key="k-1")
+        self.assertEqual(await self.services.queue.pop(), created.id)
+        # First attempts go straight to the insert.
+        self.assertEqual(self.services.repository.key_lookups, 0)
+
+        # Same process: answered from the recent-keys cache.
+        self.assertIs(
+            await commands.create_task("report", idempotency_key="k-1"), created
+        )
+        # Another process: answered from the unique column.
+        replayed = await self.services.commands.create_task(
+            "report", idempotency_key="k-1"
+        )
+        self.assertEqual(replayed.id, created.id)
+        self.assertEqual(self.services.repository.key_lookups, 1)
+        self.assertIsNone(await self.services.queue.pop())
+        self.assertEqual(await self.services.repository.count(status=None), 1)
+
+        with self.assertRaises(IdempotencyKeyReusedError):
+            await commands.create_task("other report", idempotency_key="k-1")
+
+    async def test_thread_handler_runs_outside_event_loop_thread(self) -> None:
+        with ThreadPoolExecutor(thread_name_prefix="handler") as thread_pool:
+            handlers = TaskHandlerRegistry(thread_pool=thread_pool)
+            handlers.register("whoami", current_thread_name, mode="thread")
+            processing = TaskProcessingUseCase(
+                tasks=self.services.repository, tx=self.services.tx, handlers=handlers
+            )
+            created = await self.services.repository.add(
+                Task.create("ab", task_type="whoami")
+            )
+
+            updated = await processing.process_task(created.id)
+
+        self.assertEqual(updated.status, TaskStatus.DONE)
+        self.assertTrue(updated.result.startswith("handler"))
+
+    async def test_process_handler_does_not_block_other_tasks(self) -> None:
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=get_context("spawn")
+        ) as process_pool:
+            handlers = TaskHandlerRegistry(process_pool=process_pool)
+            handlers.register("checksum", checksum_title, mode="process")
+            handlers.register(DEFAULT_TASK_TYPE, simulated_task_handler(0))
+            processing = TaskProcessingUseCase(
+                tasks=self.services.repository, tx=self.services.tx, handlers=handlers
+            )
+            heavy = await self.services.repository.add(
+                Task.create("payload", task_type="checksum")
+            )
+            light = await self.services.repository.add(Task.create("ab"))
+
+            heavy_job = asyncio.create_task(processing.process_task(heavy.id))
+            await asyncio.sleep(0)
+            light_done = await processing.process_task(light.id)
+            heavy_running = not heavy_job.done()
+            heavy_done = await heavy_job
+
+        self.assertEqual(light_done.status, TaskStatus.DONE)
+        self.assertTrue(heavy_running)
+        self.assertEqual(heavy_done.status, TaskStatus.DONE)
+        self.assertEqual(heavy_done.result, checksum_title("payload")[1])
+
+    async def test_task_without_handler_fails(self) -> None:
+        created = await self.services.repository.add(
+            Task.create("ab", task_type="retired")
+        )
+
+        updated = await self.services.processing.process_task(created.id)
+
+        self.assertEqual(updated.status, TaskStatus.FAILED)
+        self.assertEqual(updated.result, "error")
+
+    async def test_get_task_reads_terminal_tasks_from_cache(self) -> None:
+        repository = self.services.repository
+        cache = LruTaskCache(max_size=10, active_ttl_seconds=60)
+        queries = TaskQueryUseCase(tasks=repository, cache=cache)
+        processing = TaskProcessingUseCase(
+            tasks=repository,
+            tx=self.services.tx,
+            handlers=self.services.handlers,
+            cache=cache,
+        )
+        task = await self.services.commands.create_task("abcd")
+
+        self.assertEqual((await queries.get_task(task.id)).status, TaskStatus.NEW)
+        self.assertEqual((await queries.get_task(task.id)).status, TaskStatus.NEW)
+        self.assertEqual(repository.get_calls, 1)
+
+        await processing.process_task(task.id)
+
+        self.assertEqual((await queries.get_task(task.id)).status, TaskStatus.DONE)
+        self.assertEqual(repository.get_calls, 1)
+
+    async def test_reads_go_to_replica_and_fall_back_to_primary(self) -> None:
+        primary = self.services.repository
+        replica = InMemoryTaskRepository()
+        queries = TaskQueryUseCase(tasks=primary, replica=replica)
+        replicated = await self.services.commands.create_task("old")
+        await replica.add(replace(replicated, id=None))
+        fresh = await self.services.commands.create_task("new")
+
+        self.assertEqual((await queries.get_task(replicated.id)).title, "old")
+        self.assertEqual((await queries.get_task(fresh.id)).title, "new")
+        self.assertEqual((replica.get_calls, primary.get_calls), (2, 1))
+
+        _, eventual_total = await queries.list_tasks(status=None, page=1, size=10)
+        _, strong_total = await queries.list_tasks(
+            status=None, page=1, size=10, consistency="strong"
+        )
+        self.assertEqual((eventual_total, strong_total), (1, 2))
+
+    async def test_archived_reads_stay_on_the_replica(self) -> None:
+        primary = self.services.repository
+        replica = InMemoryTaskRepository()
+        queries = TaskQueryUseCase(tasks=primary, replica=replica)
+        task = await self.services.commands.create_task("old")
+        archived = await replica.add(replace(task, id=None, status=TaskStatus.DONE))
+        await replica.archive_finished(datetime.now(UTC) + timedelta(days=1), 10)
+
+        fetched = await queries.get_task(archived.id)
+
+        self.assertEqual((fetched.title, fetched.status), ("old", TaskStatus.DONE))
+        self.assertEqual((replica.get_calls, primary.get_calls), (1, 0))
+
+    async def test_get_tasks_reports_missing_ids_in_request_order(self) -> None:
+        primary = self.services.repository
+        replica = InMemoryTaskRepository()
+        queries = TaskQueryUseCase(tasks=primary, replica=replica)
+        replicated = await self.services.commands.create_task("old")
+        await replica.add(replace(replicated, id=None))
+        fresh = await self.services.commands.create_task("new")
+
+        items, missing = await queries.get_tasks(
+            [fresh.id, 404, replicated.id, fresh.id]
+        )
+
+        self.assertEqual([task.title for task in items], ["new", "old"])
+        self.assertEqual(missing, [404])
+        # One query per side, and the primary only sees what the replica lacked.
+        self.assertEqual((replica.get_calls, primary.get_calls), (1, 1))
+
+    async def test_strong_read_skips_replica_and_cache(self) -> None:
+        primary = self.services.repository
+        replica = InMemoryTaskRepository()
+        cache = LruTaskCache(max_size=10, active_ttl_seconds=60)
+        queries = TaskQueryUseCase(tasks=primary, cache=cache, replica=replica)
+        task = await self.services.commands.create_task("abcd")
+        await cache.put_many([replace(task, status=TaskStatus.PROCESSING)])
+
+        fetched = await queries.get_task(task.id, consistency="strong")
+
+        self.assertEqual(fetched.status, TaskStatus.NEW)
+        self.assertEqual((replica.get_calls, primary.get_calls), (0, 1))
+
+    async def test_get_task_refetches_active_tasks_after_ttl(self) -> None:
+        repository = self.services.repository
+        queries = TaskQueryUseCase(
+            tasks=repository,
+            cache=LruTaskCache(max_size=10, active_ttl_seconds=0.01),
+        )
+        task = await self.services.commands.create_task("abcd")
+
+        await queries.get_task(task.id)
+        await asyncio.sleep(0.02)
+        await queries.get_task(task.id)
+
+        self.assertEqual(repository.get_calls, 2)
+
+    async def test_wait_for_task_returns_when_task_finishes(self) -> None:
+        events = LoopbackTaskEvents()
+        hub = TaskEventHub(events)
+        self.addAsyncCleanup(hub.close)
+        watcher = TaskWatchUseCase(
+            tasks=self.services.repository, tx=self.services.tx, events=hub
+        )
+        processing = TaskProcessingUseCase(
+            tasks=self.services.repository,
+            tx=self.services.tx,
+            handlers=self.services.handlers,
+            events=events,
+        )
+        task = await self.services.commands.create_task("abcd")
+
+        waiting = asyncio.create_task(watcher.wait_for_task(task.id, timeout=5))
+        await asyncio.sleep(0.01)
+        await processing.process_task(task.id)
+        finished = await asyncio.wait_for(waiting, timeout=1)
+
+        self.assertEqual(finished.status, TaskStatus.DONE)
+
+    async def test_wait_for_task_gives_up_after_timeout(self) -> None:
+        hub = TaskEventHub(LoopbackTaskEvents())
+        self.addAsyncCleanup(hub.close)
+        watcher = TaskWatchUseCase(
+            tasks=self.services.repository, tx=self.services.tx, events=hub
+        )
+        task = await self.services.commands.create_task("abcd")
+
+        current = await watcher.wait_for_task(task.id, timeout=0.01)
+
+        self.assertEqual(current.status, TaskStatus.NEW)
+
+    async def test_watch_task_streams_status_changes_until_terminal(self) -> None:
+        events = LoopbackTaskEvents()
+        hub = TaskEventHub(events)
+        self.addAsyncCleanup(hub.close)
+        watcher = TaskWatchUseCase(
+            tasks=self.services.repository, tx=self.services.tx, events=hub
+        )
+        processing = TaskProcessingUseCase(
+            tasks=self.services.repository,
+            tx=self.services.tx,
+            handlers=self.services.handlers,
+            events=events,
+        )
+        task = await self.services.commands.create_task("abc")
+
+        updates = watcher.watch_task(task.id, idle_seconds=0.01)
+        first, idle = await anext(updates), await anext(updates)
+        statuses = [first.status]
+        await processing.process_task(task.id)
+        statuses.extend([update.status async for update in updates if update])
+
+        self.assertIsNone(idle)
+        self.assertEqual(
+            statuses, [TaskStatus.NEW, TaskStatus.PROCESSING, TaskStatus.FAILED]
+        )
+
+    async def test_create_tasks_batch_rolls_back_on_queue_failure(self) -> None:
+        commands = TaskCommandUseCase(
+            tasks=self.services.repository,
+            tx=self.services.tx,
+            queue=FailingQueue(),
+        )
+
+        with self.assertRaises(QueueUnavailableError):
+            await commands.create_tasks(["a", "b"])
+
+        self.assertEqual(self.services.tx.rollbacks, 1)
+        # The counter shard is only touched once the broker has answered.
+        self.assertEqual(self.services.repository.counts_flushed, 0)
+        await self.services.commands.create_tasks(["a", "b"])
+        self.assertEqual(self.services.repository.counts_flushed, 1)
+
+    async def test_list_tasks_by_cursor_walks_all_pages(self) -> None:
+        created = await self.services.commands.create_tasks(
+            [f"task {index}" for index in range(7)]
+        )
+
+        seen: list[int] = []
+        cursor: str | None = ""
+        while cursor is not None:
+            items, cursor = await self.services.queries.list_tasks_after(
+                status=None, cursor=cursor, size=3
+            )
+            seen.extend(item.id for item in items)
+
+        expected = sorted(created, key=lambda task: (task.created_at, task.id))
+        self.assertEqual(seen, [task.id for task in reversed(expected)])
+
+    async def test_list_tasks_by_cursor_rejects_garbage(self) -> None:
+        with self.assertRaises(InvalidCursorError):
+            await self.services.queries.list_tasks_after(
+                status=None, cursor="not a cursor", size=3
+            )
+
+    async def test_outbox_relay_moves_tasks_to_queue_in_batches(self) -> None:
+        outbox = InMemoryOutbox()
+        commands = TaskCommandUseCase(
+            tasks=self.services.repository, tx=self.services.tx, queue=outbox
+        )
+        relay = OutboxRelayUseCase(
+            outbox=outbox, tx=self.services.tx, queue=self.services.queue
+        )
+        created = await commands.create_tasks(
+            ["a", "b", "c"],
+            priorities=[TaskPriority.HIGH, TaskPriority.NORMAL, TaskPriority.HIGH],
+        )
+
+        self.assertIsNone(await self.services.queue.pop())
+        self.assertEqual(await relay.relay_batch(2), 2)
+        self.assertEqual(await relay.relay_batch(2), 1)
+        self.assertEqual(await relay.relay_batch(2), 0)
+        self.assertEqual(
+            sorted([await self.services.queue.pop() for _ in created]),
+            [task.id for task in created],
+        )
+        self.assertEqual(
+            self.services.queue.priorities,
+            {task.id: task.priority for task in created},
+        )
+
+    async def test_outbox_relay_keeps_batch_on_queue_failure(self) -> None:
+        outbox = InMemoryOutbox()
+        await outbox.enqueue(1)
+        relay = OutboxRelayUseCase(
+            outbox=outbox, tx=self.services.tx, queue=FailingQueue()
+        )
+
+        with self.assertRaises(QueueUnavailableError):
+            await relay.relay_batch(10)
+
+        self.assertEqual(self.services.tx.rollbacks, 1)
+
+    async def test_relay_loop_survives_database_errors(self) -> None:
+        outbox = FlakyOutbox()
+        await outbox.enqueue_many([1, 2, 3])
+        relay = OutboxRelayUseCase(
+            outbox=outbox, tx=self.services.tx, queue=self.services.queue
+        )
+        provider = Provider()
+        provider.from_context(provides=OutboxRelayUseCase, scope=Scope.APP)
+        container = make_async_container(provider, context={OutboxRelayUseCase: relay})
+        task_settings = TasksConfig(
+            outbox_batch_size=2, outbox_poll_interval_seconds=0.01
+        )
+        stop = asyncio.Event()
+
+        with self.assertLogs("task_service.presentation.relay", "ERROR"):
+            loop = asyncio.create_task(relay_outbox(container, task_settings, stop))
+            for _ in range(100):
+                if len(self.services.queue.priorities) == 3:
+                    break
+                await asyncio.sleep(0.01)
+            stop.set()
+            await loop
+        await container.close()
+
+        self.assertEqual(outbox.failures, 0)
+        self.assertEqual(sorted(self.services.queue.priorities), [1, 2, 3])
+
     async def test_status_change_after_processing(self) -> None:
         task = await self.services.commands.create_task("abcd")
 
@@ -123,6 +862,175 @@ class TaskServiceTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(updated.status, TaskStatus.DONE)
         self.assertEqual(updated.result, "success")
 
+    async def test_processing_reports_queue_wait_and_processing_time(self) -> None:
+        metrics = RecordingTaskMetrics()
+        processing = TaskProcessingUseCase(
+            tasks=self.services.repository,
+            tx=self.services.tx,
+            handlers=self.services.handlers,
+            metrics=metrics,
+        )
+        task = await self.services.commands.create_task("abcd")
+        task.created_at -= timedelta(seconds=5)
+
+        await processing.process_task(task.id)
+
+        [(task_type, priority, waited)] = metrics.queue_waits
+        self.assertEqual((task_type, priority), ("default", TaskPriority.NORMAL))
+        self.assertGreaterEqual(waited, 5)
+        [(task_type, status, elapsed)] = metrics.processing
+        self.assertEqual((task_type, status), ("default", TaskStatus.DONE))
+        self.assertGreaterEqual(elapsed, 0)
+
+    async def test_process_batch_claims_ready_tasks_once(self) -> None:
+        created = await self.services.commands.create_tasks(["ab", "abc", "abcd"])
+
+        first = await self.services.processing.process_batch(2)
+        second = await self.services.processing.process_batch(2)
+        third = await self.services.processing.process_batch(2)
+
+        self.assertEqual([task.id for task in first], [created[0].id, created[1].id])
+        self.assertEqual([task.id for task in second], [created[2].id])
+        self.assertEqual(third, [])
+        self.assertEqual(
+            [task.status for task in first + second],
+            [TaskStatus.DONE, TaskStatus.FAILED, TaskStatus.DONE],
+        )
+        self.assertEqual(self.services.repository.complete_many_calls, 2)
+
+    async def test_heartbeat_extends_leases_while_handlers_run(self) -> None:
+        repository = self.services.repository
+        handlers = TaskHandlerRegistry()
+        handlers.register(DEFAULT_TASK_TYPE, simulated_task_handler(0.05))
+        processing = TaskProcessingUseCase(
+            tasks=repository,
+            tx=self.services.tx,
+            handlers=handlers,
+            lease_seconds=30,
+            heartbeat_seconds=0.01,
+        )
+        created = await self.services.commands.create_tasks(["ab", "abc"])
+
+        completed = await processing.process_batch(2)
+
+        self.assertEqual([task.id for task in completed], [task.id for task in created])
+        self.assertGreaterEqual(len(repository.extended_leases), 2)
+        self.assertEqual(repository.extended_leases[0], [task.id for task in created])
+        self.assertTrue(all(task.lease_expires_at is None for task in completed))
+
+    async def test_reaper_requeues_tasks_with_expired_leases(self) -> None:
+        repository = self.services.repository
+        created = await self.services.commands.create_tasks(["ab", "abc", "abcd"])
+        for task in created:
+            await self.services.queue.pop()
+        await repository.claim_for_processing(
+            created[0].id, lease=timedelta(seconds=-1)
+        )
+        await repository.claim_for_processing(
+            created[1].id, lease=timedelta(seconds=60)
+        )
+        reaper = LeaseReaperUseCase(
+            tasks=repository, tx=self.services.tx, queue=self.services.queue
+        )
+
+        self.assertEqual(await reaper.reclaim_batch(10), 1)
+        self.assertEqual(await reaper.reclaim_batch(10), 0)
+        self.assertEqual(await self.services.queue.pop(), created[0].id)
+        self.assertIsNone(await self.services.queue.pop())
+        self.assertEqual(
+            [(await repository.get(task.id)).status for task in created],
+            [TaskStatus.NEW, TaskStatus.PROCESSING, TaskStatus.NEW],
+        )
+
+    async def test_archived_tasks_stay_readable_and_listed(self) -> None:
+        repository = self.services.repository
+        created = await self.services.commands.create_tasks(
+            [f"task {index}" for index in range(4)]
+        )
+        for task in created[:3]:
+            await self.services.processing.process_task(task.id)
+        for task in created[:2]:
+            stored = await repository.get(task.id)
+            repository._items[task.id] = replace(
+                stored, updated_at=stored.updated_at - timedelta(days=1)
+            )
+        archival = TaskArchivalUseCase(
+            tasks=repository, tx=self.services.tx, retention=timedelta(hours=1)
+        )
+
+        self.assertEqual(await archival.archive_batch(10), 2)
+        self.assertEqual(await archival.archive_batch(10), 0)
+        self.assertIsNone(await repository.get(created[0].id))
+        archived = await self.services.queries.get_task(created[0].id)
+        self.assertEqual(archived.status, TaskStatus.DONE)
+
+        everything, total = await self.services.queries.list_tasks(
+            status=None, page=1, size=10
+        )
+        fresh, _ = await self.services.queries.list_tasks(
+            status=TaskStatus.NEW, page=1, size=10
+        )
+        self.assertEqual(total, 4)
+        self.assertEqual(
+            [task.id for task in everything], [task.id for task in reversed(created)]
+        )
+        self.assertEqual([task.id for task in fresh], [created[3].id])
+
+    async def test_group_commit_flushes_concurrent_completions_together(self) -> None:
+        repository = self.services.repository
+
+        @asynccontextmanager
+        async def unit_of_work() -> AsyncIterator[
+            tuple[TaskRepository, TransactionManager]
+        ]:
+            yield repository, self.services.tx
+
+        aggregator = TaskCompletionAggregator(
+            unit_of_work, max_batch_size=3, flush_window_seconds=0.01
+        )
+        processing = TaskProcessingUseCase(
+            tasks=repository,
+            tx=self.services.tx,
+            handlers=self.services.handlers,
+            completer=aggregator,
+        )
+        created = await self.services.commands.create_tasks(["ab", "abc", "abcd", "x"])
+
+        updated = await asyncio.gather(
+            *(processing.process_task(task.id) for task in created)
+        )
+        await aggregator.close()
+
+        self.assertEqual([task.id for task in updated], [task.id for task in created])
+        self.assertEqual(
+            [task.status for task in updated],
+            [TaskStatus.DONE, TaskStatus.FAILED, TaskStatus.DONE, TaskStatus.FAILED],
+        )
+        self.assertEqual(repository.complete_many_calls, 2)
+
+    async def test_group_commit_returns_none_when_guard_rejects(self) -> None:
+        repository = self.services.repository
+
+        @asynccontextmanager
+        async def unit_of_work() -> AsyncIterator[
+            tuple[TaskRepository, TransactionManager]
+        ]:
+            yield repository, self.services.tx
+
+        aggregator = TaskCompletionAggregator(
+            unit_of_work, max_batch_size=10, flush_window_seconds=0.001
+        )
+        task = await self.services.commands.create_task("ab")
+
+        result = await aggregator.complete(
+            task.id, attempt=1, status=TaskStatus.DONE, result="ok"
+        )
+
+        self.assertIsNone(result)
+        self.assertEqual(
+            (await self.services.queries.get_task(task.id)).status, TaskStatus.NEW
+        )
+
     async def test_filter_by_status(self) -> None:
         task1 = await self.services.commands.create_task("abcd")
         task2 = await self.services.commands.create_task("abc")
@@ -149,5 +1057,326 @@ class TaskServiceTests(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(all(task.status == TaskStatus.FAILED for task in failed_tasks))
 
 
+class WeightedRotationTests(unittest.TestCase):
+    def test_each_cycle_serves_queues_by_weight_interleaved(self) -> None:
+        rotation = weighted_rotation({"high": 6, "normal": 3, "low": 1})
+
+        first = [order[0] for order in rotation]
+        self.assertEqual(
+            {name: first.count(name) for name in first},
+            {"high": 6, "normal": 3, "low": 1},
+        )
+        # Smooth rather than six highs in a row.
+        self.assertNotIn(["high"] * 4, [first[i : i + 4] for i in range(7)])
+        # Every step still falls through to all other queues.
+        self.assertTrue(
+            all(sorted(order) == ["high", "low", "normal"] for order in rotation)
+        )
+
+
+class WorkerSlotsMiddlewareTests(unittest.TestCase):
+    def test_tracks_busy_slots_and_busy_time(self) -> None:
+        middleware = WorkerSlotsMiddleware(capacity=4)
+        message = TaskiqMessage(
+            task_id="1", task_name="tasks.process", labels={}, args=[1], kwargs={}
+        )
+        result = TaskiqResult(is_err=False, return_value=None, execution_time=0.5)
+        busy_before = REGISTRY.get_sample_value("task_worker_slots_busy")
+        seconds_before = REGISTRY.get_sample_value(
+            "task_worker_slot_busy_seconds_total"
+        )
+
+        middleware.pre_execute(message)
+        middleware.pre_execute(message)
+        busy_during = REGISTRY.get_sample_value("task_worker_slots_busy")
+        middleware.post_execute(message, result)
+        middleware.post_execute(message, result)
+
+        self.assertEqual(busy_during - busy_before, 2)
+        self.assertEqual(
+            REGISTRY.get_sample_value("task_worker_slots_busy"), busy_before
+        )
+        self.assertEqual(
+            REGISTRY.get_sample_value("task_worker_slot_busy_seconds_total")
+            - seconds_before,
+            1.0,
+        )
+
+
+class TaskListSerializationTests(unittest.TestCase):
+    def test_fast_path_matches_response_model(self) -> None:
+        items = [
+            Task(id=1, title="a"),
+            Task(
+                id=2,
+                title="b",
+                status=TaskStatus.PROCESSING,
+                lease_expires_at=datetime.now(UTC),
+                idempotency_key="retry-1",
+            ),
+        ]
+        page = {"page": 1, "size": 2, "total": 5, "next_cursor": "abc"}
+
+        fast = task_list_adapter.dump_json(
+            {"items": items, **page}, include=TASK_LIST_INCLUDE
+        )
+        validated = TaskListResponse.model_validate(
+            {"items": [TaskResponse.model_validate(item) for item in items], **page}
+        ).model_dump_json()
+
+        self.assertEqual(json.loads(fast), json.loads(validated))
+        self.assertEqual(
+            {key for item in json.loads(fast)["items"] for key in item},
+            set(TaskResponse.model_fields),
+        )
+
+
+class RequestMetricsMiddlewareTests(unittest.IsolatedAsyncioTestCase):
+    async def test_labels_requests_by_route_template(self) -> None:
+        app = FastAPI()
+
+        @app.get("/items/{item_id}")
+        async def get_item(item_id: int) -> dict[str, int]:
+            return {"id": item_id}
+
+        app.add_middleware(RequestMetricsMiddleware)
+        labels = {"method": "GET", "route": "/items/{item_id}", "status": "200"}
+        missing = {"method": "GET", "route": "unmatched", "status": "404"}
+        before = REGISTRY.get_sample_value(
+            "task_http_request_duration_seconds_count", labels
+        )
+        missing_before = REGISTRY.get_sample_value(
+            "task_http_request_duration_seconds_count", missing
+        )
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://t"
+        ) as client:
+            for item_id in (1, 2):
+                await client.get(f"/items/{item_id}")
+            await client.get("/elsewhere")
+
+        self.assertEqual(
+            REGISTRY.get_sample_value(
+                "task_http_request_duration_seconds_count", labels
+            )
+            - (before or 0),
+            2,
+        )
+        self.assertEqual(
+            REGISTRY.get_sample_value(
+                "task_http_request_duration_seconds_count", missing
+            )
+            - (missing_before or 0),
+            1,
+        )
+
+
+# Fresh interpreter to the first answered request; see benchmarks/startup.py.
+STARTUP_BUDGET_SECONDS = 3.0
+STARTUP_PROBE = textwrap.dedent(
+    """
+    import asyncio, json, sys, time
+    started = time.perf_counter()
+    import httpx
+    from task_service.main import create_app
+
+    async def first_request():
+        app = create_app()
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+                return (await c.get("/health")).status_code
+
+    status = asyncio.run(first_request())
+    print(json.dumps({
+        "seconds": time.perf_counter() - started,
+        "status": status,
+        "taskiq": "taskiq" in sys.modules,
+    }))
+    """
+)
+
+
+class StartupBudgetTests(unittest.TestCase):
+    def test_web_process_serves_first_request_within_budget(self) -> None:
+        completed = subprocess.run(
+            [sys.executable, "-c", STARTUP_PROBE],
+            capture_output=True,
+            check=True,
+            text=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+        probe = json.loads(completed.stdout)
+
+        self.assertEqual(probe["status"], 200)
+        self.assertFalse(probe["taskiq"], "taskiq must load on the first enqueue")
+        self.assertLess(probe["seconds"], STARTUP_BUDGET_SECONDS)
+
+
+class HandlerPoolShutdownTests(unittest.IsolatedAsyncioTestCase):
+    async def test_container_close_drains_pools_off_the_event_loop(self) -> None:
+        container = create_container(Settings())
+        handlers = await container.get(TaskHandlerRegistry)
+        handlers.register("slow", slow_title, mode="thread")
+        running = asyncio.create_task(
+            handlers.execute(Task(id=1, title="report", task_type="slow"))
+        )
+        await asyncio.sleep(0.05)
+
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(tick())
+        await close_container(container)
+        ticker.cancel()
+
+        self.assertEqual(await running, (TaskStatus.DONE, "report"))
+        self.assertGreater(ticks, 5)
+
+
+class TaskCacheTests(unittest.IsolatedAsyncioTestCase):
+    async def test_lru_evicts_least_recently_used(self) -> None:
+        cache = LruTaskCache(max_size=2, active_ttl_seconds=60)
+        first, second, third = (
+            Task(id=index, title="t", status=TaskStatus.DONE) for index in (1, 2, 3)
+        )
+
+        await cache.put_many([first, second])
+        await cache.get(1)
+        await cache.put_many([third])
+
+        self.assertIs(await cache.get(1), first)
+        self.assertIsNone(await cache.get(2))
+        self.assertIs(await cache.get(3), third)
+
+    async def test_lru_keeps_terminal_entry_over_stale_read(self) -> None:
+        cache = LruTaskCache(max_size=2, active_ttl_seconds=60)
+        done = Task(id=1, title="t", status=TaskStatus.DONE)
+
+        await cache.put_many([done])
+        await cache.put_many([Task(id=1, title="t", status=TaskStatus.PROCESSING)])
+
+        self.assertIs(await cache.get(1), done)
+
+    async def test_tiered_cache_promotes_remote_hits(self) -> None:
+        local = LruTaskCache(max_size=10, active_ttl_seconds=60)
+        remote = LruTaskCache(max_size=10, active_ttl_seconds=60)
+        cache = TieredTaskCache(local, remote)
+        task = Task(id=7, title="t", status=TaskStatus.DONE)
+        await remote.put_many([task])
+        local_hits = REGISTRY.get_sample_value(
+            "task_cache_hits_total", {"tier": "local"}
+        )
+        remote_hits = REGISTRY.get_sample_value(
+            "task_cache_hits_total", {"tier": "remote"}
+        )
+        misses = REGISTRY.get_sample_value("task_cache_misses_total")
+
+        self.assertIs(await cache.get(7), task)
+        self.assertIs(await cache.get(7), task)
+        self.assertIsNone(await cache.get(8))
+
+        self.assertIs(await local.get(7), task)
+        self.assertEqual(
+            REGISTRY.get_sample_value("task_cache_hits_total", {"tier": "local"})
+            - (local_hits or 0),
+            1,
+        )
+        self.assertEqual(
+            REGISTRY.get_sample_value("task_cache_hits_total", {"tier": "remote"})
+            - (remote_hits or 0),
+            1,
+        )
+        self.assertEqual(
+            REGISTRY.get_sample_value("task_cache_misses_total") - misses, 1
+        )
+
+
+class CoalescingTaskQueueTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.single: list[int] = []
+        self.batches: list[tuple[list[int], TaskPriority]] = []
+        self.failing: set[TaskPriority] = set()
+
+    async def enqueue_one(self, task_id: int, priority: TaskPriority) -> None:
+        self.single.append(task_id)
+
+    async def enqueue_batch(
+        self, task_ids: Sequence[int], priority: TaskPriority
+    ) -> None:
+        if priority in self.failing:
+            raise ConnectionError("redis is down")
+        self.batches.append((list(task_ids), priority))
+
+    def queue(self, **options: Any) -> TaskiqTaskQueue:
+        return TaskiqTaskQueue(self.enqueue_one, self.enqueue_batch, **options)
+
+    def timed_enqueues(self) -> dict[str, float]:
+        return {
+            operation: REGISTRY.get_sample_value(
+                "task_enqueue_duration_seconds_count", {"operation": operation}
+            )
+            or 0
+            for operation in ("enqueue", "enqueue_many")
+        }
+
+    async def test_concurrent_enqueues_share_one_push_per_priority(self) -> None:
+        queue = self.queue(flush_window_seconds=0.01)
+        before = self.timed_enqueues()
+
+        await asyncio.gather(
+            queue.enqueue(1),
+            queue.enqueue(2, TaskPriority.HIGH),
+            queue.enqueue(3),
+        )
+
+        self.assertEqual(self.single, [])
+        self.assertEqual(
+            self.batches, [([1, 3], TaskPriority.NORMAL), ([2], TaskPriority.HIGH)]
+        )
+        # Coalesced pushes are timed once, per caller, not again as batches.
+        after = self.timed_enqueues()
+        self.assertEqual(
+            {operation: after[operation] - before[operation] for operation in after},
+            {"enqueue": 3, "enqueue_many": 0},
+        )
+
+    async def test_full_batch_flushes_before_the_window(self) -> None:
+        queue = self.queue(max_batch_size=2, flush_window_seconds=60)
+
+        async with asyncio.timeout(1):
+            await asyncio.gather(queue.enqueue(1), queue.enqueue(2))
+
+        self.assertEqual(self.batches, [([1, 2], TaskPriority.NORMAL)])
+
+    async def test_failed_push_fails_only_its_callers(self) -> None:
+        queue = self.queue(flush_window_seconds=0.01)
+        self.failing.add(TaskPriority.LOW)
+
+        results = await asyncio.gather(
+            queue.enqueue(1),
+            queue.enqueue(2, TaskPriority.LOW),
+            return_exceptions=True,
+        )
+
+        self.assertIsNone(results[0])
+        self.assertIsInstance(results[1], ConnectionError)
+
+    async def test_without_window_each_enqueue_goes_out_alone(self) -> None:
+        queue = self.queue()
+
+        await asyncio.gather(queue.enqueue(1), queue.enqueue(2))
+
+        self.assertEqual(self.single, [1, 2])
+        self.assertEqual(self.batches, [])
+
+
 if __name__ == "__main__":
     unittest.main()